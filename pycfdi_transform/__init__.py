@@ -22,7 +22,18 @@ from __future__ import print_function
 
 from pycfdi_transform.sax.cfdi33.sax_handler import CFDI33SAXHandler
 from pycfdi_transform.sax.cfdi40.sax_handler import CFDI40SAXHandler
+from pycfdi_transform.sax.auto.sax_handler import CFDIAutoSAXHandler, transform_auto
+from pycfdi_transform.batch.batch_transformer import BatchTransformer, transform_many
+from pycfdi_transform.batch.async_transformer import AsyncTransformer, transform_async
+from pycfdi_transform.batch.manifest import Manifest
+from pycfdi_transform.sources.zip_source import ZipSource
+from pycfdi_transform.sources.tar_source import TarSource
+from pycfdi_transform.sources.directory_source import DirectorySource
+from pycfdi_transform.sinks.csv_sink import CsvSink
 from pycfdi_transform.helpers.schema_helper import SchemaHelper
+from pycfdi_transform.helpers.parser_helper import ParserHelper
+from pycfdi_transform.helpers.compression_helper import CompressionHelper
+from pycfdi_transform.helpers.error_helper import ErrorHelper, TransformError
 #formatters
 from pycfdi_transform.formatters.cfdi33.efisco_corp_cfdi33_formatter import EfiscoCorpCFDI33Formatter
 from pycfdi_transform.formatters.nomina12.efisco_nomina12_formatter import EfiscoNomina12Formatter
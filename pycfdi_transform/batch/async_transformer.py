@@ -0,0 +1,142 @@
+from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterable, AsyncIterator, Iterable
+import asyncio
+import os
+import weakref
+from pycfdi_transform.sax.auto.sax_handler import CFDIAutoSAXHandler, transform_auto
+
+class AsyncTransformer:
+    """Class to transform CFDI from asyncio code without blocking the event loop.
+
+    Documents are parsed in a pool of threads sharing a single `CFDIAutoSAXHandler` built from
+    `handler_config`, see `CFDIAutoSAXHandler.from_config`. At most `max_concurrency` documents are
+    sent to the pool at the same time by every event loop, the rest wait in the event loop so cancelled
+    tasks never reach the pool. An instance can be used from several event loops, e.g. successive calls
+    of `asyncio.run`. Use it as an async context manager or call `close` to shutdown the pool.
+
+    Args:
+        workers : int, default: None
+                    Number of threads, if None provided the number of CPUs is used.
+        handler_config : dict, default: None
+                    Configuration of the handler.
+        max_concurrency : int, default: None
+                    Documents transformed at the same time, if None provided the number of workers is used.
+    """
+    def __init__(self, workers:int = None, handler_config:dict = None, max_concurrency:int = None) -> AsyncTransformer:
+        self._workers = workers or os.cpu_count() or 1
+        self._max_concurrency = max_concurrency or self._workers
+        self._handler = CFDIAutoSAXHandler.from_config(handler_config or {})
+        self._executor = ThreadPoolExecutor(self._workers)
+        # Semaphores are bound to the loop that uses them, every loop gets its own
+        self._semaphores = weakref.WeakKeyDictionary()
+
+    async def __aenter__(self) -> AsyncTransformer:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False)
+
+    async def transform(self, source:str|bytes) -> dict:
+        """Transform XML from file path or bytes to dict extracting its data, see `CFDIAutoSAXHandler.transform`.
+
+        Args:
+            source (str | bytes): File path or content of the XML.
+
+        Returns:
+            dict: Dict containing data from CFDI, with key cfdi33 or cfdi40 according to its version.
+        """
+        return await self.__run(self._handler.transform, source)
+
+    async def transform_from_string(self, xml_str:str) -> dict:
+        """Transform XML from string to dict extracting its data, see `CFDIAutoSAXHandler.transform_from_string`.
+
+        Args:
+            xml_str (str): String containing XML.
+
+        Returns:
+            dict: Dict containing data from CFDI, with key cfdi33 or cfdi40 according to its version.
+        """
+        return await self.__run(self._handler.transform_from_string, xml_str)
+
+    async def transform_many(self, sources:Iterable|AsyncIterable, ordered:bool = True) -> AsyncIterator[tuple]:
+        """Transforms many documents, sources are consumed lazily and at most `max_concurrency` are pending.
+        Pending transforms are cancelled if the iteration is stopped.
+
+        Args:
+            sources (Iterable | AsyncIterable): File paths or contents of the XML.
+            ordered (bool, optional): Return the results in the order of the sources, else in completion order. Defaults to True.
+
+        Raises:
+            Exception: The error raised transforming a document, at the position of the document.
+
+        Yields:
+            tuple: Tuples (source, dict) with the data from CFDI.
+        """
+        pending = []
+        try:
+            async for source in self.__iter_sources(sources):
+                if len(pending) >= self._max_concurrency:
+                    yield await self.__next_result(pending, ordered)
+                pending.append((source, asyncio.ensure_future(self.transform(source))))
+            while pending:
+                yield await self.__next_result(pending, ordered)
+        finally:
+            for _, task in pending:
+                task.cancel()
+
+    async def __run(self, function, argument) -> dict:
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self._max_concurrency)
+        await semaphore.acquire()
+        try:
+            future = self._executor.submit(function, argument)
+        except BaseException:
+            semaphore.release()
+            raise
+        # Cancelling the task does not stop a job already running in the pool, the slot is released when the job finishes
+        future.add_done_callback(lambda _: self.__release(loop, semaphore))
+        return await asyncio.wrap_future(future)
+
+    @staticmethod
+    def __release(loop:asyncio.AbstractEventLoop, semaphore:asyncio.Semaphore) -> None:
+        try:
+            loop.call_soon_threadsafe(semaphore.release)
+        except RuntimeError:
+            # The loop is closed, no task is waiting for the slot
+            pass
+
+    @staticmethod
+    async def __iter_sources(sources:Iterable|AsyncIterable) -> AsyncIterator:
+        if hasattr(sources, '__aiter__'):
+            async for source in sources:
+                yield source
+        else:
+            for source in sources:
+                yield source
+
+    @staticmethod
+    async def __next_result(pending:list, ordered:bool) -> tuple:
+        if not ordered:
+            await asyncio.wait([task for _, task in pending], return_when=asyncio.FIRST_COMPLETED)
+            index = next(index for index, (_, task) in enumerate(pending) if task.done())
+        else:
+            index = 0
+        source, task = pending.pop(index)
+        return source, await task
+
+async def transform_async(source:str|bytes) -> dict:
+    """Transform a CFDI 3.3 or 4.0 from file path or bytes with the default configuration in the default executor of the loop.
+
+    Args:
+        source (str | bytes): File path or content of the XML.
+
+    Returns:
+        dict: Dict containing data from CFDI, with key cfdi33 or cfdi40 according to its version.
+    """
+    return await asyncio.get_running_loop().run_in_executor(None, transform_auto, source)
@@ -0,0 +1,183 @@
+from __future__ import annotations
+from concurrent.futures import FIRST_COMPLETED, Executor, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from itertools import islice
+from typing import Iterable, Iterator
+import os
+import time
+from pycfdi_transform.batch.manifest import Manifest
+from pycfdi_transform.helpers.compression_helper import CompressionHelper
+from pycfdi_transform.helpers.error_helper import ErrorHelper
+from pycfdi_transform.sax.auto.sax_handler import CFDIAutoSAXHandler
+
+_worker_handler = None
+_worker_error = None
+
+def _init_worker(handler_config:dict, traceback_logging:tuple) -> None:
+    """Builds the handler of the worker process once, schemas and parsers are reused by every chunk."""
+    global _worker_handler, _worker_error
+    ErrorHelper.set_traceback_logging(*traceback_logging)
+    try:
+        _worker_handler = CFDIAutoSAXHandler.from_config(handler_config or {})
+    except Exception as ex:
+        # An error raised by the initializer breaks the pool without its cause, it is raised by the first chunk instead
+        _worker_error = ErrorHelper.get_error_record(None, ex)
+
+def _transform_with_hash(handler:CFDIAutoSAXHandler, source:str|bytes) -> tuple:
+    """Transforms a document and hashes its content, uncompressed files are read only once for both."""
+    if isinstance(source, (bytes, bytearray)) or CompressionHelper.is_compressed(source):
+        return handler.transform(source), Manifest.get_hash(source)
+    with open(source, 'rb') as file:
+        xml_bytes = file.read()
+    return handler.transform(xml_bytes), Manifest.get_hash(xml_bytes)
+
+def _transform_chunk(chunk:list, handler:CFDIAutoSAXHandler = None, record_errors:bool = False, hashes:bool = False) -> tuple:
+    if handler is None:
+        if _worker_error is not None:
+            raise ErrorHelper.get_exception(_worker_error)
+        handler = _worker_handler
+    start = time.perf_counter()
+    results = []
+    for index, source in chunk:
+        # Sources are file paths or tuples (name, bytes) like the items of ZipSource
+        name, source = source if isinstance(source, tuple) else (source, source)
+        digest = None
+        try:
+            if hashes:
+                cfdi_data, digest = _transform_with_hash(handler, source)
+            else:
+                cfdi_data = handler.transform(source)
+            result = (index, name, cfdi_data, None)
+        except Exception as ex:
+            # Exceptions of lxml can not be pickled, a record is sent to the parent and the error is rebuilt there
+            record = ErrorHelper.get_error_record(name, ex)
+            result = (index, name, record, None) if record_errors else (index, name, None, record)
+        results.append(result + (digest,) if hashes else result)
+    return results, time.perf_counter() - start
+
+class BatchTransformer:
+    """Class to transform many CFDI files in parallel using a pool of processes or threads.
+
+    Every worker process builds its own `CFDIAutoSAXHandler` from `handler_config` when it starts, see
+    `CFDIAutoSAXHandler.from_config`. With threads a single handler is shared by every thread, lxml releases the GIL
+    while it parses so documents are parsed in parallel without sending the results between processes. Paths are
+    sent to the workers in chunks, the size of the chunks is adjusted with the measured throughput so every chunk
+    takes around `TARGET_CHUNK_SECONDS`.
+
+    Args:
+        workers : int, default: None
+                    Number of processes, if None provided the number of CPUs is used.
+        handler_config : dict, default: None
+                    Configuration of the handler of every worker.
+        ordered : bool, default: True
+                    If True results are returned in the order of the paths, else in completion order.
+        threads : bool, default: False
+                    If True a pool of threads is used instead of a pool of processes.
+        errors : str, default: 'raise'
+                    With 'raise' the error of a document is raised at its position, with 'record' the error is returned
+                    as the result of the document, see `ErrorHelper.get_error_record`. Use `ErrorHelper.set_traceback_logging`
+                    to avoid logging the traceback of every broken document.
+        hashes : bool, default: False
+                    If True every worker hashes the documents it transforms and the results are tuples (path, dict, hash),
+                    the hash is None for errors, see `Manifest.record`.
+    """
+    TARGET_CHUNK_SECONDS = 0.2
+    MIN_CHUNK_SIZE = 1
+    MAX_CHUNK_SIZE = 256
+
+    def __init__(self, workers:int = None, handler_config:dict = None, ordered:bool = True, threads:bool = False, errors:str = 'raise', hashes:bool = False) -> BatchTransformer:
+        if not errors in ('raise', 'record'):
+            raise ValueError(f'Incorrect errors mode "{errors}", only support raise and record.')
+        self._workers = workers or os.cpu_count() or 1
+        self._handler_config = dict(handler_config or {})
+        self._ordered = ordered
+        self._threads = threads
+        self._record_errors = errors == 'record'
+        self._hashes = hashes
+
+    def transform_many(self, paths:Iterable[str]) -> Iterator[tuple]:
+        """Transforms the XML files, paths are consumed lazily so any iterable is supported.
+
+        Args:
+            paths (Iterable[str]): File paths of the XML or tuples (name, bytes) with the content of the XML, e.g. a `ZipSource`.
+
+        Raises:
+            Exception: The error raised by the worker when a document can not be transformed, at the position of the document.
+                Only with errors 'raise'. Errors that are not builtin exceptions, like the errors of lxml, are raised as `TransformError`.
+
+        Returns:
+            Iterator[tuple]: Tuples (path, dict) with the data from CFDI, the name is returned instead of the path for contents.
+                With `hashes` the tuples are (path, dict, hash).
+        """
+        if self._threads:
+            executor = ThreadPoolExecutor(self._workers)
+            handler = CFDIAutoSAXHandler.from_config(self._handler_config)
+        else:
+            executor = ProcessPoolExecutor(self._workers, initializer=_init_worker, initargs=(self._handler_config, ErrorHelper.get_traceback_logging()))
+            handler = None
+        try:
+            yield from self.__transform_chunks(executor, handler, enumerate(paths))
+        finally:
+            executor.shutdown(wait=True)
+
+    def __transform_chunks(self, executor:Executor, handler:CFDIAutoSAXHandler, items:Iterator[tuple]) -> Iterator[tuple]:
+        max_pending = self._workers * 2
+        chunk_size = self.MIN_CHUNK_SIZE
+        pending = set()
+        completed = {}
+        next_index = 0
+        exhausted = False
+        try:
+            while True:
+                while not exhausted and len(pending) < max_pending:
+                    chunk = list(islice(items, chunk_size))
+                    if chunk:
+                        pending.add(executor.submit(_transform_chunk, chunk, handler, self._record_errors, self._hashes))
+                    else:
+                        exhausted = True
+                if not pending:
+                    break
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    results, elapsed = future.result()
+                    chunk_size = self.__get_chunk_size(len(results), elapsed)
+                    if self._ordered:
+                        completed.update((result[0], result) for result in results)
+                    else:
+                        for result in results:
+                            yield self.__get_result(result)
+                while next_index in completed:
+                    yield self.__get_result(completed.pop(next_index))
+                    next_index += 1
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def __get_chunk_size(self, size:int, elapsed:float) -> int:
+        if elapsed <= 0:
+            return self.MAX_CHUNK_SIZE
+        chunk_size = int(self.TARGET_CHUNK_SECONDS * size / elapsed)
+        return max(self.MIN_CHUNK_SIZE, min(self.MAX_CHUNK_SIZE, chunk_size))
+
+    @staticmethod
+    def __get_result(result:tuple) -> tuple:
+        _, path, data, error = result[:4]
+        if error is not None:
+            raise ErrorHelper.get_exception(error)
+        return (path, data) + result[4:]
+
+def transform_many(paths:Iterable[str], workers:int = None, handler_config:dict = None, ordered:bool = True, threads:bool = False, errors:str = 'raise', hashes:bool = False) -> Iterator[tuple]:
+    """Transforms many CFDI files in parallel, see `BatchTransformer`.
+
+    Args:
+        paths (Iterable[str]): File paths of the XML or tuples (name, bytes) with the content of the XML.
+        workers (int, optional): Number of processes. Defaults to the number of CPUs.
+        handler_config (dict, optional): Configuration of the handler of every worker. Defaults to None.
+        ordered (bool, optional): Return the results in the order of the paths. Defaults to True.
+        threads (bool, optional): Use a pool of threads instead of a pool of processes. Defaults to False.
+        errors (str, optional): 'raise' to raise the errors or 'record' to return them as results. Defaults to 'raise'.
+        hashes (bool, optional): Hash the documents in the workers, see `Manifest.record`. Defaults to False.
+
+    Returns:
+        Iterator[tuple]: Tuples (path, dict) with the data from CFDI, (path, dict, hash) with `hashes`.
+    """
+    return BatchTransformer(workers, handler_config, ordered, threads, errors, hashes).transform_many(paths)
@@ -0,0 +1,139 @@
+from __future__ import annotations
+from typing import Iterable, Iterator
+import hashlib
+import os
+import sqlite3
+
+class Manifest:
+    """SQLite store of the documents already transformed, used to transform only new or modified files.
+
+    For every document it records the path, size, modification time, content hash and UUID of the TimbreFiscalDigital.
+    A file is transformed again when its size or modification time changes, the files are not read in the main process:
+    with `transform_many(..., hashes=True)` every worker hashes the file while it transforms it, and `record` only updates
+    the modification time of the files touched but not modified. Records are committed every `checkpoint_size` documents,
+    so a batch interrupted by a crash continues from the last checkpoint. Use it as a context manager or call `close`
+    to commit the last records.
+
+    Args:
+        path : str
+                    Path of the SQLite file, it is created if it does not exist.
+        checkpoint_size : int, default: 100
+                    Records written between commits.
+    """
+    CHECKPOINT_SIZE = 100
+    HASH_CHUNK_SIZE = 1024 * 1024
+
+    def __init__(self, path:str, checkpoint_size:int = CHECKPOINT_SIZE) -> Manifest:
+        self._connection = sqlite3.connect(path)
+        self._connection.execute(
+            'CREATE TABLE IF NOT EXISTS documents ('
+            'path TEXT PRIMARY KEY, size INTEGER NOT NULL, mtime_ns INTEGER NOT NULL, hash TEXT NOT NULL, uuid TEXT NOT NULL)'
+        )
+        self._connection.commit()
+        self._checkpoint_size = checkpoint_size
+        self._uncommitted = 0
+        self._pending = {}
+
+    def __enter__(self) -> Manifest:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.checkpoint()
+        self._connection.close()
+
+    def checkpoint(self) -> None:
+        self._connection.commit()
+        self._uncommitted = 0
+
+    def get(self, path:str) -> dict:
+        """Gets the record of a document.
+
+        Args:
+            path (str): File path of the XML.
+
+        Returns:
+            dict: Dict with the keys `path`, `size`, `mtime_ns`, `hash` and `uuid`, None if the document is not recorded.
+        """
+        row = self._connection.execute('SELECT path, size, mtime_ns, hash, uuid FROM documents WHERE path = ?', (os.fspath(path),)).fetchone()
+        if row is None:
+            return None
+        return dict(zip(('path', 'size', 'mtime_ns', 'hash', 'uuid'), row))
+
+    def filter_changed(self, paths:Iterable[str]) -> Iterator[str]:
+        """Returns only the paths of the new documents and of the documents whose size or modification time changed,
+        paths are consumed lazily and files are not read. The state of the returned files is kept until they are recorded with `record`.
+
+        Args:
+            paths (Iterable[str]): File paths of the XML, e.g. a `DirectorySource`.
+
+        Returns:
+            Iterator[str]: File paths of the documents to transform.
+        """
+        for path in paths:
+            stat = os.stat(path)
+            record = self.get(path)
+            if record is not None and record['size'] == stat.st_size and record['mtime_ns'] == stat.st_mtime_ns:
+                continue
+            self._pending[path] = (stat.st_size, stat.st_mtime_ns, record)
+            yield path
+
+    def record(self, path:str, cfdi_data:dict, digest:str = None) -> bool:
+        """Records a transformed document. Error records of `transform_many` are not recorded, failed documents are
+        transformed again on every batch until they succeed.
+
+        Args:
+            path (str): File path of the XML.
+            cfdi_data (dict): Dict containing data from CFDI.
+            digest (str, optional): Hash of the file returned by `transform_many` with `hashes=True`. Defaults to None,
+                the file is hashed in the current thread.
+
+        Returns:
+            bool: False if the file was touched but its content did not change, so its result can be skipped, else True.
+        """
+        state = self._pending.pop(path, None)
+        if 'error' in cfdi_data:
+            return True
+        if state is None:
+            stat = os.stat(path)
+            state = (stat.st_size, stat.st_mtime_ns, self.get(path))
+        size, mtime_ns, record = state
+        if digest is None:
+            digest = self.get_hash(path)
+        if record is not None and record['size'] == size and record['hash'] == digest:
+            # Touched but not modified, only the modification time is updated
+            self._connection.execute('UPDATE documents SET mtime_ns = ? WHERE path = ?', (mtime_ns, os.fspath(path)))
+            self.__count()
+            return False
+        uuid = ' '.join(tfd['uuid'] for tfd in cfdi_data.get('tfd11', []))
+        self._connection.execute('INSERT OR REPLACE INTO documents (path, size, mtime_ns, hash, uuid) VALUES (?, ?, ?, ?, ?)', (os.fspath(path), size, mtime_ns, digest, uuid))
+        self.__count()
+        return True
+
+    def __count(self) -> None:
+        self._uncommitted += 1
+        if self._uncommitted >= self._checkpoint_size:
+            self.checkpoint()
+
+    @staticmethod
+    def get_hash(source:str|bytes) -> str:
+        """Gets the hash of a file or of the content of a file.
+
+        Args:
+            source (str | bytes): File path or content of the file.
+
+        Returns:
+            str: Hex digest of blake2b with 20 bytes.
+        """
+        digest = hashlib.blake2b(digest_size=20)
+        if isinstance(source, (bytes, bytearray)):
+            digest.update(source)
+            return digest.hexdigest()
+        with open(source, 'rb') as file:
+            chunk = file.read(Manifest.HASH_CHUNK_SIZE)
+            while chunk:
+                digest.update(chunk)
+                chunk = file.read(Manifest.HASH_CHUNK_SIZE)
+        return digest.hexdigest()
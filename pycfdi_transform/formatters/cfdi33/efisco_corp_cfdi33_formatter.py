@@ -1,8 +1,51 @@
 from __future__ import annotations
+from typing import Iterator
 from pycfdi_transform.formatters.formatter_interface import FormatterInterface
-from pycfdi_transform.helpers.string_helper import StringHelper
+from pycfdi_transform.helpers.decimal_accumulator import DecimalAccumulator
 
 class EfiscoCorpCFDI33Formatter(FormatterInterface):
+    _COLUMNS_FIELDS = {
+        'VERSION': ('cfdi33.version',),
+        'SERIE': ('cfdi33.serie',),
+        'FOLIO': ('cfdi33.folio',),
+        'FECHA': ('cfdi33.fecha',),
+        'NOCERTIFICADO': ('cfdi33.no_certificado',),
+        'SUBTOTAL': ('cfdi33.subtotal',),
+        'DESCUENTO': ('cfdi33.descuento',),
+        'TOTAL': ('cfdi33.total',),
+        'MONEDA': ('cfdi33.moneda',),
+        'TIPOCAMBIO': ('cfdi33.tipo_cambio',),
+        'TIPODECOMPROBANTE': ('cfdi33.tipo_comprobante',),
+        'METODOPAGO': ('cfdi33.metodo_pago',),
+        'FORMAPAGO': ('cfdi33.forma_pago',),
+        'CONDICIONESDEPAGO': ('cfdi33.condiciones_pago',),
+        'LUGAREXPEDICION': ('cfdi33.lugar_expedicion',),
+        'EMISORRFC': ('cfdi33.emisor.rfc',),
+        'EMISORNOMBRE': ('cfdi33.emisor.nombre',),
+        'EMISORREGIMENFISCAL': ('cfdi33.emisor.regimen_fiscal',),
+        'RECEPTORRFC': ('cfdi33.receptor.rfc',),
+        'RECEPTORNOMBRE': ('cfdi33.receptor.nombre',),
+        'RESIDENCIAFISCAL': ('cfdi33.receptor.residencia_fiscal',),
+        'NUMREGIDTRIB': ('cfdi33.receptor.num_reg_id_trib',),
+        'RECEPTORUSOCFDI': ('cfdi33.receptor.uso_cfdi',),
+        'CLAVEPRODSERV': ('cfdi33.conceptos',),
+        'C_DESCRIPCION': ('cfdi33.conceptos',),
+        'IVATRASLADO': ('cfdi33.impuestos.traslados',),
+        'IEPSTRASLADO': ('cfdi33.impuestos.traslados',),
+        'TOTALIMPUESTOSTRASLADOS': ('cfdi33.impuestos.total_impuestos_traslados',),
+        'ISRRETENIDO': ('cfdi33.impuestos.retenciones',),
+        'IVARETENIDO': ('cfdi33.impuestos.retenciones',),
+        'IEPSRETENIDO': ('cfdi33.impuestos.retenciones',),
+        'TOTALIMPUESTOSRETENIDOS': ('cfdi33.impuestos.total_impuestos_retenidos',),
+        'TOTALTRASLADOSIMPUESTOSLOCALES': ('implocal10',),
+        'TOTALRETENCIONESIMPUESTOSLOCALES': ('implocal10',),
+        'COMPLEMENTOS': ('cfdi33.complementos',),
+        'UUID': ('tfd11.uuid',),
+        'FECHATIMBRADO': ('tfd11.fecha_timbrado',),
+        'RFCPROVCERTIF': ('tfd11.rfc_prov_cert',),
+        'SELLOCFD': ('tfd11.sello_cfd',)
+    }
+
     def __init__(self, cfdi_data: dict, empty_char:str = '', safe_numerics:bool = False) -> EfiscoCorpCFDI33Formatter:
         super().__init__(cfdi_data,empty_char,safe_numerics)
         assert 'cfdi33' in self._cfdi_data, 'Este formatter únicamente soporta datos de cfdi33.'
@@ -11,31 +54,37 @@ class EfiscoCorpCFDI33Formatter(FormatterInterface):
             'safe_numerics': safe_numerics
         }
         self._errors = []
+        self._taxes_totals = None
 
-    @staticmethod
-    def _get_total_taxes_by_type(taxes:list, tax_classification:str, tax_type:str) -> str:
-        total = '0.00'
-        taxes_classificated = taxes[tax_classification]
-        for tax in taxes_classificated:
-            if tax['impuesto'] == tax_type:
-                total = StringHelper.sum_strings(total, tax['importe'])
-        return total
-    
     def _get_implocal10_total_retenciones(self) -> list:
-        total = self._get_numeric_default_value()
+        total = DecimalAccumulator(self._get_numeric_default_value())
         if 'implocal10' in self._cfdi_data:
             for tax in self._cfdi_data['implocal10']:
-                if tax['total_retenciones_impuestos_locales']:
-                    total = StringHelper.sum_strings(total, tax['total_retenciones_impuestos_locales'])
-        return total
+                total.add(tax['total_retenciones_impuestos_locales'])
+        return total.to_string()
     
     def _get_implocal10_total_traslados(self) -> list:
-        total = self._get_numeric_default_value()
+        total = DecimalAccumulator(self._get_numeric_default_value())
         if 'implocal10' in self._cfdi_data:
             for tax in self._cfdi_data['implocal10']:
-                if tax['total_traslados_impuestos_locales']:
-                    total = StringHelper.sum_strings(total, tax['total_traslados_impuestos_locales'])
-        return total
+                total.add(tax['total_traslados_impuestos_locales'])
+        return total.to_string()
+
+    def __get_taxes_totals(self) -> dict:
+        # Totals by (classification, impuesto) computed in a single pass and cached for all the TFD rows
+        if self._taxes_totals is None:
+            totals = {}
+            taxes = self._cfdi_data['cfdi33']['impuestos']
+            for tax_classification in ('traslados', 'retenciones'):
+                for tax in taxes[tax_classification]:
+                    key = (tax_classification, tax['impuesto'])
+                    if not key in totals:
+                        totals[key] = DecimalAccumulator('0.00')
+                    totals[key].add(tax['importe'])
+            self._taxes_totals = {key: total.to_string() for key, total in totals.items()}
+            self._taxes_totals['implocal10', 'traslados'] = self._get_implocal10_total_traslados()
+            self._taxes_totals['implocal10', 'retenciones'] = self._get_implocal10_total_retenciones()
+        return self._taxes_totals
 
     def _get_concept_value_by_key(self,key: str)->str:
         if self._cfdi_data['cfdi33']['conceptos'] and len(self._cfdi_data['cfdi33']['conceptos']) > 0 and key in self._cfdi_data['cfdi33']['conceptos'][0]:
@@ -51,10 +100,10 @@ class EfiscoCorpCFDI33Formatter(FormatterInterface):
     def get_errors(self) -> str:
         return '|'.join(self._errors)
         
-    def dict_to_columns(self) -> list[list]:
-        results = []
+    def iter_rows(self) -> Iterator[tuple]:
+        taxes_totals = self.__get_taxes_totals()
         for tdf in self._cfdi_data['tfd11']:
-            row = [
+            yield (
                 # VERSION
                 self._cfdi_data['cfdi33']['version'],
                 # SERIE
@@ -106,23 +155,23 @@ class EfiscoCorpCFDI33Formatter(FormatterInterface):
                 # C_DESCRIPCION
                 self._get_concept_value_by_key('descripcion'),
                 # IVATRASLADO
-                self._get_total_taxes_by_type(self._cfdi_data['cfdi33']['impuestos'], 'traslados', '002'),
+                taxes_totals.get(('traslados', '002'), '0.00'),
                 # IEPSTRASLADO
-                self._get_total_taxes_by_type(self._cfdi_data['cfdi33']['impuestos'], 'traslados', '003'),
+                taxes_totals.get(('traslados', '003'), '0.00'),
                 # TOTALIMPUESTOSTRASLADOS
                 self._get_numeric_value(self._cfdi_data['cfdi33']['impuestos']['total_impuestos_traslados']),
                 # ISRRETENIDO
-                self._get_total_taxes_by_type(self._cfdi_data['cfdi33']['impuestos'], 'retenciones', '001'),
+                taxes_totals.get(('retenciones', '001'), '0.00'),
                 # IVARETENIDO
-                self._get_total_taxes_by_type(self._cfdi_data['cfdi33']['impuestos'], 'retenciones', '002'),
+                taxes_totals.get(('retenciones', '002'), '0.00'),
                 # IEPSRETENIDO
-                self._get_total_taxes_by_type(self._cfdi_data['cfdi33']['impuestos'], 'retenciones', '003'),
+                taxes_totals.get(('retenciones', '003'), '0.00'),
                 # TOTALIMPUESTOSRETENIDOS
                 self._get_numeric_value(self._cfdi_data['cfdi33']['impuestos']['total_impuestos_retenidos']),
                 # TOTALTRASLADOSIMPUESTOSLOCALES
-                self._get_implocal10_total_traslados(),
+                taxes_totals['implocal10', 'traslados'],
                 # TOTALRETENCIONESIMPUESTOSLOCALES
-                self._get_implocal10_total_retenciones(),
+                taxes_totals['implocal10', 'retenciones'],
                 # COMPLEMENTOS
                 self._get_str_value(self._cfdi_data['cfdi33']['complementos']),
                 # UUID                
@@ -133,9 +182,7 @@ class EfiscoCorpCFDI33Formatter(FormatterInterface):
                 tdf['rfc_prov_cert'],
                 # SELLOCFD
                 tdf['sello_cfd']
-            ]
-            results.append(row)
-        return results
+            )
     
     @staticmethod
     def get_columns_names() -> list[str]:
@@ -1,6 +1,7 @@
 from __future__ import annotations
+from typing import Iterator
 from pycfdi_transform.formatters.formatter_interface import FormatterInterface
-from pycfdi_transform.helpers.string_helper import StringHelper
+from pycfdi_transform.helpers.decimal_accumulator import DecimalAccumulator
 
 class CDACFDI40Formatter(FormatterInterface):
     """Class to format cfdi_data obtained from `CFDI40SAXHandler` in columnar form.
@@ -13,6 +14,46 @@ class CDACFDI40Formatter(FormatterInterface):
         safe_numerics : bool, default: False
                     If definied numeric data with not value is presented as 0.00 or 1.00 in case of TIPOCAMBIO.
     """
+    _COLUMNS_FIELDS = {
+        'VERSION': ('cfdi40.version',),
+        'SERIE': ('cfdi40.serie',),
+        'FOLIO': ('cfdi40.folio',),
+        'FECHA': ('cfdi40.fecha',),
+        'NOCERTIFICADO': ('cfdi40.no_certificado',),
+        'SUBTOTAL': ('cfdi40.subtotal',),
+        'DESCUENTO': ('cfdi40.descuento',),
+        'TOTAL': ('cfdi40.total',),
+        'MONEDA': ('cfdi40.moneda',),
+        'TIPOCAMBIO': ('cfdi40.tipo_cambio',),
+        'TIPODECOMPROBANTE': ('cfdi40.tipo_comprobante',),
+        'METODOPAGO': ('cfdi40.metodo_pago',),
+        'FORMAPAGO': ('cfdi40.forma_pago',),
+        'CONDICIONESDEPAGO': ('cfdi40.condiciones_pago',),
+        'LUGAREXPEDICION': ('cfdi40.lugar_expedicion',),
+        'EMISORRFC': ('cfdi40.emisor.rfc',),
+        'EMISORNOMBRE': ('cfdi40.emisor.nombre',),
+        'EMISORREGIMENFISCAL': ('cfdi40.emisor.regimen_fiscal',),
+        'RECEPTORRFC': ('cfdi40.receptor.rfc',),
+        'RECEPTORNOMBRE': ('cfdi40.receptor.nombre',),
+        'RESIDENCIAFISCAL': ('cfdi40.receptor.residencia_fiscal',),
+        'NUMREGIDTRIB': ('cfdi40.receptor.num_reg_id_trib',),
+        'RECEPTORUSOCFDI': ('cfdi40.receptor.uso_cfdi',),
+        'IVATRASLADO': ('cfdi40.impuestos.traslados',),
+        'IEPSTRASLADO': ('cfdi40.impuestos.traslados',),
+        'TOTALIMPUESTOSTRASLADOS': ('cfdi40.impuestos.total_impuestos_traslados',),
+        'ISRRETENIDO': ('cfdi40.impuestos.retenciones',),
+        'IVARETENIDO': ('cfdi40.impuestos.retenciones',),
+        'IEPSRETENIDO': ('cfdi40.impuestos.retenciones',),
+        'TOTALIMPUESTOSRETENIDOS': ('cfdi40.impuestos.total_impuestos_retenidos',),
+        'TOTALTRASLADOSIMPUESTOSLOCALES': ('implocal10',),
+        'TOTALRETENCIONESIMPUESTOSLOCALES': ('implocal10',),
+        'COMPLEMENTOS': ('cfdi40.complementos',),
+        'UUID': ('tfd11.uuid',),
+        'FECHATIMBRADO': ('tfd11.fecha_timbrado',),
+        'RFCPROVCERTIF': ('tfd11.rfc_prov_cert',),
+        'SELLOCFD': ('tfd11.sello_cfd',)
+    }
+
     def __init__(self, cfdi_data: dict, empty_char:str = '', safe_numerics:bool = False) -> CDACFDI40Formatter:
         super().__init__(cfdi_data,empty_char,safe_numerics)
         assert 'cfdi40' in self._cfdi_data, 'Este formatter únicamente soporta datos de cfdi40.'
@@ -21,31 +62,37 @@ class CDACFDI40Formatter(FormatterInterface):
             'safe_numerics': safe_numerics
         }
         self._errors = []
+        self._taxes_totals = None
 
-    @staticmethod
-    def _get_total_taxes_by_type(taxes:list, tax_classification:str, tax_type:str) -> str:
-        total = '0.00'
-        taxes_classificated = taxes[tax_classification]
-        for tax in taxes_classificated:
-            if tax['impuesto'] == tax_type:
-                total = StringHelper.sum_strings(total, tax['importe'])
-        return total
-    
     def _get_implocal10_total_retenciones(self) -> list:
-        total = self._get_numeric_default_value()
+        total = DecimalAccumulator(self._get_numeric_default_value())
         if 'implocal10' in self._cfdi_data:
             for tax in self._cfdi_data['implocal10']:
-                if tax['total_retenciones_impuestos_locales']:
-                    total = StringHelper.sum_strings(total, tax['total_retenciones_impuestos_locales'])
-        return total
+                total.add(tax['total_retenciones_impuestos_locales'])
+        return total.to_string()
     
     def _get_implocal10_total_traslados(self) -> list:
-        total = self._get_numeric_default_value()
+        total = DecimalAccumulator(self._get_numeric_default_value())
         if 'implocal10' in self._cfdi_data:
             for tax in self._cfdi_data['implocal10']:
-                if tax['total_traslados_impuestos_locales']:
-                    total = StringHelper.sum_strings(total, tax['total_traslados_impuestos_locales'])
-        return total
+                total.add(tax['total_traslados_impuestos_locales'])
+        return total.to_string()
+
+    def __get_taxes_totals(self) -> dict:
+        # Totals by (classification, impuesto) computed in a single pass and cached for all the TFD rows
+        if self._taxes_totals is None:
+            totals = {}
+            taxes = self._cfdi_data['cfdi40']['impuestos']
+            for tax_classification in ('traslados', 'retenciones'):
+                for tax in taxes[tax_classification]:
+                    key = (tax_classification, tax['impuesto'])
+                    if not key in totals:
+                        totals[key] = DecimalAccumulator('0.00')
+                    totals[key].add(tax['importe'])
+            self._taxes_totals = {key: total.to_string() for key, total in totals.items()}
+            self._taxes_totals['implocal10', 'traslados'] = self._get_implocal10_total_traslados()
+            self._taxes_totals['implocal10', 'retenciones'] = self._get_implocal10_total_retenciones()
+        return self._taxes_totals
 
     def _get_concept_value_by_key(self,key: str)->str:
         if self._cfdi_data['cfdi40']['conceptos'] and len(self._cfdi_data['cfdi40']['conceptos']) > 0 and key in self._cfdi_data['cfdi40']['conceptos'][0]:
@@ -100,26 +147,26 @@ class CDACFDI40Formatter(FormatterInterface):
         """
         return self._cfdi_data['cfdi40']['addendas'] if self.has_addenda() else ''
         
-    def dict_to_columns(self) -> list[list]:
-        """Format data contained in dict to list matching every column with its asociated column.
-        For complete list of columns use "get_columns_names".
+    def iter_rows(self) -> Iterator[tuple]:
+        """Format data contained in dict to tuples matching every value with its asociated column, rows are generated lazily.
+        For complete list of columns use "get_columns_names", use "dict_to_columns" to get all the rows in a list of lists.
 
         Usage example:
         ```
         formatter = CDACFDI40Formatter(cfdi_data)
         if formatter.can_format():
-            data_columns = formatter.dict_to_columns()
-            dict_columns = dict(zip(formatter.get_columns_names(), data_columns[0]))
+            for row in formatter.iter_rows():
+                dict_columns = dict(zip(formatter.get_columns_names(), row))
         else:
             print(formatter.get_errors())
         ```
 
-        Returns:
-            list[list]: List of lists where each element is disctint TFD (if invoice only have 1 TFD expect only 1 element) 
+        Yields:
+            tuple: One row for each distinct TFD (if invoice only have 1 TFD expect only 1 row)
         """
-        results = []
+        taxes_totals = self.__get_taxes_totals()
         for tdf in self._cfdi_data['tfd11']:
-            row = [
+            yield (
                 # VERSION
                 self._cfdi_data['cfdi40']['version'],
                 # SERIE
@@ -167,23 +214,23 @@ class CDACFDI40Formatter(FormatterInterface):
                 # RECEPTORUSOCFDI
                 self._cfdi_data['cfdi40']['receptor']['uso_cfdi'],
                 # IVATRASLADO
-                self._get_total_taxes_by_type(self._cfdi_data['cfdi40']['impuestos'], 'traslados', '002'),
+                taxes_totals.get(('traslados', '002'), '0.00'),
                 # IEPSTRASLADO
-                self._get_total_taxes_by_type(self._cfdi_data['cfdi40']['impuestos'], 'traslados', '003'),
+                taxes_totals.get(('traslados', '003'), '0.00'),
                 # TOTALIMPUESTOSTRASLADOS
                 self._get_numeric_value(self._cfdi_data['cfdi40']['impuestos']['total_impuestos_traslados']),
                 # ISRRETENIDO
-                self._get_total_taxes_by_type(self._cfdi_data['cfdi40']['impuestos'], 'retenciones', '001'),
+                taxes_totals.get(('retenciones', '001'), '0.00'),
                 # IVARETENIDO
-                self._get_total_taxes_by_type(self._cfdi_data['cfdi40']['impuestos'], 'retenciones', '002'),
+                taxes_totals.get(('retenciones', '002'), '0.00'),
                 # IEPSRETENIDO
-                self._get_total_taxes_by_type(self._cfdi_data['cfdi40']['impuestos'], 'retenciones', '003'),
+                taxes_totals.get(('retenciones', '003'), '0.00'),
                 # TOTALIMPUESTOSRETENIDOS
                 self._get_numeric_value(self._cfdi_data['cfdi40']['impuestos']['total_impuestos_retenidos']),
                 # TOTALTRASLADOSIMPUESTOSLOCALES
-                self._get_implocal10_total_traslados(),
+                taxes_totals['implocal10', 'traslados'],
                 # TOTALRETENCIONESIMPUESTOSLOCALES
-                self._get_implocal10_total_retenciones(),
+                taxes_totals['implocal10', 'retenciones'],
                 # COMPLEMENTOS
                 self._get_str_value(self._cfdi_data['cfdi40']['complementos']),
                 # UUID                
@@ -194,9 +241,7 @@ class CDACFDI40Formatter(FormatterInterface):
                 tdf['rfc_prov_cert'],
                 # SELLOCFD
                 tdf['sello_cfd']
-            ]
-            results.append(row)
-        return results
+            )
     
     @staticmethod
     def get_columns_names() -> list[str]:
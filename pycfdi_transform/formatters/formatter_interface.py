@@ -1,8 +1,12 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
+from typing import Iterator
 from pycfdi_transform.helpers.string_helper import StringHelper
 
 class FormatterInterface(ABC):
+    # Paths of the fields of cfdi_data read by each column, see `get_fields_names`.
+    _COLUMNS_FIELDS = {}
+
     def __init__(self, cfdi_data:dict, empty_char:str = '', safe_numerics:bool = False) -> FormatterInterface:
         super().__init__()
         assert type(cfdi_data) == dict, 'El Formatter debe recibir el objeto devuelto por la transformación el debe ser un dict.'
@@ -14,14 +18,26 @@ class FormatterInterface(ABC):
         self._errors = []
     
     @abstractmethod
-    def dict_to_columns(self) -> list[list]:
+    def iter_rows(self) -> Iterator[tuple]:
         raise NotImplementedError
     
+    def dict_to_columns(self) -> list[list]:
+        return [list(row) for row in self.iter_rows()]
+    
     @staticmethod
     @abstractmethod
     def get_columns_names() -> list[str]:
         raise NotImplementedError
     
+    @classmethod
+    def get_fields_names(cls) -> list[str]:
+        fields = []
+        for column in cls.get_columns_names():
+            for field in cls._COLUMNS_FIELDS[column]:
+                if not field in fields:
+                    fields.append(field)
+        return fields
+    
     @abstractmethod
     def can_format(self) -> bool:
         raise NotImplementedError
@@ -1,126 +1,193 @@
 from __future__ import annotations
+from typing import Iterator
 from pycfdi_transform.formatters.formatter_interface import FormatterInterface
-from pycfdi_transform.helpers.string_helper import StringHelper
+from pycfdi_transform.helpers.decimal_accumulator import DecimalAccumulator
 
 class EfiscoNomina12Formatter(FormatterInterface):
+    _COLUMNS_FIELDS = {
+        'VERSION': ('cfdi33.version',),
+        'SERIE': ('cfdi33.serie',),
+        'FOLIO': ('cfdi33.folio',),
+        'FECHA': ('cfdi33.fecha',),
+        'NOCERTIFICADO': ('cfdi33.no_certificado',),
+        'SUBTOTAL': ('cfdi33.subtotal',),
+        'DESCUENTO': ('cfdi33.descuento',),
+        'TOTAL': ('cfdi33.total',),
+        'MONEDA': ('cfdi33.moneda',),
+        'TIPOCAMBIO': ('cfdi33.tipo_cambio',),
+        'TIPODECOMPROBANTE': ('cfdi33.tipo_comprobante',),
+        'METODOPAGO': ('cfdi33.metodo_pago',),
+        'FORMAPAGO': ('cfdi33.forma_pago',),
+        'CONDICIONESDEPAGO': ('cfdi33.condiciones_pago',),
+        'LUGAREXPEDICION': ('cfdi33.lugar_expedicion',),
+        'EMISORRFC': ('cfdi33.emisor.rfc',),
+        'EMISORNOMBRE': ('cfdi33.emisor.nombre',),
+        'EMISORREGIMENFISCAL': ('cfdi33.emisor.regimen_fiscal',),
+        'RECEPTORRFC': ('cfdi33.receptor.rfc',),
+        'RECEPTORNOMBRE': ('cfdi33.receptor.nombre',),
+        'RECEPTORUSOCFDI': ('cfdi33.receptor.uso_cfdi',),
+        'UUID': ('tfd11.uuid',),
+        'FECHATIMBRADO': ('tfd11.fecha_timbrado',),
+        'RFCPROVCERTIF': ('tfd11.rfc_prov_cert',),
+        'SELLOCFD': ('tfd11.sello_cfd',),
+        'TIPONOMINA': ('nomina12',),
+        'FECHAPAGO': ('nomina12',),
+        'FECHAINICIALPAGO': ('nomina12',),
+        'FECHAFINALPAGO': ('nomina12',),
+        'NUMDIASPAGADOS': ('nomina12',),
+        'TOTALPERCEPCIONES': ('nomina12',),
+        'TOTALDEDUCCIONES': ('nomina12',),
+        'TOTALOTROSPAGOS': ('nomina12',),
+        'CURPEMISOR': ('nomina12',),
+        'REGISTROPATRONAL': ('nomina12',),
+        'RFCPATRONORIGEN': ('nomina12',),
+        'CURPRECEPTOR': ('nomina12',),
+        'NUMSEGURIDADSOCIAL': ('nomina12',),
+        'FECHAINICIORELLABORAL': ('nomina12',),
+        'SINDICALIZADO': ('nomina12',),
+        'TIPOJORNADA': ('nomina12',),
+        'TIPOREGIMEN': ('nomina12',),
+        'NUMEMPLEADO': ('nomina12',),
+        'DEPARTAMENTO': ('nomina12',),
+        'PUESTO': ('nomina12',),
+        'RIESGOPUESTO': ('nomina12',),
+        'BANCO': ('nomina12',),
+        'CUENTABANCARIA': ('nomina12',),
+        'ANTIGÜEDAD': ('nomina12',),
+        'TIPOCONTRATO': ('nomina12',),
+        'PERIODICIDADPAGO': ('nomina12',),
+        'SALARIOBASECOTAPOR': ('nomina12',),
+        'SALARIODIARIOINTEGRADO': ('nomina12',),
+        'CLAVEENTFED': ('nomina12',),
+        'TOTALSUELDOS': ('nomina12',),
+        'TOTALSEPARACIONINDEMNIZACION': ('nomina12',),
+        'TOTALJUBILACIONPENSIONRETIRO': ('nomina12',),
+        'TOTALGRAVADO': ('nomina12',),
+        'TOTALEXENTO': ('nomina12',),
+        'TOTALOTRASDEDUCCIONES': ('nomina12',),
+        'TOTALIMPUESTOSRETENIDOSN': ('nomina12',),
+        'DEDUCCION_PERCEPCION_OTROS': ('nomina12',),
+        'CLAVE_DEDUCCION_PERCEPCION': ('nomina12',),
+        'TIPO_DEDUCCION_PERCEPCION': ('nomina12',),
+        'CONCEPTO': ('nomina12',),
+        'IMPORTEGRAVADO': ('nomina12',),
+        'IMPORTEEXENTO': ('nomina12',)
+    }
+
+    # Totals of all the nomina12 of the document shown in every row, by element (None for the nomina) and property.
+    _TOTALS_PROPERTIES = (
+        (None, ('total_percepciones', 'total_deducciones', 'total_otros_pagos')),
+        ('percepciones', ('total_sueldos', 'total_separacion_indemnizacion', 'total_jubilacion_pension_retiro', 'total_gravado', 'total_exento')),
+        ('deducciones', ('total_otras_deducciones', 'total_impuestos_retenidos'))
+    )
+
     def __init__(self, cfdi_data: dict, empty_char:str = '', safe_numerics:bool = False) -> EfiscoNomina12Formatter:
         super().__init__(cfdi_data, empty_char, safe_numerics)
         assert 'cfdi33' in self._cfdi_data, 'Este formatter únicamente soporta datos de cfdi33.'
+        self._totals = None
+        self._nominas = None
     
-    def __get_nomina_total_by_property(self,property_name):
-        total = None
-        for nomina12 in self._cfdi_data['nomina12']:
-            if nomina12[property_name]:
-                total = StringHelper.sum_strings(total, nomina12[property_name])
-        return self._get_numeric_value(total)
+    def __get_totals(self) -> dict:
+        # Every total is computed in a single pass over the nomina12 and cached for all the rows
+        if self._totals is None:
+            totals = {property_name: DecimalAccumulator() for _, properties in self._TOTALS_PROPERTIES for property_name in properties}
+            for nomina12 in self._cfdi_data['nomina12']:
+                for element_name, properties in self._TOTALS_PROPERTIES:
+                    element = nomina12 if element_name is None else nomina12[element_name]
+                    for property_name in properties:
+                        totals[property_name].add(element[property_name])
+            self._totals = {property_name: self._get_numeric_value(total.to_string()) for property_name, total in totals.items()}
+        return self._totals
     
-    def __get_total_by_element_and_property(self,element_name:str,property_name:str):
-        total = None
-        for nomina12 in self._cfdi_data['nomina12']:
-            if nomina12[element_name][property_name]:
-                total = StringHelper.sum_strings(total, nomina12[element_name][property_name])
-        return self._get_numeric_value(total)
+    def __get_nominas(self) -> list:
+        # The columns of every nomina12 are computed once and shared by the rows of its percepciones, deducciones and otros pagos in every TFD
+        if self._nominas is None:
+            totals = self.__get_totals()
+            self._nominas = [(self.__get_nomina_columns(nomina12, totals), nomina12) for nomina12 in self._cfdi_data['nomina12']]
+        return self._nominas
 
-    def __get_total_percepciones(self):
-        return self.__get_nomina_total_by_property('total_percepciones')
-    
-    def __get_total_deducciones(self):
-        return self.__get_nomina_total_by_property('total_deducciones')
-    
-    def __get_total_otros_pagos(self):
-        return self.__get_nomina_total_by_property('total_otros_pagos')
-    
-    def __get_percepciones_total_by_property_name(self,property_name):
-        return self.__get_total_by_element_and_property('percepciones',property_name)
-    
-    def __get_deducciones_total_by_property_name(self,property_name):
-        return self.__get_total_by_element_and_property('deducciones',property_name)
-    
-    def _get_part_complement(self) -> list:
-        results = []
-        for nomina12 in self._cfdi_data['nomina12']:
-            row = [
-                nomina12['tipo_nomina'],
-                nomina12['fecha_pago'],
-                nomina12['fecha_inicial_pago'],
-                nomina12['fecha_final_pago'],
-                nomina12['num_dias_pagados'],
-                self.__get_total_percepciones(),
-                self.__get_total_deducciones(),
-                self.__get_total_otros_pagos(),
-                self._get_str_value(nomina12['emisor']['curp']),
-                self._get_str_value(nomina12['emisor']['registro_patronal']),
-                self._get_str_value(nomina12['emisor']['rfc_patron_origen']),
-                nomina12['receptor']['curp'],
-                self._get_str_value(nomina12['receptor']['num_seguridad_social']),
-                nomina12['receptor']['fecha_inicio_rel_laboral'],
-                self._get_str_value(nomina12['receptor']['sindicalizado']),
-                self._get_str_value(nomina12['receptor']['tipo_jornada']),
-                nomina12['receptor']['tipo_regimen'],
-                nomina12['receptor']['num_empleado'],
-                self._get_str_value(nomina12['receptor']['departamento']),
-                self._get_str_value(nomina12['receptor']['puesto']),
-                self._get_str_value(nomina12['receptor']['riesgo_puesto']),
-                self._get_str_value(nomina12['receptor']['banco']),
-                self._get_str_value(nomina12['receptor']['cuenta_bancaria']),
-                self._get_str_value(nomina12['receptor']['antigüedad']),
-                nomina12['receptor']['tipo_contrato'],
-                nomina12['receptor']['periodicidad_pago'],
-                self._get_numeric_value(nomina12['receptor']['salario_base_cot_apor']),
-                self._get_numeric_value(nomina12['receptor']['salario_diario_integrado']),
-                nomina12['receptor']['clave_ent_fed'],
-                self.__get_percepciones_total_by_property_name('total_sueldos'),
-                self.__get_percepciones_total_by_property_name('total_separacion_indemnizacion'),
-                self.__get_percepciones_total_by_property_name('total_jubilacion_pension_retiro'),
-                self.__get_percepciones_total_by_property_name('total_gravado'),
-                self.__get_percepciones_total_by_property_name('total_exento'),
-                self.__get_deducciones_total_by_property_name('total_otras_deducciones'),
-                self.__get_deducciones_total_by_property_name('total_impuestos_retenidos'),
-            ]
+    def __get_nomina_columns(self, nomina12:dict, totals:dict) -> tuple:
+        return (
+            nomina12['tipo_nomina'],
+            nomina12['fecha_pago'],
+            nomina12['fecha_inicial_pago'],
+            nomina12['fecha_final_pago'],
+            nomina12['num_dias_pagados'],
+            totals['total_percepciones'],
+            totals['total_deducciones'],
+            totals['total_otros_pagos'],
+            self._get_str_value(nomina12['emisor']['curp']),
+            self._get_str_value(nomina12['emisor']['registro_patronal']),
+            self._get_str_value(nomina12['emisor']['rfc_patron_origen']),
+            nomina12['receptor']['curp'],
+            self._get_str_value(nomina12['receptor']['num_seguridad_social']),
+            nomina12['receptor']['fecha_inicio_rel_laboral'],
+            self._get_str_value(nomina12['receptor']['sindicalizado']),
+            self._get_str_value(nomina12['receptor']['tipo_jornada']),
+            nomina12['receptor']['tipo_regimen'],
+            nomina12['receptor']['num_empleado'],
+            self._get_str_value(nomina12['receptor']['departamento']),
+            self._get_str_value(nomina12['receptor']['puesto']),
+            self._get_str_value(nomina12['receptor']['riesgo_puesto']),
+            self._get_str_value(nomina12['receptor']['banco']),
+            self._get_str_value(nomina12['receptor']['cuenta_bancaria']),
+            self._get_str_value(nomina12['receptor']['antigüedad']),
+            nomina12['receptor']['tipo_contrato'],
+            nomina12['receptor']['periodicidad_pago'],
+            self._get_numeric_value(nomina12['receptor']['salario_base_cot_apor']),
+            self._get_numeric_value(nomina12['receptor']['salario_diario_integrado']),
+            nomina12['receptor']['clave_ent_fed'],
+            totals['total_sueldos'],
+            totals['total_separacion_indemnizacion'],
+            totals['total_jubilacion_pension_retiro'],
+            totals['total_gravado'],
+            totals['total_exento'],
+            totals['total_otras_deducciones'],
+            totals['total_impuestos_retenidos'],
+        )
 
+    def _iter_part_complement(self, prefix:tuple = ()) -> Iterator[tuple]:
+        for nomina_columns, nomina12 in self.__get_nominas():
             if len(nomina12['percepciones']['percepcion']) > 0:
                 for percepcion in nomina12['percepciones']['percepcion']:
-                    results.append(
-                        row + [
-                            'P',
-                            percepcion['clave'],
-                            percepcion['tipo_percepcion'],
-                            percepcion['concepto'],
-                            percepcion['importe_gravado'],
-                            percepcion['importe_exento'],
-                        ]
+                    yield (
+                        *prefix,
+                        *nomina_columns,
+                        'P',
+                        percepcion['clave'],
+                        percepcion['tipo_percepcion'],
+                        percepcion['concepto'],
+                        percepcion['importe_gravado'],
+                        percepcion['importe_exento'],
                     )
             if len(nomina12['deducciones']['deduccion']) > 0:
                 for deduccion in nomina12['deducciones']['deduccion']:
-                    results.append(
-                        row + [
-                            'D',
-                            deduccion['clave'],
-                            deduccion['tipo_deduccion'],
-                            deduccion['concepto'],
-                            deduccion['importe'],
-                            '0.00',
-                        ]
+                    yield (
+                        *prefix,
+                        *nomina_columns,
+                        'D',
+                        deduccion['clave'],
+                        deduccion['tipo_deduccion'],
+                        deduccion['concepto'],
+                        deduccion['importe'],
+                        '0.00',
                     )
             if len(nomina12['otros_pagos']['otro_pago']) > 0:
                 for otro_pago in nomina12['otros_pagos']['otro_pago']:
-                    results.append(
-                        row + [
-                            'O',
-                            otro_pago['clave'],
-                            otro_pago['tipo_otro_pago'],
-                            otro_pago['concepto'],
-                            '0.00',
-                            otro_pago['importe']
-                        ]
+                    yield (
+                        *prefix,
+                        *nomina_columns,
+                        'O',
+                        otro_pago['clave'],
+                        otro_pago['tipo_otro_pago'],
+                        otro_pago['concepto'],
+                        '0.00',
+                        otro_pago['importe']
                     )
-        return results
         
-    def dict_to_columns(self) -> list[list]:
-        results = []
-        nomina_list = self._get_part_complement()
+    def iter_rows(self) -> Iterator[tuple]:
         for tdf in self._cfdi_data['tfd11']:
-            row = [
+            prefix = (
                 self._cfdi_data['cfdi33']['version'],
                 self._get_str_value(self._cfdi_data['cfdi33']['serie']),
                 self._get_str_value(self._cfdi_data['cfdi33']['folio']),
@@ -146,10 +213,8 @@ class EfiscoNomina12Formatter(FormatterInterface):
                 tdf['fecha_timbrado'],
                 tdf['rfc_prov_cert'],
                 tdf['sello_cfd']
-            ]
-            for nomina_row in nomina_list:
-                results.append(row + nomina_row)
-        return results
+            )
+            yield from self._iter_part_complement(prefix)
     
     def can_format(self) -> bool:
         if not 'nomina12' in self._cfdi_data or len(self._cfdi_data['nomina12']) == 0:
@@ -1,11 +1,71 @@
 from __future__ import annotations
+from typing import Iterator
 from pycfdi_transform.formatters.formatter_interface import FormatterInterface
 from pycfdi_transform.helpers.string_helper import StringHelper
+from pycfdi_transform.helpers.decimal_accumulator import DecimalAccumulator
 
 class EfiscoPagos10Formatter(FormatterInterface):
+    _COLUMNS_FIELDS = {
+        'VERSION': ('cfdi33.version',),
+        'SERIE': ('cfdi33.serie',),
+        'FOLIO': ('cfdi33.folio',),
+        'FECHA': ('cfdi33.fecha',),
+        'NOCERTIFICADO': ('cfdi33.no_certificado',),
+        'SUBTOTAL': ('cfdi33.subtotal',),
+        'DESCUENTO': ('cfdi33.descuento',),
+        'TOTAL': ('cfdi33.total',),
+        'MONEDA': ('cfdi33.moneda',),
+        'TIPOCAMBIO': ('cfdi33.tipo_cambio',),
+        'TIPODECOMPROBANTE': ('cfdi33.tipo_comprobante',),
+        'METODOPAGO': ('cfdi33.metodo_pago',),
+        'FORMAPAGO': ('cfdi33.forma_pago',),
+        'CONDICIONESDEPAGO': ('cfdi33.condiciones_pago',),
+        'LUGAREXPEDICION': ('cfdi33.lugar_expedicion',),
+        'EMISORRFC': ('cfdi33.emisor.rfc',),
+        'EMISORNOMBRE': ('cfdi33.emisor.nombre',),
+        'EMISORREGIMENFISCAL': ('cfdi33.emisor.regimen_fiscal',),
+        'RECEPTORRFC': ('cfdi33.receptor.rfc',),
+        'RECEPTORNOMBRE': ('cfdi33.receptor.nombre',),
+        'RECEPTORUSOCFDI': ('cfdi33.receptor.uso_cfdi',),
+        'UUID': ('tfd11.uuid',),
+        'FECHATIMBRADO': ('tfd11.fecha_timbrado',),
+        'RFCPROVCERTIF': ('tfd11.rfc_prov_cert',),
+        'SELLOCFD': ('tfd11.sello_cfd',),
+        'P_IDENTIFICADOR_PAGO': ('pagos10',),
+        'P_FECHAPAGO': ('pagos10',),
+        'P_FORMADEPAGOP': ('pagos10',),
+        'P_MONEDAP': ('pagos10',),
+        'P_TIPOCAMBIOP': ('pagos10',),
+        'P_MONTO': ('pagos10',),
+        'P_NUMOPERACION': ('pagos10',),
+        'P_RFCEMISORCTAORD': ('pagos10',),
+        'P_NOMBANCOORDEXT': ('pagos10',),
+        'P_CTAORDENANTE': ('pagos10',),
+        'P_RFCEMISORCTABEN': ('pagos10',),
+        'P_CTABENEFICIARIO': ('pagos10',),
+        'P_IVATRASLADO': ('pagos10',),
+        'P_IEPSTRASLADO': ('pagos10',),
+        'P_TOTALIMPUESTOSTRASLADADOS': ('pagos10',),
+        'P_ISRRETENCION': ('pagos10',),
+        'P_IVARETENCION': ('pagos10',),
+        'P_IEPSRETENCION': ('pagos10',),
+        'P_TOTALIMPUESTOSRETENIDOS': ('pagos10',),
+        'P_DR_IDDOCUMENTO': ('pagos10',),
+        'P_DR_SERIE': ('pagos10',),
+        'P_DR_FOLIO': ('pagos10',),
+        'P_DR_MONEDADR': ('pagos10',),
+        'P_DR_TIPOCAMBIODR': ('pagos10',),
+        'P_DR_METODODEPAGODR': ('pagos10',),
+        'P_DR_NUMPARCIALIDAD': ('pagos10',),
+        'P_DR_IMPSALDOANT': ('pagos10',),
+        'P_DR_IMPPAGADO': ('pagos10',),
+        'P_DR_IMPSALDOINSOLUTO': ('pagos10',)
+    }
+
     def __init__(self, cfdi_data: dict, empty_char:str = '', safe_numerics:bool = False) -> EfiscoPagos10Formatter:
         super().__init__(cfdi_data, empty_char, safe_numerics)
         assert 'cfdi33' in self._cfdi_data, 'Este formatter únicamente soporta datos de cfdi33.'
+        self._pagos = None
     
     @staticmethod
     def _get_id_pago(count_complement:int, count_pago:int, count_dr:int) -> str:
@@ -13,104 +73,95 @@ class EfiscoPagos10Formatter(FormatterInterface):
     
     @staticmethod
     def _get_total_taxes(taxes:list, key:str) -> str:
-        total = '0.00'
+        total = DecimalAccumulator('0.00')
         for tax in taxes:
-            total = StringHelper.sum_strings(total, tax[key])
-        return total
+            total.add(tax[key])
+        return total.to_string()
     
     @staticmethod
     def _get_total_taxes_by_type(taxes:list, tax_classification:str, tax_type:str) -> str:
-        total = '0.00'
+        total = DecimalAccumulator('0.00')
         for tax in taxes:
             taxes_classificated = tax[tax_classification]
             for tax_classificated in taxes_classificated:
                 if tax_classificated['impuesto'] == tax_type:
-                    total = StringHelper.sum_strings(total, tax_classificated['importe'])
-        return total
+                    total.add(tax_classificated['importe'])
+        return total.to_string()
+
+    def __get_pagos(self) -> list:
+        # The columns of every pago are computed once and shared by the rows of its DoctoRelacionado in every TFD
+        if self._pagos is None:
+            self._pagos = []
+            for count_complement_pago, pagos10 in enumerate(self._cfdi_data['pagos10'], 1):
+                for count_pago, pago in enumerate(pagos10['pago'], 1):
+                    self._pagos.append((count_complement_pago, count_pago, self.__get_pago_columns(pago), pago['docto_relacionado']))
+        return self._pagos
 
-    def _get_part_complement(self) -> list:
-        count_complement_pago = 1
-        results = []
-        for pagos10 in self._cfdi_data['pagos10']:
-            count_pago = 1
-            for pago in pagos10['pago']:
-                count_dr = 1
-                row = [
-                    self._get_id_pago(count_complement_pago, count_pago, count_dr),
-                    pago['fecha_pago'],
-                    pago['forma_de_pago_p'],
-                    pago['moneda_p'],
-                    self._get_numeric_tipo_cambio_value(pago['tipo_cambio_p']),
-                    pago['monto'],
-                    self._get_str_value(pago['num_operacion']),
-                    self._get_str_value(pago['rfc_emisor_cta_ord']),
-                    self._get_str_value(pago['nom_banco_ord_ext']),
-                    self._get_str_value(pago['cta_ordenante']),
-                    self._get_str_value(pago['rfc_emisor_cta_ben']),
-                    self._get_str_value(pago['cta_beneficiario']),
-                ]
+    def __get_pago_columns(self, pago:dict) -> tuple:
+        columns = (
+            pago['fecha_pago'],
+            pago['forma_de_pago_p'],
+            pago['moneda_p'],
+            self._get_numeric_tipo_cambio_value(pago['tipo_cambio_p']),
+            pago['monto'],
+            self._get_str_value(pago['num_operacion']),
+            self._get_str_value(pago['rfc_emisor_cta_ord']),
+            self._get_str_value(pago['nom_banco_ord_ext']),
+            self._get_str_value(pago['cta_ordenante']),
+            self._get_str_value(pago['rfc_emisor_cta_ben']),
+            self._get_str_value(pago['cta_beneficiario']),
+        )
+        if len(pago['impuestos']) > 0:
+            return columns + (
+                self._get_total_taxes_by_type(pago['impuestos'], 'traslados', '002'),
+                self._get_total_taxes_by_type(pago['impuestos'], 'traslados', '003'),
+                self._get_total_taxes(pago['impuestos'], 'total_impuestos_trasladados'),
+                self._get_total_taxes_by_type(pago['impuestos'], 'retenciones', '001'),
+                self._get_total_taxes_by_type(pago['impuestos'], 'retenciones', '002'),
+                self._get_total_taxes_by_type(pago['impuestos'], 'retenciones', '003'),
+                self._get_total_taxes(pago['impuestos'], 'total_impuestos_retenidos'),
+            )
+        return columns + (self._get_numeric_default_value(),) * 7
 
-                if len(pago['impuestos']) > 0:
-                    row.append(self._get_total_taxes_by_type(pago['impuestos'], 'traslados', '002'))
-                    row.append(self._get_total_taxes_by_type(pago['impuestos'], 'traslados', '003'))
-                    row.append(self._get_total_taxes(pago['impuestos'], 'total_impuestos_trasladados'))
-                    row.append(self._get_total_taxes_by_type(pago['impuestos'], 'retenciones', '001'))
-                    row.append(self._get_total_taxes_by_type(pago['impuestos'], 'retenciones', '002'))
-                    row.append(self._get_total_taxes_by_type(pago['impuestos'], 'retenciones', '003'))
-                    row.append(self._get_total_taxes(pago['impuestos'], 'total_impuestos_retenidos'))
-                else:
-                    row.extend(
-                        [
-                            self._get_numeric_default_value(),
-                            self._get_numeric_default_value(),
-                            self._get_numeric_default_value(),
-                            self._get_numeric_default_value(),
-                            self._get_numeric_default_value(),
-                            self._get_numeric_default_value(),
-                            self._get_numeric_default_value()
-                        ]
+    def _iter_part_complement(self, prefix:tuple = ()) -> Iterator[tuple]:
+        for count_complement_pago, count_pago, pago_columns, doctos in self.__get_pagos():
+            if len(doctos) > 0:
+                for count_dr, docto in enumerate(doctos, 1):
+                    yield (
+                        *prefix,
+                        self._get_id_pago(count_complement_pago, count_pago, count_dr),
+                        *pago_columns,
+                        docto['id_documento'],
+                        self._get_str_value(docto['serie']),
+                        self._get_str_value(docto['folio']),
+                        docto['moneda_dr'],
+                        self._get_numeric_tipo_cambio_value(docto['tipo_cambio_dr']),
+                        docto['metodo_de_pago_dr'],
+                        self._get_str_value(docto['num_parcialidad']),
+                        self._get_numeric_value(docto['imp_saldo_ant']),
+                        self._get_numeric_value(docto['imp_pagado']),
+                        self._get_numeric_value(docto['imp_saldo_insoluto']),
                     )
-                
-                if len(pago['docto_relacionado']) > 0:
-                    for docto in pago['docto_relacionado']:
-                        row[0] = self._get_id_pago(count_complement_pago, count_pago, count_dr)
-                        results.append(
-                            row + [
-                                docto['id_documento'],
-                                self._get_str_value(docto['serie']),
-                                self._get_str_value(docto['folio']),
-                                docto['moneda_dr'],
-                                self._get_numeric_tipo_cambio_value(docto['tipo_cambio_dr']),
-                                docto['metodo_de_pago_dr'],
-                                self._get_str_value(docto['num_parcialidad']),
-                                self._get_numeric_value(docto['imp_saldo_ant']),
-                                self._get_numeric_value(docto['imp_pagado']),
-                                self._get_numeric_value(docto['imp_saldo_insoluto']),
-                            ]
-                        )
-                        count_dr += 1
-                else:
-                    results.append(row + [
-                        self._config['empty_char'],
-                        self._config['empty_char'],
-                        self._config['empty_char'],
-                        self._config['empty_char'],
-                        StringHelper.DEFAULT_SAFE_NUMBER_ONE if self._config['safe_numerics'] else self._config['empty_char'],
-                        self._config['empty_char'],
-                        self._config['empty_char'],
-                        self._get_numeric_default_value(),
-                        self._get_numeric_default_value(),
-                        self._get_numeric_default_value()
-                    ])
-                count_pago += 1
-            count_complement_pago += 1
-        return results
+            else:
+                yield (
+                    *prefix,
+                    self._get_id_pago(count_complement_pago, count_pago, 1),
+                    *pago_columns,
+                    self._config['empty_char'],
+                    self._config['empty_char'],
+                    self._config['empty_char'],
+                    self._config['empty_char'],
+                    StringHelper.DEFAULT_SAFE_NUMBER_ONE if self._config['safe_numerics'] else self._config['empty_char'],
+                    self._config['empty_char'],
+                    self._config['empty_char'],
+                    self._get_numeric_default_value(),
+                    self._get_numeric_default_value(),
+                    self._get_numeric_default_value()
+                )
         
-    def dict_to_columns(self) -> list[list]:
-        results = []
-        pagos_list = self._get_part_complement()
+    def iter_rows(self) -> Iterator[tuple]:
         for tdf in self._cfdi_data['tfd11']:
-            row = [
+            prefix = (
                 self._cfdi_data['cfdi33']['version'],
                 self._get_str_value(self._cfdi_data['cfdi33']['serie']),
                 self._get_str_value(self._cfdi_data['cfdi33']['folio']),
@@ -136,10 +187,8 @@ class EfiscoPagos10Formatter(FormatterInterface):
                 tdf['fecha_timbrado'],
                 tdf['rfc_prov_cert'],
                 tdf['sello_cfd']
-            ]
-            for pago_row in pagos_list:
-                results.append(row + pago_row)
-        return results
+            )
+            yield from self._iter_part_complement(prefix)
     
     def can_format(self) -> bool:
         if not 'pagos10' in self._cfdi_data or len(self._cfdi_data['pagos10']) == 0:
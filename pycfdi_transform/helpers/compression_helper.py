@@ -0,0 +1,35 @@
+import bz2
+import gzip
+import lzma
+import os
+import zlib
+
+class CompressionHelper:
+    """Opens XML files compressed with gzip, bz2 or xz as binary streams that are decompressed while the parser reads them,
+    so compressed documents are never decompressed to disk or fully to memory. The compression is chosen by the extension
+    of the file (`.gz`, `.bz2` or `.xz`), other files are opened as they are.
+    """
+    OPENERS = {
+        '.gz': gzip.open,
+        '.bz2': bz2.open,
+        '.xz': lzma.open
+    }
+    # Errors raised while a truncated or corrupt file is decompressed, bz2 raises OSError
+    ERRORS = (EOFError, zlib.error, lzma.LZMAError)
+
+    @staticmethod
+    def is_compressed(file_path:str) -> bool:
+        return os.path.splitext(os.fspath(file_path))[1].lower() in CompressionHelper.OPENERS
+
+    @staticmethod
+    def open(file_path:str):
+        """Opens the file for binary reading decompressing it if needed.
+
+        Args:
+            file_path (str): File path, compressed or not.
+
+        Returns:
+            file: Binary file object.
+        """
+        opener = CompressionHelper.OPENERS.get(os.path.splitext(os.fspath(file_path))[1].lower(), open)
+        return opener(file_path, 'rb')
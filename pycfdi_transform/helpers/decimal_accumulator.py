@@ -0,0 +1,42 @@
+from __future__ import annotations
+from pycfdi_transform.helpers.string_helper import StringHelper
+
+class DecimalAccumulator:
+    """Running total of numeric strings, kept as `Decimal` and converted to string only once by `to_string`.
+
+    Gives the same result as chaining `StringHelper.sum_strings`: empty values are ignored, values that are
+    not numbers count as 0 and a single value is returned as it is, without parsing it.
+
+    Args:
+        initial : str, default: None
+                    First value of the total, returned by `to_string` even if it is empty when no other value is added.
+    """
+    __slots__ = ('_first', '_total', '_count')
+
+    def __init__(self, initial:str = None) -> DecimalAccumulator:
+        self._first = initial
+        self._total = None
+        self._count = 0
+        self.add(initial)
+
+    def add(self, value:str) -> DecimalAccumulator:
+        if not value:
+            return self
+        if self._count == 0:
+            self._first = value
+        elif self._count == 1:
+            self._total = StringHelper.try_parse_decimal(self._first) + StringHelper.try_parse_decimal(value)
+        else:
+            self._total += StringHelper.try_parse_decimal(value)
+        self._count += 1
+        return self
+
+    def to_string(self) -> str:
+        """Gets the total.
+
+        Returns:
+            str: Total as string, the initial value if no value was added.
+        """
+        if self._count < 2:
+            return self._first
+        return str(self._total)
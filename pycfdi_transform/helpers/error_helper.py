@@ -0,0 +1,114 @@
+from __future__ import annotations
+import builtins
+import logging
+import threading
+import time
+from lxml import etree
+from pycfdi_transform.helpers.compression_helper import CompressionHelper
+
+class TransformError(Exception):
+    """Error of a document transformed in another process whose exception can not be rebuilt, e.g. the errors of lxml.
+
+    Args:
+        record : dict
+                    Record of the error, see `ErrorHelper.get_error_record`.
+    """
+    def __init__(self, record:dict) -> TransformError:
+        super().__init__(record)
+        self.record = record
+
+    def __str__(self) -> str:
+        return f"{self.record['error']}: {self.record['message']}"
+
+class ErrorHelper:
+    """Policy used by every SAX handler to log the exceptions raised while transforming a document.
+
+    By default every exception is logged with its traceback before it is raised again. Formatting tracebacks
+    is expensive when many documents are broken, use `set_traceback_logging` to disable the logging or to
+    log at most a number of tracebacks per minute, exceptions are raised the same way in every case.
+    """
+    _enabled = True
+    _max_per_minute = None
+    _window = None
+    _window_count = 0
+    _lock = threading.Lock()
+
+    @staticmethod
+    def set_traceback_logging(enabled:bool, max_per_minute:int = None) -> None:
+        """Configures the logging of the exceptions of all the handlers.
+
+        Args:
+            enabled (bool): If False exceptions are not logged.
+            max_per_minute (int, optional): Tracebacks logged per minute, the next exceptions of the minute are not logged. Defaults to None.
+        """
+        with ErrorHelper._lock:
+            ErrorHelper._enabled = enabled
+            ErrorHelper._max_per_minute = max_per_minute
+            ErrorHelper._window = None
+            ErrorHelper._window_count = 0
+
+    @staticmethod
+    def get_traceback_logging() -> tuple:
+        return ErrorHelper._enabled, ErrorHelper._max_per_minute
+
+    @staticmethod
+    def log_exception(logger:logging.Logger, message:str) -> None:
+        """Logs the exception being handled with its traceback if the policy allows it."""
+        if not ErrorHelper._enabled:
+            return
+        if ErrorHelper._max_per_minute is not None:
+            window = int(time.monotonic() // 60)
+            with ErrorHelper._lock:
+                if window != ErrorHelper._window:
+                    ErrorHelper._window = window
+                    ErrorHelper._window_count = 0
+                ErrorHelper._window_count += 1
+                if ErrorHelper._window_count > ErrorHelper._max_per_minute:
+                    return
+        logger.exception(message)
+
+    @staticmethod
+    def get_error_record(path:str, ex:Exception) -> dict:
+        """Builds a lightweight record of an exception without its traceback.
+
+        Args:
+            path (str): Path or name of the document.
+            ex (Exception): Exception raised transforming the document.
+
+        Returns:
+            dict: Dict with the keys `path`, `error` (class of the exception), `message` and `phase`
+                (`read`, `parse`, `validation` or `transform`).
+        """
+        if isinstance(ex, (OSError,) + CompressionHelper.ERRORS):
+            phase = 'read'
+        elif isinstance(ex, etree.DocumentInvalid):
+            phase = 'validation'
+        elif isinstance(ex, etree.XMLSyntaxError):
+            phase = 'parse'
+        else:
+            phase = 'transform'
+        return {
+            'path': path,
+            'error': type(ex).__name__,
+            'message': str(ex),
+            'phase': phase
+        }
+
+    @staticmethod
+    def get_exception(record:dict) -> Exception:
+        """Rebuilds the exception of a record built by `get_error_record`, records can be sent between processes
+        while some exceptions, like the errors of lxml, can not be pickled.
+
+        Args:
+            record (dict): Record of the error.
+
+        Returns:
+            Exception: Builtin exception of the same class with the message, otherwise a `TransformError`.
+        """
+        error_class = getattr(builtins, record['error'], None)
+        if isinstance(error_class, type) and issubclass(error_class, Exception):
+            try:
+                return error_class(record['message'])
+            except Exception:
+                pass
+        return TransformError(record)
@@ -0,0 +1,51 @@
+from functools import lru_cache
+from pycfdi_transform.helpers.string_helper import StringHelper
+
+class FieldsHelper:
+    """Helpers to extract only the projected fields of an element.
+
+    Fields are described as tuples `(key, attribute, default, compact)` where default is one of
+    `REQUIRED`, `EMPTY`, `SAFE_NUMBER_CERO` or `SAFE_NUMBER_ONE` and compact indicates if the
+    value is cleaned with `StringHelper.compact_string`. Projections are sets of dotted paths
+    like `cfdi40.emisor.rfc`, a path also selects everything below it. Compiled fields are
+    cached, so they are computed once per projection and configuration.
+    """
+    REQUIRED = 0
+    EMPTY = 1
+    SAFE_NUMBER_CERO = 2
+    SAFE_NUMBER_ONE = 3
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def is_requested(fields:frozenset, path:str) -> bool:
+        if fields is None or path in fields:
+            return True
+        index = path.find('.')
+        while index != -1:
+            if path[:index] in fields:
+                return True
+            index = path.find('.', index + 1)
+        prefix = path + '.'
+        return any(field.startswith(prefix) for field in fields)
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def compile_fields(specs:tuple, path:str, fields:frozenset, empty_char:str, safe_numerics:bool) -> tuple:
+        defaults = {
+            FieldsHelper.REQUIRED: None,
+            FieldsHelper.EMPTY: empty_char,
+            FieldsHelper.SAFE_NUMBER_CERO: StringHelper.DEFAULT_SAFE_NUMBER_CERO if safe_numerics else empty_char,
+            FieldsHelper.SAFE_NUMBER_ONE: StringHelper.DEFAULT_SAFE_NUMBER_ONE if safe_numerics else empty_char
+        }
+        return tuple(
+            (key, attribute, defaults[default], compact)
+            for key, attribute, default, compact in specs
+            if FieldsHelper.is_requested(fields, f'{path}.{key}')
+        )
+
+    @staticmethod
+    def extract(attrib, compiled_fields:tuple, delimiters:str, target:dict) -> dict:
+        for key, attribute, default, compact in compiled_fields:
+            value = attrib.get(attribute, default)
+            target[key] = StringHelper.compact_string(delimiters, value) if compact else value
+        return target
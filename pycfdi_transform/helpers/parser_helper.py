@@ -0,0 +1,99 @@
+import threading
+from lxml import etree
+from pycfdi_transform.helpers.compression_helper import CompressionHelper
+
+class ParserHelper:
+    """Shared cache of `etree.XMLParser` instances used by every SAX handler.
+
+    lxml parsers are not thread safe, so every thread keeps its own parsers keyed by
+    the options used to build them. Use `set_cache_enabled(False)` to build a new
+    parser for every document as before.
+    """
+    _local = threading.local()
+    _cache_enabled = True
+
+    @staticmethod
+    def get_parser(**options) -> etree.XMLParser:
+        """Gets a parser for the current thread built with the given options.
+
+        Returns:
+            etree.XMLParser: Cached parser, or a new one if the cache is disabled.
+        """
+        if not ParserHelper._cache_enabled:
+            return etree.XMLParser(**options)
+        parsers = getattr(ParserHelper._local, 'parsers', None)
+        if parsers is None:
+            parsers = ParserHelper._local.parsers = {}
+        key = tuple(sorted(options.items()))
+        parser = parsers.get(key)
+        if parser is None:
+            parser = parsers[key] = etree.XMLParser(**options)
+        return parser
+
+    @staticmethod
+    def parse_xml(xml_bytes:bytes, strict:bool = False, **options) -> tuple:
+        """Parses XML content. With strict the document is parsed without recover and only parsed
+        again with `recover=True` if it is not well formed.
+
+        Returns:
+            tuple: Root element and True if the document was parsed again in recover mode.
+        """
+        if strict:
+            try:
+                return etree.XML(xml_bytes, parser=ParserHelper.get_parser(recover=False, **options)), False
+            except etree.XMLSyntaxError:
+                pass
+        return etree.XML(xml_bytes, parser=ParserHelper.get_parser(recover=True, **options)), strict
+
+    @staticmethod
+    def parse_file(file_path:str, strict:bool = False, **options) -> tuple:
+        """Parses a XML file, see `parse_xml`. Files compressed with gzip, bz2 or xz are decompressed while they are parsed.
+
+        Returns:
+            tuple: Root element and True if the document was parsed again in recover mode.
+        """
+        if strict:
+            try:
+                return ParserHelper.__parse_file(file_path, ParserHelper.get_parser(recover=False, **options)), False
+            except etree.XMLSyntaxError:
+                pass
+        return ParserHelper.__parse_file(file_path, ParserHelper.get_parser(recover=True, **options)), strict
+
+    @staticmethod
+    def __parse_file(file_path:str, parser:etree.XMLParser) -> etree._Element:
+        if CompressionHelper.is_compressed(file_path):
+            with CompressionHelper.open(file_path) as file:
+                return etree.parse(file, parser=parser).getroot()
+        return etree.parse(file_path, parser=parser).getroot()
+
+    @staticmethod
+    def set_cache_enabled(enabled:bool) -> None:
+        ParserHelper._cache_enabled = enabled
+        if not enabled:
+            ParserHelper.clear_cache()
+
+    @staticmethod
+    def is_cache_enabled() -> bool:
+        return ParserHelper._cache_enabled
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Drops the parsers cached by the current thread."""
+        ParserHelper._local.parsers = {}
+
+    @staticmethod
+    def skip_subtree(context:etree.iterparse, element:etree._Element) -> None:
+        """Consumes the events of `context` until the end of `element`, like `iterwalk.skip_subtree` for `etree.iterparse`."""
+        for action, elem in context:
+            if action == 'end' and elem is element:
+                break
+        element.clear(keep_tail=True)
+
+    @staticmethod
+    def free_element(element:etree._Element) -> None:
+        """Frees an already extracted element of a document parsed with `etree.iterparse`, along with its previous siblings."""
+        element.clear(keep_tail=True)
+        parent = element.getparent()
+        if parent is not None:
+            while element.getprevious() is not None:
+                del parent[0]
@@ -1,7 +1,59 @@
+import os
+import threading
 from lxml import etree
 
 class SchemaHelper:
+    """Registry of the XSD shipped in the package, every schema is compiled at most once per process.
+
+    Schemas are found relative to the package, so the working directory does not matter. Compiled
+    `etree.XMLSchema` are shared by every thread, lxml creates a new validation context in every call.
+    Schemas not registered can be requested by their path relative to the xsd directory of the package,
+    e.g. `complementos/ine11.xsd`.
+    """
+    XSD_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'xsd')
+    SCHEMAS = {
+        'cfdi33': 'cfdi33/cfdv33.xsd',
+        'tfd11': 'complementos/TimbreFiscalDigitalv11.xsd',
+        'nomina12': 'complementos/Nomina12/nomina12.xsd',
+        'pagos10': 'complementos/Pago10/pagos10.xsd',
+        'implocal10': 'complementos/implocal.xsd'
+    }
+    _schemas = {}
+    _lock = threading.Lock()
+
     @staticmethod
     def get_schema_validator_cfdi33() -> etree.XMLSchema:
-        xml_schema = etree.XMLSchema(file='./pycfdi_transform/xsd/cfdi33/cfdv33.xsd')
-        return xml_schema
\ No newline at end of file
+        return SchemaHelper.get_schema_validator('cfdi33')
+
+    @staticmethod
+    def get_schema_validator(name:str) -> etree.XMLSchema:
+        """Gets the compiled schema, it is compiled only the first time it is requested.
+
+        Args:
+            name (str): Key of the schema in `SCHEMAS` or path relative to the xsd directory.
+
+        Raises:
+            FileNotFoundError: When the XSD is not in the package.
+
+        Returns:
+            etree.XMLSchema: Compiled schema shared by all the threads.
+        """
+        schema = SchemaHelper._schemas.get(name)
+        if schema is None:
+            with SchemaHelper._lock:
+                schema = SchemaHelper._schemas.get(name)
+                if schema is None:
+                    schema = SchemaHelper._schemas[name] = etree.XMLSchema(file=SchemaHelper.get_schema_path(name))
+        return schema
+
+    @staticmethod
+    def get_schema_path(name:str) -> str:
+        path = os.path.join(SchemaHelper.XSD_PATH, SchemaHelper.SCHEMAS.get(name, name))
+        if not os.path.isfile(path):
+            raise FileNotFoundError(f'Schema "{name}" not found at {path}.')
+        return path
+
+    @staticmethod
+    def clear_cache() -> None:
+        with SchemaHelper._lock:
+            SchemaHelper._schemas = {}
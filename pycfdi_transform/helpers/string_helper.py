@@ -28,8 +28,6 @@ class StringHelper:
     @staticmethod
     def try_parse_decimal(val)->Decimal:
         try:
-            Decimal(val)
+            return Decimal(val)
         except InvalidOperation:
             return Decimal(0.00)
-        else:
-            return Decimal(val)
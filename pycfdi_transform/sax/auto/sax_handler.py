@@ -0,0 +1,245 @@
+from __future__ import annotations
+from typing import Iterator
+import io
+import os
+from lxml import etree
+from pycfdi_transform.helpers.compression_helper import CompressionHelper
+from pycfdi_transform.helpers.schema_helper import SchemaHelper
+from pycfdi_transform.sax.cfdi33.sax_handler import CFDI33SAXHandler
+from pycfdi_transform.sax.cfdi40.sax_handler import CFDI40SAXHandler
+
+class CFDIAutoSAXHandler:
+    """Class to extract data from invoice XML to dict choosing the handler by the CFDI version.
+    Only the root element is read to know the version, so every document is parsed once by
+    `CFDI33SAXHandler` or `CFDI40SAXHandler`.
+
+    Args:
+        empty_char : str, default: ''
+                    Data added if the field has not data.
+        safe_numerics : bool, default: False
+                    If definied numeric data with not value is presented as 0.00 or 1.00 in case of TIPOCAMBIO.
+        schema_validator_cfdi33 : etree.XMLSchema, default: None
+                    Validator used for CFDI 3.3 documents. If None provided no validation is done.
+        schema_validator_cfdi40 : etree.XMLSchema, default: None
+                    Validator used for CFDI 4.0 documents. If None provided no validation is done.
+        esc_delimiters : str, default: ''
+                    Characters to remove from data, useful if your final format is text like csv and remove "," from data.
+    """
+    SNIFF_CHUNK_SIZE = 4096
+    _SCHEMA_NAMES = {'3.3': 'cfdi33', '4.0': 'cfdi40'}
+
+    def __init__(self, empty_char='', safe_numerics=False, schema_validator_cfdi33:etree.XMLSchema = None, schema_validator_cfdi40:etree.XMLSchema = None, esc_delimiters:str = "") -> CFDIAutoSAXHandler:
+        self._cfdi33_handler = CFDI33SAXHandler(empty_char, safe_numerics, schema_validator_cfdi33, esc_delimiters)
+        self._cfdi40_handler = CFDI40SAXHandler(empty_char, safe_numerics, schema_validator_cfdi40, esc_delimiters)
+        self._handlers = {
+            ('http://www.sat.gob.mx/cfd/3', '3.3'): self._cfdi33_handler,
+            ('http://www.sat.gob.mx/cfd/4', '4.0'): self._cfdi40_handler
+        }
+        self._last_handler = None
+        self._schema_validation = False
+
+    @classmethod
+    def from_config(cls, config:dict) -> CFDIAutoSAXHandler:
+        """Builds a configured handler from a dict, useful to build the same handler in other processes.
+
+        Args:
+            config (dict): Keys `empty_char`, `safe_numerics`, `esc_delimiters` as in the constructor,
+                `schema_validation` to call `use_schema_validation`, the booleans `nomina12`,
+                `pagos10`, `implocal10`, `concepts` and `strict_parse` to call their `use_` method and `fields`
+                for `use_fields`. Missing keys take the default configuration.
+
+        Returns:
+            CFDIAutoSAXHandler: Configured handler.
+        """
+        handler = cls(config.get('empty_char', ''), config.get('safe_numerics', False), esc_delimiters=config.get('esc_delimiters', ''))
+        if config.get('schema_validation', False):
+            handler.use_schema_validation()
+        if config.get('nomina12', False):
+            handler.use_nomina12()
+        if config.get('pagos10', False):
+            handler.use_pagos10()
+        if config.get('implocal10', False):
+            handler.use_implocal10()
+        if config.get('concepts', False):
+            handler.use_concepts()
+        if config.get('strict_parse', False):
+            handler.use_strict_parse()
+        if config.get('fields') is not None:
+            handler.use_fields(config['fields'])
+        return handler
+
+    @staticmethod
+    def get_cfdi_version(source:str|bytes) -> tuple:
+        """Reads only the root element of the XML to obtain its namespace and version.
+
+        Args:
+            source (str | bytes): File path or content of the XML.
+
+        Returns:
+            tuple: (namespace, version) of the root element, (None, None) if not root element found.
+        """
+        parser = etree.XMLPullParser(events=('start',), recover=True)
+        for chunk in CFDIAutoSAXHandler.__iter_chunks(source):
+            parser.feed(chunk)
+            for _, element in parser.read_events():
+                return etree.QName(element).namespace, element.get('Version')
+        return None, None
+
+    @staticmethod
+    def __iter_chunks(source:str|bytes):
+        chunk_size = CFDIAutoSAXHandler.SNIFF_CHUNK_SIZE
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            data = memoryview(source)
+            for index in range(0, len(data), chunk_size):
+                yield data[index:index + chunk_size].tobytes()
+        else:
+            with CompressionHelper.open(source) as file:
+                chunk = file.read(chunk_size)
+                while chunk:
+                    yield chunk
+                    chunk = file.read(chunk_size)
+
+    def get_handler(self, source:str|bytes) -> CFDI33SAXHandler|CFDI40SAXHandler:
+        """Gets the handler that supports the version of the XML.
+
+        Args:
+            source (str | bytes): File path or content of the XML.
+
+        Raises:
+            ValueError: When the XML is not CFDI 3.3 or 4.0.
+
+        Returns:
+            CFDI33SAXHandler | CFDI40SAXHandler: Configured handler for the document.
+        """
+        namespace, version = self.get_cfdi_version(source)
+        handler = self._handlers.get((namespace, version))
+        if handler is None:
+            raise ValueError(f'Incorrect type of CFDI, not supported namespace "{namespace}" and version "{version}".')
+        if self._schema_validation and handler._schema_validator is None:
+            # The schema of a version is loaded only when the first document of the version is found
+            handler._schema_validator = SchemaHelper.get_schema_validator(self._SCHEMA_NAMES[version])
+        return handler
+
+    def transform(self, source:str|bytes) -> dict:
+        """Transform XML from file path or bytes to dict extracting its data.
+
+        Args:
+            source (str | bytes): File path or content of the XML.
+
+        Returns:
+            dict: Dict containing data from CFDI, with key cfdi33 or cfdi40 according to its version.
+        """
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            return self.transform_from_bytes(source)
+        return self.transform_from_file(os.fspath(source))
+
+    def transform_from_file(self, file_path:str) -> dict:
+        if not '.xml' in file_path:
+            raise ValueError('Incorrect type of document, only support XML files')
+        self._last_handler = self.get_handler(file_path)
+        return self._last_handler.transform_from_file(file_path)
+
+    def transform_from_bytes(self, xml_bytes:bytes) -> dict:
+        self._last_handler = self.get_handler(xml_bytes)
+        return self._last_handler.transform_from_bytes(xml_bytes)
+
+    def transform_from_string(self, xml_str:str) -> dict:
+        self._last_handler = self.get_handler(xml_str.encode())
+        return self._last_handler.transform_from_string(xml_str)
+
+    def iter_concepts(self, source:str|bytes) -> Iterator[dict]:
+        """Iterates the concepts of a CFDI 3.3 or 4.0 from file path or bytes while the document is parsed.
+
+        Args:
+            source (str | bytes): File path or content of the XML.
+
+        Returns:
+            Iterator[dict]: Dicts containing data from the concepts.
+        """
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            return self.get_handler(source).iter_concepts(io.BytesIO(source))
+        source = os.fspath(source)
+        return self.get_handler(source).iter_concepts(source)
+
+    def use_schema_validation(self) -> CFDIAutoSAXHandler:
+        """Validate every document with the schema of its version registered in `SchemaHelper`, handlers with a validator
+        provided in the constructor keep it. Each schema is loaded the first time a document of its version is transformed,
+        a document whose version has not a schema in the package raises `FileNotFoundError`.
+
+        Returns:
+            CFDIAutoSAXHandler: Instance of configured class.
+        """
+        self._schema_validation = True
+        return self
+
+    def use_nomina12(self) -> CFDIAutoSAXHandler:
+        self._cfdi33_handler.use_nomina12()
+        self._cfdi40_handler.use_nomina12()
+        return self
+
+    def use_pagos10(self) -> CFDIAutoSAXHandler:
+        """Pagos 1.0 is only supported for CFDI 3.3."""
+        self._cfdi33_handler.use_pagos10()
+        return self
+
+    def use_strict_parse(self) -> CFDIAutoSAXHandler:
+        self._cfdi33_handler.use_strict_parse()
+        self._cfdi40_handler.use_strict_parse()
+        return self
+
+    def use_validation_sample(self, rate:float, seed:int = None) -> CFDIAutoSAXHandler:
+        self._cfdi33_handler.use_validation_sample(rate, seed)
+        self._cfdi40_handler.use_validation_sample(rate, seed)
+        return self
+
+    def use_deferred_validation(self, max_workers:int = None) -> CFDIAutoSAXHandler:
+        self._cfdi33_handler.use_deferred_validation(max_workers)
+        self._cfdi40_handler.use_deferred_validation(max_workers)
+        return self
+
+    def wait_validations(self) -> list[dict]:
+        return self._cfdi33_handler.wait_validations() + self._cfdi40_handler.wait_validations()
+
+    def close(self) -> None:
+        self._cfdi33_handler.close()
+        self._cfdi40_handler.close()
+
+    def __enter__(self) -> CFDIAutoSAXHandler:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @property
+    def recovered(self) -> bool:
+        return self._last_handler is not None and self._last_handler.recovered
+
+    @property
+    def recovered_count(self) -> int:
+        return self._cfdi33_handler.recovered_count + self._cfdi40_handler.recovered_count
+
+    def use_implocal10(self) -> CFDIAutoSAXHandler:
+        self._cfdi33_handler.use_implocal10()
+        self._cfdi40_handler.use_implocal10()
+        return self
+
+    def use_concepts(self) -> CFDIAutoSAXHandler:
+        self._cfdi33_handler.use_concepts_cfdi33()
+        self._cfdi40_handler.use_concepts_cfdi40()
+        return self
+
+    def use_fields(self, fields:list[str]) -> CFDIAutoSAXHandler:
+        self._cfdi33_handler.use_fields(fields)
+        self._cfdi40_handler.use_fields(fields)
+        return self
+
+def transform_auto(source:str|bytes) -> dict:
+    """Transform a CFDI 3.3 or 4.0 from file path or bytes with the default configuration.
+
+    Args:
+        source (str | bytes): File path or content of the XML.
+
+    Returns:
+        dict: Dict containing data from CFDI, with key cfdi33 or cfdi40 according to its version.
+    """
+    return CFDIAutoSAXHandler().transform(source)
@@ -1,124 +1,293 @@
 
 from __future__ import annotations
 from pycfdi_transform.sax.cfdi33.base_handler import BaseHandler
-from pycfdi_transform.helpers.string_helper import StringHelper
+from pycfdi_transform.helpers.fields_helper import FieldsHelper
+from pycfdi_transform.sax.tfd11.sax_handler import TFD11SAXHandler
 from lxml import etree
+from pycfdi_transform.helpers.parser_helper import ParserHelper
+from pycfdi_transform.helpers.compression_helper import CompressionHelper
+from typing import Iterator
 import logging
+from pycfdi_transform.helpers.error_helper import ErrorHelper
 
 class CFDI33SAXHandler(BaseHandler):
+    _COMPROBANTE_FIELDS = (
+        ('version', 'Version', FieldsHelper.REQUIRED, False),
+        ('serie', 'Serie', FieldsHelper.EMPTY, True),
+        ('folio', 'Folio', FieldsHelper.EMPTY, True),
+        ('fecha', 'Fecha', FieldsHelper.REQUIRED, False),
+        ('no_certificado', 'NoCertificado', FieldsHelper.REQUIRED, False),
+        ('subtotal', 'SubTotal', FieldsHelper.REQUIRED, False),
+        ('descuento', 'Descuento', FieldsHelper.SAFE_NUMBER_CERO, False),
+        ('total', 'Total', FieldsHelper.REQUIRED, False),
+        ('moneda', 'Moneda', FieldsHelper.REQUIRED, False),
+        ('tipo_cambio', 'TipoCambio', FieldsHelper.SAFE_NUMBER_ONE, False),
+        ('tipo_comprobante', 'TipoDeComprobante', FieldsHelper.REQUIRED, False),
+        ('metodo_pago', 'MetodoPago', FieldsHelper.EMPTY, False),
+        ('forma_pago', 'FormaPago', FieldsHelper.EMPTY, False),
+        ('condiciones_pago', 'CondicionesDePago', FieldsHelper.EMPTY, True),
+        ('lugar_expedicion', 'LugarExpedicion', FieldsHelper.REQUIRED, False),
+        ('sello', 'Sello', FieldsHelper.REQUIRED, True),
+        ('certificado', 'Certificado', FieldsHelper.REQUIRED, True),
+        ('confirmacion', 'Confirmacion', FieldsHelper.EMPTY, False)
+    )
+    _EMISOR_FIELDS = (
+        ('rfc', 'Rfc', FieldsHelper.REQUIRED, False),
+        ('nombre', 'Nombre', FieldsHelper.EMPTY, True),
+        ('regimen_fiscal', 'RegimenFiscal', FieldsHelper.REQUIRED, False)
+    )
+    _RECEPTOR_FIELDS = (
+        ('rfc', 'Rfc', FieldsHelper.REQUIRED, False),
+        ('nombre', 'Nombre', FieldsHelper.EMPTY, True),
+        ('residencia_fiscal', 'ResidenciaFiscal', FieldsHelper.EMPTY, False),
+        ('num_reg_id_trib', 'NumRegIdTrib', FieldsHelper.EMPTY, True),
+        ('uso_cfdi', 'UsoCFDI', FieldsHelper.REQUIRED, False)
+    )
+    _CONCEPTO_FIELDS = (
+        ('clave_prod_serv', 'ClaveProdServ', FieldsHelper.REQUIRED, False),
+        ('no_identificacion', 'NoIdentificacion', FieldsHelper.EMPTY, True),
+        ('cantidad', 'Cantidad', FieldsHelper.REQUIRED, False),
+        ('clave_unidad', 'ClaveUnidad', FieldsHelper.REQUIRED, False),
+        ('unidad', 'Unidad', FieldsHelper.EMPTY, True),
+        ('descripcion', 'Descripcion', FieldsHelper.REQUIRED, True),
+        ('valor_unitario', 'ValorUnitario', FieldsHelper.REQUIRED, False),
+        ('importe', 'Importe', FieldsHelper.REQUIRED, False),
+        ('descuento', 'Descuento', FieldsHelper.SAFE_NUMBER_CERO, False)
+    )
+    _IMPUESTOS_FIELDS = (
+        ('total_impuestos_traslados', 'TotalImpuestosTrasladados', FieldsHelper.SAFE_NUMBER_CERO, False),
+        ('total_impuestos_retenidos', 'TotalImpuestosRetenidos', FieldsHelper.SAFE_NUMBER_CERO, False)
+    )
+
     def __init__(self, empty_char='', safe_numerics=False, schema_validator:etree.XMLSchema = None,esc_delimiters:str = "") -> CFDI33SAXHandler:
         super().__init__(empty_char, safe_numerics,esc_delimiters)
         self._schema_validator = schema_validator
         self._logger = logging.getLogger('CFDI33SAXHandler')
         self._inside_concepts = False
+        self._stream_complements = []
     
     def transform_from_file(self, file_path:str) -> dict:
         if ('.xml' in file_path):
-            return self.transform_from_string(StringHelper.file_path_to_string(file_path))
+            try:
+                call = self.__new_call()
+                tree, recovered = ParserHelper.parse_file(file_path, self._config['strict_parse'])
+                call._set_recovered(recovered)
+                call.__transform_tree(tree, file_path)
+                return self._end_call(call)
+            except Exception as ex:
+                ErrorHelper.log_exception(self._logger, 'Caugth Exception at tranforming xml file.')
+                raise ex
         else:
             raise ValueError('Incorrect type of document, only support XML files')
+    
+    def transform_from_bytes(self, xml_bytes:bytes) -> dict:
+        try:
+            call = self.__new_call()
+            tree, recovered = ParserHelper.parse_xml(xml_bytes, self._config['strict_parse'])
+            call._set_recovered(recovered)
+            call.__transform_tree(tree, xml_bytes)
+            return self._end_call(call)
+        except Exception as ex:
+            ErrorHelper.log_exception(self._logger, 'Caugth Exception at tranforming xml bytes.')
+            raise ex
+
     def transform_from_string(self, xml_str:str) -> dict:
         try:
-            self._clean_data()
-            xml_parser = etree.XMLParser(encoding='utf-8', recover=True)
-            tree = etree.XML(xml_str.encode(), parser=xml_parser)
-            if not 'cfdi' in tree.nsmap or tree.nsmap['cfdi'] != 'http://www.sat.gob.mx/cfd/3':
+            call = self.__new_call()
+            xml_bytes = xml_str.encode()
+            tree, recovered = ParserHelper.parse_xml(xml_bytes, self._config['strict_parse'], encoding='utf-8')
+            call._set_recovered(recovered)
+            call.__transform_tree(tree, xml_bytes, encoding='utf-8')
+            return self._end_call(call)
+        except Exception as ex:
+            ErrorHelper.log_exception(self._logger, 'Caugth Exception at tranforming xml string.')
+            raise ex
+    
+    def transform_from_stream(self, source) -> dict:
+        if isinstance(source, str) and not '.xml' in source:
+            raise ValueError('Incorrect type of document, only support XML files')
+        if self._validation_executor is not None:
+            raise ValueError('Deferred validation is not supported by transform_from_stream, use transform_from_file.')
+        if isinstance(source, str) and CompressionHelper.is_compressed(source):
+            with CompressionHelper.open(source) as file:
+                return self.transform_from_stream(file)
+        try:
+            call = self.__new_call()
+            schema = self._get_schema_validator()
+            if not self._config['strict_parse']:
+                call.__transform_stream(etree.iterparse(source, events=("start", "end"), recover=True, schema=schema))
+                return self._end_call(call)
+            seekable = getattr(source, 'seekable', None)
+            position = source.tell() if seekable is not None and seekable() else None
+            try:
+                call.__transform_stream(etree.iterparse(source, events=("start", "end"), recover=False, schema=schema))
+            except etree.XMLSyntaxError:
+                # Like transform_from_file the document is parsed again in recover mode, only if the source can be read again
+                if not isinstance(source, str) and position is None:
+                    raise
+                if position is not None:
+                    source.seek(position)
+                call = self.__new_call()
+                call._set_recovered(True)
+                call.__transform_stream(etree.iterparse(source, events=("start", "end"), recover=True, schema=schema))
+            return self._end_call(call)
+        except Exception as ex:
+            ErrorHelper.log_exception(self._logger, 'Caugth Exception at tranforming xml stream.')
+            raise ex
+    
+    def iter_concepts(self, source) -> Iterator[dict]:
+        if isinstance(source, str) and not '.xml' in source:
+            raise ValueError('Incorrect type of document, only support XML files')
+        if isinstance(source, str) and CompressionHelper.is_compressed(source):
+            with CompressionHelper.open(source) as file:
+                yield from self.iter_concepts(file)
+            return
+        try:
+            if self._compiled_fields is None:
+                self._compiled_fields = self.__compile_fields()
+            compiled_fields = self._compiled_fields['conceptos']
+            if compiled_fields is None:
+                compiled_fields = FieldsHelper.compile_fields(self._CONCEPTO_FIELDS, 'cfdi33.conceptos', None, self._config['empty_char'], self._config['safe_numerics'])
+            schema = self._get_schema_validator()
+            context = etree.iterparse(source, events=("start", "end"), tag=('{http://www.sat.gob.mx/cfd/3}Comprobante', '{http://www.sat.gob.mx/cfd/3}Concepto'), recover=True, schema=schema)
+            root = None
+            for action, elem in context:
+                if elem.tag == '{http://www.sat.gob.mx/cfd/3}Comprobante':
+                    if action == 'start':
+                        if not 'Version' in elem.attrib or elem.attrib['Version'] != '3.3':
+                            raise ValueError('Incorrect type of CFDI, this handler only support CFDI version 3.3')
+                        root = elem
+                elif action == 'end':
+                    if root is None:
+                        break
+                    yield FieldsHelper.extract(elem.attrib, compiled_fields, self._config['esc_delimiters'], {})
+                    ParserHelper.free_element(elem)
+            if root is None:
                 raise ValueError('The CFDI does\'t have correct namespace for CFDI V3.3.')
-            if self._schema_validator != None and isinstance(self._schema_validator, etree.XMLSchema):
-                self._schema_validator.assertValid(tree)
-            context = etree.iterwalk(tree, events=("start", "end"))
-            self.__handle_events(context)
-            return self._data
         except Exception as ex:
-            self._logger.exception(f'Caugth Exception at tranforming xml string.')
+            ErrorHelper.log_exception(self._logger, 'Caugth Exception at iterating concepts.')
             raise ex
+    
+    def __transform_tree(self, tree:etree._Element, source, **options) -> None:
+        if not 'cfdi' in tree.nsmap or tree.nsmap['cfdi'] != 'http://www.sat.gob.mx/cfd/3':
+            raise ValueError('The CFDI does\'t have correct namespace for CFDI V3.3.')
+        self._validate(tree, source, **options)
+        context = etree.iterwalk(tree, events=("start", "end"))
+        self.__handle_events(context)
+
+    def __transform_stream(self, context:etree.iterparse) -> None:
+        _, root = next(context)
+        if not 'cfdi' in root.nsmap or root.nsmap['cfdi'] != 'http://www.sat.gob.mx/cfd/3':
+            raise ValueError('The CFDI does\'t have correct namespace for CFDI V3.3.')
+        self._stream_complements = []
+        self.__transform_comprobante(root)
+        self.__handle_stream_events(context)
+
+    def __new_call(self) -> CFDI33SAXHandler:
+        if self._compiled_fields is None:
+            self._compiled_fields = self.__compile_fields()
+        call = self._new_call()
+        call._inside_concepts = False
+        call._stream_complements = []
+        return call
+
+    def __compile_fields(self) -> dict:
+        fields = self._config['fields']
+        return {
+            'comprobante': FieldsHelper.compile_fields(self._COMPROBANTE_FIELDS, 'cfdi33', fields, self._config['empty_char'], self._config['safe_numerics']),
+            'emisor': FieldsHelper.compile_fields(self._EMISOR_FIELDS, 'cfdi33.emisor', fields, self._config['empty_char'], self._config['safe_numerics']),
+            'receptor': FieldsHelper.compile_fields(self._RECEPTOR_FIELDS, 'cfdi33.receptor', fields, self._config['empty_char'], self._config['safe_numerics']),
+            'conceptos': FieldsHelper.compile_fields(self._CONCEPTO_FIELDS, 'cfdi33.conceptos', fields, self._config['empty_char'], self._config['safe_numerics']) if FieldsHelper.is_requested(fields, 'cfdi33.conceptos') else None,
+            'impuestos': FieldsHelper.compile_fields(self._IMPUESTOS_FIELDS, 'cfdi33.impuestos', fields, self._config['empty_char'], self._config['safe_numerics']),
+            'traslados': FieldsHelper.is_requested(fields, 'cfdi33.impuestos.traslados'),
+            'retenciones': FieldsHelper.is_requested(fields, 'cfdi33.impuestos.retenciones'),
+            'complementos': FieldsHelper.is_requested(fields, 'cfdi33.complementos'),
+            'addendas': FieldsHelper.is_requested(fields, 'cfdi33.addendas')
+        }
 
     def __handle_events(self, context:etree.iterwalk) -> None:
+        start_handlers = self._START_HANDLERS
+        end_handlers = self._END_HANDLERS
         for action, elem in context:
             if action == 'start':
                 if elem.prefix != 'cfdi':
                     context.skip_subtree()
-                elif elem.tag == '{http://www.sat.gob.mx/cfd/3}Comprobante':
-                    self.__transform_comprobante(elem)
-                elif elem.tag == '{http://www.sat.gob.mx/cfd/3}Emisor':
-                    self.__transform_emisor(elem)
-                elif elem.tag == '{http://www.sat.gob.mx/cfd/3}Receptor':
-                    self.__transform_receptor(elem)
-                elif elem.tag == '{http://www.sat.gob.mx/cfd/3}Conceptos':
-                    self._inside_concepts = True
-            elif action == 'end':
-                if elem.tag == '{http://www.sat.gob.mx/cfd/3}Conceptos':
-                    self._inside_concepts = False
-                    elem.clear()
-                elif elem.tag == '{http://www.sat.gob.mx/cfd/3}Concepto' and self._config['concepts']:
-                    self.__transform_concept(elem)
-                    elem.clear()
-                elif elem.tag == '{http://www.sat.gob.mx/cfd/3}Impuestos' and not self._inside_concepts:
-                    self.__transform_general_taxes(elem)
-                elif elem.tag == '{http://www.sat.gob.mx/cfd/3}Complemento':
-                    self.__transform_complement(elem)
-                elif elem.tag == '{http://www.sat.gob.mx/cfd/3}Addenda':
-                    self.__transform_addenda(elem)
+                    continue
+                handler = start_handlers.get(elem.tag)
+            else:
+                handler = end_handlers.get(elem.tag)
+            if handler is not None:
+                handler(self, elem)
+    
+    def __handle_stream_events(self, context:etree.iterparse) -> None:
+        start_handlers = self._START_HANDLERS
+        end_handlers = self._STREAM_END_HANDLERS
+        for action, elem in context:
+            if action == 'start':
+                if elem.prefix != 'cfdi':
+                    self.__transform_stream_subtree(context, elem)
+                    continue
+                handler = start_handlers.get(elem.tag)
+            else:
+                handler = end_handlers.get(elem.tag)
+            if handler is not None:
+                handler(self, elem)
+    
+    def __transform_stream_subtree(self, context:etree.iterparse, element:etree._Element) -> None:
+        parent = element.getparent()
+        transformer = None
+        if parent is not None and parent.tag == '{http://www.sat.gob.mx/cfd/3}Complemento':
+            transformer = self.__get_complement_transformer(element)
+        if transformer is not None:
+            self.__append_complement(element, transformer.transform_from_events(context, element))
+            self._stream_complements.append(element)
+            element.clear(keep_tail=True)
+        else:
+            ParserHelper.skip_subtree(context, element)
+    
+    def __start_concepts(self, element:etree._Element) -> None:
+        self._inside_concepts = True
+    
+    def __end_concepts(self, element:etree._Element) -> None:
+        self._inside_concepts = False
+        element.clear()
+    
+    def __end_concept(self, element:etree._Element) -> None:
+        if self._config['concepts']:
+            self.__transform_concept(element)
+            element.clear()
+    
+    def __end_stream_concept(self, element:etree._Element) -> None:
+        if self._config['concepts']:
+            self.__transform_concept(element)
+        ParserHelper.free_element(element)
+    
+    def __end_taxes(self, element:etree._Element) -> None:
+        if not self._inside_concepts:
+            self.__transform_general_taxes(element)
 
     def __transform_comprobante(self, element:etree._Element) -> None:
         if not 'Version' in element.attrib or element.attrib['Version'] != '3.3':
             raise ValueError('Incorrect type of CFDI, this handler only support CFDI version 3.3')
-        self._data['cfdi33']['version'] = element.attrib.get('Version')
-        self._data['cfdi33']['serie'] = StringHelper.compact_string(self._config['esc_delimiters'],element.attrib.get('Serie', self._config['empty_char']))
-        self._data['cfdi33']['folio'] = StringHelper.compact_string(self._config['esc_delimiters'],element.attrib.get('Folio', self._config['empty_char']))
-        self._data['cfdi33']['fecha'] = element.attrib.get('Fecha')
-        self._data['cfdi33']['no_certificado'] = element.attrib.get('NoCertificado')
-        self._data['cfdi33']['subtotal'] = element.attrib.get('SubTotal')
-        self._data['cfdi33']['descuento'] = element.attrib.get('Descuento', StringHelper.DEFAULT_SAFE_NUMBER_CERO if self._config['safe_numerics'] else self._config['empty_char'])
-        self._data['cfdi33']['total'] = element.attrib.get('Total')
-        self._data['cfdi33']['moneda'] = element.attrib.get('Moneda')
-        self._data['cfdi33']['tipo_cambio'] = element.attrib.get('TipoCambio', StringHelper.DEFAULT_SAFE_NUMBER_ONE if self._config['safe_numerics'] else self._config['empty_char'])
-        self._data['cfdi33']['tipo_comprobante'] = element.attrib.get('TipoDeComprobante')
-        self._data['cfdi33']['metodo_pago'] = element.attrib.get('MetodoPago', self._config['empty_char'])
-        self._data['cfdi33']['forma_pago'] = element.attrib.get('FormaPago', self._config['empty_char'])
-        self._data['cfdi33']['condiciones_pago'] = StringHelper.compact_string(self._config['esc_delimiters'],element.attrib.get('CondicionesDePago', self._config['empty_char']))
-        self._data['cfdi33']['lugar_expedicion'] = element.attrib.get('LugarExpedicion')
-        self._data['cfdi33']['sello'] = StringHelper.compact_string(self._config['esc_delimiters'],element.attrib.get('Sello'))
-        self._data['cfdi33']['certificado'] = StringHelper.compact_string(self._config['esc_delimiters'],element.attrib.get('Certificado'))
-        self._data['cfdi33']['confirmacion'] = element.attrib.get('Confirmacion', self._config['empty_char'])
+        FieldsHelper.extract(element.attrib, self._compiled_fields['comprobante'], self._config['esc_delimiters'], self._data['cfdi33'])
     
     def __transform_emisor(self, element:etree._Element) -> None:
-        self._data['cfdi33']['emisor'] = {
-            'rfc': element.attrib.get('Rfc'),
-            'nombre': StringHelper.compact_string(self._config['esc_delimiters'],element.attrib.get('Nombre', self._config['empty_char'])),
-            'regimen_fiscal': element.attrib.get('RegimenFiscal')
-        }
+        FieldsHelper.extract(element.attrib, self._compiled_fields['emisor'], self._config['esc_delimiters'], self._data['cfdi33']['emisor'])
 
     def __transform_receptor(self, element:etree._Element) -> None:
-        self._data['cfdi33']['receptor'] = {
-            'rfc': element.attrib.get('Rfc'),
-            'nombre': StringHelper.compact_string(self._config['esc_delimiters'],element.attrib.get('Nombre', self._config['empty_char'])),
-            'residencia_fiscal': element.attrib.get('ResidenciaFiscal', self._config['empty_char']),
-            'num_reg_id_trib': StringHelper.compact_string(self._config['esc_delimiters'],element.attrib.get('NumRegIdTrib', self._config['empty_char'])),
-            'uso_cfdi': element.attrib.get('UsoCFDI'),
-        }
+        FieldsHelper.extract(element.attrib, self._compiled_fields['receptor'], self._config['esc_delimiters'], self._data['cfdi33']['receptor'])
     
     def __transform_concept(self, element:etree._Element) -> None:
-        concept = {
-            'clave_prod_serv': element.attrib.get('ClaveProdServ'),
-            'no_identificacion': StringHelper.compact_string(self._config['esc_delimiters'],element.attrib.get('NoIdentificacion', self._config['empty_char'])),
-            'cantidad': element.attrib.get('Cantidad'),
-            'clave_unidad': element.attrib.get('ClaveUnidad'),
-            'unidad': StringHelper.compact_string(self._config['esc_delimiters'],element.attrib.get('Unidad', self._config['empty_char'])),
-            'descripcion': StringHelper.compact_string(self._config['esc_delimiters'],element.attrib.get('Descripcion')),
-            'valor_unitario': element.attrib.get('ValorUnitario'),
-            'importe': element.attrib.get('Importe'),
-            'descuento': element.attrib.get('Descuento', StringHelper.DEFAULT_SAFE_NUMBER_CERO if self._config['safe_numerics'] else self._config['empty_char']),
-        }
-        self._data['cfdi33']['conceptos'].append(concept)
+        if self._compiled_fields['conceptos'] is not None:
+            concept = FieldsHelper.extract(element.attrib, self._compiled_fields['conceptos'], self._config['esc_delimiters'], {})
+            self._data['cfdi33']['conceptos'].append(concept)
     
     def __transform_general_taxes(self, element:etree._Element) -> None:
-        self._data['cfdi33']['impuestos']['total_impuestos_traslados'] = element.attrib.get('TotalImpuestosTrasladados', StringHelper.DEFAULT_SAFE_NUMBER_CERO if self._config['safe_numerics'] else self._config['empty_char'])
-        self._data['cfdi33']['impuestos']['total_impuestos_retenidos'] = element.attrib.get('TotalImpuestosRetenidos', StringHelper.DEFAULT_SAFE_NUMBER_CERO if self._config['safe_numerics'] else self._config['empty_char'])
+        FieldsHelper.extract(element.attrib, self._compiled_fields['impuestos'], self._config['esc_delimiters'], self._data['cfdi33']['impuestos'])
         for child in element.getchildren():
-            if child.tag == '{http://www.sat.gob.mx/cfd/3}Traslados':
+            if child.tag == '{http://www.sat.gob.mx/cfd/3}Traslados' and self._compiled_fields['traslados']:
                 self.__transform_taxes_traslados(child.getchildren())
-            elif child.tag == '{http://www.sat.gob.mx/cfd/3}Retenciones':
+            elif child.tag == '{http://www.sat.gob.mx/cfd/3}Retenciones' and self._compiled_fields['retenciones']:
                 self.__transform_taxes_retenciones(child.getchildren())
 
     def __transform_taxes_traslados(self, list_elements:list[etree._Element]) -> None:
@@ -144,18 +313,45 @@ class CFDI33SAXHandler(BaseHandler):
             )
     
     def __transform_complement(self, element:etree._Element) -> None:
+        for complement in element.getchildren():
+            transformer = self.__get_complement_transformer(complement)
+            if transformer is not None:
+                self.__append_complement(complement, transformer.transform_from_element(complement))
+                del transformer
+        self.__annotate_complements(element)
+    
+    def __end_stream_complement(self, element:etree._Element) -> None:
+        # Recovered documents may report a complement inside the events of other complement
+        for complement in element.getchildren():
+            if any(complement is transformed for transformed in self._stream_complements):
+                continue
+            transformer = self.__get_complement_transformer(complement)
+            if transformer is not None:
+                self.__append_complement(complement, transformer.transform_from_element(complement))
+        self._stream_complements = []
+        self.__annotate_complements(element)
+    
+    def __get_complement_transformer(self, element:etree._Element) -> object:
+        complement = self._complements.get(element.tag)
+        if complement is None or not FieldsHelper.is_requested(self._config['fields'], complement['key']):
+            return None
+        #Forces new instance of class
+        transformer = complement['class'](self._config['empty_char'], self._config['safe_numerics'])
+        if self._config['fields'] is not None and isinstance(transformer, TFD11SAXHandler):
+            transformer.use_fields(self._config['fields'])
+        return transformer
+    
+    def __append_complement(self, element:etree._Element, complement_data:dict) -> None:
+        key = self._complements[element.tag]['key']
+        if not key in self._data:
+            self._data[key] = []
+        self._data[key].append(complement_data)
+    
+    def __annotate_complements(self, element:etree._Element) -> None:
+        if not self._compiled_fields['complementos']:
+            return
         complements = []
         for complement in element.getchildren():
-            # Transform complement
-            if complement.tag in self._complements:
-                #Forces new instance of class
-                transformer = self._complements[complement.tag]['class'](self._config['empty_char'], self._config['safe_numerics'])
-                complement_data = transformer.transform_from_string(etree.tostring(complement, encoding='utf-8'))
-                if not self._complements[complement.tag]['key'] in self._data:
-                    self._data[self._complements[complement.tag]['key']] = []
-                self._data[self._complements[complement.tag]['key']].append(complement_data)
-                del transformer, complement_data
-            # Annotate in complement list
             try:
                 qname = etree.QName(complement.tag)
                 if not qname.localname in complements:
@@ -166,6 +362,8 @@ class CFDI33SAXHandler(BaseHandler):
             self._data['cfdi33']['complementos'] = ' '.join(complements)
     
     def __transform_addenda(self, element:etree._Element) -> None:
+        if not self._compiled_fields['addendas']:
+            return
         addendas = []
         for addenda in element.getchildren():
             try:
@@ -175,4 +373,23 @@ class CFDI33SAXHandler(BaseHandler):
             except Exception:
                 addendas.append(str(addenda.tag))
         if len(addendas) > 0:
-            self._data['cfdi33']['addendas'] = ' '.join(addendas)
\ No newline at end of file
+            self._data['cfdi33']['addendas'] = ' '.join(addendas)
+
+    _START_HANDLERS = {
+        '{http://www.sat.gob.mx/cfd/3}Comprobante': __transform_comprobante,
+        '{http://www.sat.gob.mx/cfd/3}Emisor': __transform_emisor,
+        '{http://www.sat.gob.mx/cfd/3}Receptor': __transform_receptor,
+        '{http://www.sat.gob.mx/cfd/3}Conceptos': __start_concepts
+    }
+    _END_HANDLERS = {
+        '{http://www.sat.gob.mx/cfd/3}Conceptos': __end_concepts,
+        '{http://www.sat.gob.mx/cfd/3}Concepto': __end_concept,
+        '{http://www.sat.gob.mx/cfd/3}Impuestos': __end_taxes,
+        '{http://www.sat.gob.mx/cfd/3}Complemento': __transform_complement,
+        '{http://www.sat.gob.mx/cfd/3}Addenda': __transform_addenda
+    }
+    _STREAM_END_HANDLERS = {
+        **_END_HANDLERS,
+        '{http://www.sat.gob.mx/cfd/3}Concepto': __end_stream_concept,
+        '{http://www.sat.gob.mx/cfd/3}Complemento': __end_stream_complement
+    }
\ No newline at end of file
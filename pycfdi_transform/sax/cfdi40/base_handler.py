@@ -1,5 +1,11 @@
 from __future__ import annotations
+import random
+import threading
+import weakref
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from lxml import etree
+from pycfdi_transform.helpers.parser_helper import ParserHelper
 from pycfdi_transform.helpers.string_helper import StringHelper
 from pycfdi_transform.sax.tfd11.sax_handler import TFD11SAXHandler
 from pycfdi_transform.sax.implocal10.sax_handler import ImpLocal10SAXHandler
@@ -16,14 +22,29 @@ class BaseHandler(ABC):
         esc_delimiters : str, default: ''
                     Characters to remove from data, useful if your final format is text like csv and remove "," from data.
     """
+    _DEFAULT_DATA_TEMPLATES = {}
+
     def __init__(self, empty_char:str = '', safe_numerics:bool = False, esc_delimiters:str = "") -> BaseHandler:
         super().__init__()
         self._config = {
             'concepts': False,
             'empty_char': empty_char,
             'safe_numerics': safe_numerics,
-            'esc_delimiters': esc_delimiters
+            'esc_delimiters': esc_delimiters,
+            'fields': None,
+            'strict_parse': False,
+            'validation_sample_rate': 1.0
         }
+        self._schema_validator = None
+        self._random = random.Random()
+        self._validation_executor = None
+        self._validation_finalizer = None
+        self._deferred_validation = None
+        self._pending_validations = []
+        self._compiled_fields = None
+        self.recovered = False
+        self.recovered_count = 0
+        self._lock = threading.Lock()
         self._complements = {
             '{http://www.sat.gob.mx/TimbreFiscalDigital}TimbreFiscalDigital': {
                 'class': TFD11SAXHandler,
@@ -34,55 +55,82 @@ class BaseHandler(ABC):
         
     def _get_default_data(self):
         """Obtain a clean dictionay
+        The defaults are computed once per (empty_char, safe_numerics) configuration and copied for every document.
 
         Returns:
             dict: dict containing basic fields with default values.
         """
+        key = (self._config['empty_char'], self._config['safe_numerics'])
+        template = BaseHandler._DEFAULT_DATA_TEMPLATES.get(key)
+        if template is None:
+            template = BaseHandler._DEFAULT_DATA_TEMPLATES[key] = BaseHandler._build_default_data(*key)
+        cfdi = template['cfdi40']
+        data = cfdi.copy()
+        data['emisor'] = cfdi['emisor'].copy()
+        data['receptor'] = cfdi['receptor'].copy()
+        data['conceptos'] = []
+        impuestos = data['impuestos'] = cfdi['impuestos'].copy()
+        impuestos['retenciones'] = []
+        impuestos['traslados'] = []
+        return {
+            'cfdi40': data,
+            'tfd11': []
+        }
+    
+    @staticmethod
+    def _build_default_data(empty_char:str, safe_numerics:bool) -> dict:
+        """Build the dictionary with default values used as template by `_get_default_data`.
+
+        Returns:
+            dict: dict containing basic fields with default values.
+        """
+        safe_number_cero = StringHelper.DEFAULT_SAFE_NUMBER_CERO if safe_numerics else empty_char
+        safe_number_one = StringHelper.DEFAULT_SAFE_NUMBER_ONE if safe_numerics else empty_char
         return {
             'cfdi40': {
-                'version': self._config['empty_char'],
-                'serie': self._config['empty_char'],
-                'folio': self._config['empty_char'],
-                'fecha': self._config['empty_char'],
-                'no_certificado': self._config['empty_char'],
-                'subtotal': StringHelper.DEFAULT_SAFE_NUMBER_CERO if self._config['safe_numerics'] else self._config['empty_char'],
-                'descuento': StringHelper.DEFAULT_SAFE_NUMBER_CERO if self._config['safe_numerics'] else self._config['empty_char'],
-                'total': StringHelper.DEFAULT_SAFE_NUMBER_CERO if self._config['safe_numerics'] else self._config['empty_char'],
-                'moneda': self._config['empty_char'],
-                'tipo_cambio': StringHelper.DEFAULT_SAFE_NUMBER_ONE if self._config['safe_numerics'] else self._config['empty_char'],
-                'tipo_comprobante': self._config['empty_char'],
-                'metodo_pago': self._config['empty_char'],
-                'forma_pago': self._config['empty_char'],
-                'condiciones_pago': self._config['empty_char'],
-                'exportacion': self._config['empty_char'],
-                'lugar_expedicion': self._config['empty_char'],
-                'sello': self._config['empty_char'],
-                'certificado': self._config['empty_char'],
-                'confirmacion': self._config['empty_char'],
+                'version': empty_char,
+                'serie': empty_char,
+                'folio': empty_char,
+                'fecha': empty_char,
+                'no_certificado': empty_char,
+                'subtotal': safe_number_cero,
+                'descuento': safe_number_cero,
+                'total': safe_number_cero,
+                'moneda': empty_char,
+                'tipo_cambio': safe_number_one,
+                'tipo_comprobante': empty_char,
+                'metodo_pago': empty_char,
+                'forma_pago': empty_char,
+                'condiciones_pago': empty_char,
+                'exportacion': empty_char,
+                'lugar_expedicion': empty_char,
+                'sello': empty_char,
+                'certificado': empty_char,
+                'confirmacion': empty_char,
                 'emisor': {
-                    'rfc': self._config['empty_char'],
-                    'nombre': self._config['empty_char'],
-                    'regimen_fiscal': self._config['empty_char'],
-                    'fac_atr_adquirente': self._config['empty_char']
+                    'rfc': empty_char,
+                    'nombre': empty_char,
+                    'regimen_fiscal': empty_char,
+                    'fac_atr_adquirente': empty_char
                 },
                 'receptor': {
-                    'rfc': self._config['empty_char'],
-                    'nombre': self._config['empty_char'],
-                    'domicilio_fiscal_receptor': self._config['empty_char'],
-                    'residencia_fiscal': self._config['empty_char'],
-                    'num_reg_id_trib': self._config['empty_char'],
-                    'regimen_fiscal_receptor': self._config['empty_char'],
-                    'uso_cfdi': self._config['empty_char'],
+                    'rfc': empty_char,
+                    'nombre': empty_char,
+                    'domicilio_fiscal_receptor': empty_char,
+                    'residencia_fiscal': empty_char,
+                    'num_reg_id_trib': empty_char,
+                    'regimen_fiscal_receptor': empty_char,
+                    'uso_cfdi': empty_char,
                 },
                 'conceptos': [],
                 'impuestos': {
                     'retenciones': [],
                     'traslados': [],
-                    'total_impuestos_traslados' : StringHelper.DEFAULT_SAFE_NUMBER_CERO if self._config['safe_numerics'] else self._config['empty_char'],
-                    'total_impuestos_retenidos' : StringHelper.DEFAULT_SAFE_NUMBER_CERO if self._config['safe_numerics'] else self._config['empty_char']
+                    'total_impuestos_traslados' : safe_number_cero,
+                    'total_impuestos_retenidos' : safe_number_cero
                 },
-                'complementos': self._config['empty_char'],
-                'addendas': self._config['empty_char']
+                'complementos': empty_char,
+                'addendas': empty_char
             },
             'tfd11': []
         }
@@ -109,6 +157,93 @@ class BaseHandler(ABC):
         self._config['concepts'] = True
         return self
     
+    def use_fields(self, fields:list[str]) -> BaseHandler:
+        """Extract only the given fields, the attributes of fields not requested are never read and keep their default value.
+        Fields are dotted paths of the result dict like `cfdi40.emisor.rfc`, a path selects everything below it (e.g. `cfdi40.emisor` or `nomina12`).
+        To extract only the fields used by a formatter use `use_fields(CDACFDI40Formatter.get_fields_names())`.
+
+        Args:
+            fields (list[str]): Paths of the fields to extract. None extracts all fields.
+
+        Returns:
+            BaseHandler: Instance of configured class.
+        """
+        self._config['fields'] = frozenset(fields) if fields is not None else None
+        self._compiled_fields = None
+        return self
+    
+    def use_strict_parse(self) -> BaseHandler:
+        """Parse documents without recover mode and only parse again with `recover=True` the documents
+        that are not well formed. After every transform `recovered` indicates if the document needed recovery
+        and `recovered_count` counts the recovered documents.
+
+        Returns:
+            BaseHandler: Instance of configured class.
+        """
+        self._config['strict_parse'] = True
+        return self
+    
+    def use_validation_sample(self, rate:float, seed:int = None) -> BaseHandler:
+        """Validate against the schema only a random sample of the documents, the documents not sampled are not validated.
+
+        Args:
+            rate (float): Fraction of the documents to validate, between 0.0 and 1.0.
+            seed (int, optional): Seed of the random sample. Defaults to None.
+
+        Returns:
+            BaseHandler: Instance of configured class.
+        """
+        self._config['validation_sample_rate'] = rate
+        self._random = random.Random(seed)
+        return self
+    
+    def use_deferred_validation(self, max_workers:int = None) -> BaseHandler:
+        """Validate against the schema after the extraction in a pool of threads, so transforms do not wait for the validation.
+        Invalid documents are not raised, `wait_validations` waits the pending validations and annotates the result of every
+        validated document with the key `validation` containing `valid` and `error`. Call `close` or use the handler as a
+        context manager to stop the threads.
+
+        Args:
+            max_workers (int, optional): Threads used to validate. Defaults to None.
+
+        Returns:
+            BaseHandler: Instance of configured class.
+        """
+        self.close()
+        self._validation_executor = ThreadPoolExecutor(max_workers=max_workers)
+        # The threads of the pool are stopped when the handler is collected or at exit if close is not called
+        self._validation_finalizer = weakref.finalize(self, self._validation_executor.shutdown, wait=False)
+        return self
+    
+    def wait_validations(self) -> list[dict]:
+        """Waits the validations pending since the last call.
+
+        Returns:
+            list[dict]: Results of the validated documents annotated with the key `validation`.
+        """
+        # The list is shared with the transforms running in other threads, it is emptied in place
+        pending_validations = self._pending_validations[:]
+        del self._pending_validations[:len(pending_validations)]
+        # The results are annotated in the thread of the caller, the workers only return the validation
+        results = []
+        for data, future in pending_validations:
+            data['validation'] = future.result()
+            results.append(data)
+        return results
+    
+    def close(self) -> None:
+        """Waits the pending validations and stops the threads of `use_deferred_validation`, next documents are validated inline."""
+        if self._validation_finalizer is not None:
+            self._validation_executor.shutdown(wait=True)
+            self._validation_finalizer.detach()
+            self._validation_executor = self._validation_finalizer = None
+    
+    def __enter__(self) -> BaseHandler:
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
     def use_implocal10(self) -> BaseHandler:
         """Activate the tranform in case of find complement implocal10 in invoice.
 
@@ -125,10 +260,78 @@ class BaseHandler(ABC):
     def _clean_data(self) -> None:
         self._data = self.data = self._get_default_data()
     
+    def _get_schema_validator(self) -> etree.XMLSchema:
+        if not isinstance(self._schema_validator, etree.XMLSchema):
+            return None
+        rate = self._config['validation_sample_rate']
+        if rate < 1.0 and self._random.random() >= rate:
+            return None
+        return self._schema_validator
+    
+    def _validate(self, tree:etree._Element, source, **options) -> None:
+        schema_validator = self._get_schema_validator()
+        if schema_validator is None:
+            return
+        if self._validation_executor is None:
+            schema_validator.assertValid(tree)
+        else:
+            # The tree is modified by the extraction, the source is parsed again in the worker once the extraction ends
+            if not isinstance(source, (str, bytes)):
+                source = bytes(source)
+            self._deferred_validation = (schema_validator, source, options)
+    
+    @staticmethod
+    def _validate_source(schema_validator:etree.XMLSchema, source, options:dict) -> dict:
+        try:
+            if isinstance(source, str):
+                tree, _ = ParserHelper.parse_file(source, **options)
+            else:
+                tree, _ = ParserHelper.parse_xml(source, **options)
+            schema_validator.assertValid(tree)
+            return {'valid': True, 'error': ''}
+        except Exception as ex:
+            return {'valid': False, 'error': str(ex)}
+    
+    def _new_call(self) -> BaseHandler:
+        """Builds the handler of a single transform. It shares the configuration of this handler and keeps its own
+        data, so the same handler can transform documents in several threads at the same time.
+
+        Returns:
+            BaseHandler: Handler used by a single transform.
+        """
+        call = object.__new__(type(self))
+        call.__dict__.update(self.__dict__)
+        call._clean_data()
+        call.recovered = False
+        call._deferred_validation = None
+        return call
+    
+    def _end_call(self, call:BaseHandler) -> dict:
+        """Publishes the result of a transform done by a handler built with `_new_call`.
+
+        Returns:
+            dict: Dict containing data from CFDI.
+        """
+        self._data = self.data = call._data
+        self.recovered = call.recovered
+        if call.recovered:
+            with self._lock:
+                self.recovered_count += 1
+        if call._deferred_validation is not None:
+            self._pending_validations.append((call._data, self._validation_executor.submit(BaseHandler._validate_source, *call._deferred_validation)))
+        return call._data
+    
+    def _set_recovered(self, recovered:bool) -> None:
+        self.recovered = recovered
+    
     @abstractmethod
     def transform_from_file(self, file_path:str) -> dict:
         raise NotImplementedError
     
     @abstractmethod
     def transform_from_string(self, xml_str:str) -> dict:
+        raise NotImplementedError
+    
+    @abstractmethod
+    def transform_from_bytes(self, xml_bytes:bytes) -> dict:
         raise NotImplementedError
\ No newline at end of file
@@ -1,7 +1,9 @@
 from __future__ import annotations
 from pycfdi_transform.sax.implocal10.base_handler import BaseHandler
 from lxml import etree
+from pycfdi_transform.helpers.parser_helper import ParserHelper
 import logging
+from pycfdi_transform.helpers.error_helper import ErrorHelper
 
 class ImpLocal10SAXHandler(BaseHandler):
     def __init__(self, empty_char='', safe_numerics=False,esc_delimiters:str = "") -> ImpLocal10SAXHandler:
@@ -10,13 +12,29 @@ class ImpLocal10SAXHandler(BaseHandler):
     
     def transform_from_string(self, xml_str:str) -> dict:
         try:
-            xml_parser = etree.XMLParser(encoding='utf-8', recover=True)
+            xml_parser = ParserHelper.get_parser(encoding='utf-8', recover=True)
             tree = etree.XML(xml_str, parser=xml_parser)
-            context = etree.iterwalk(tree, events=("start", "end"))
+        except Exception as ex:
+            ErrorHelper.log_exception(self._logger, 'Caugth Exception at tranforming xml string.')
+            raise ex
+        return self.transform_from_element(tree)
+    
+    def transform_from_element(self, element:etree._Element) -> dict:
+        try:
+            context = etree.iterwalk(element, events=("start", "end"))
             self.__handle_events(context)
             return self._data
         except Exception as ex:
-            self._logger.exception(f'Caugth Exception at tranforming xml string.')
+            ErrorHelper.log_exception(self._logger, 'Caugth Exception at tranforming xml element.')
+            raise ex
+    
+    def transform_from_events(self, context:etree.iterparse, element:etree._Element) -> dict:
+        try:
+            self.__transform_implocal(element)
+            ParserHelper.skip_subtree(context, element)
+            return self._data
+        except Exception as ex:
+            ErrorHelper.log_exception(self._logger, 'Caugth Exception at tranforming xml events.')
             raise ex
 
     def __handle_events(self, context:etree.iterwalk) -> None:
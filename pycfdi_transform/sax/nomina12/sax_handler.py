@@ -1,8 +1,10 @@
 from __future__ import annotations
 import logging
 from lxml import etree
+from pycfdi_transform.helpers.parser_helper import ParserHelper
 from pycfdi_transform.helpers.string_helper import StringHelper
 from pycfdi_transform.sax.nomina12.base_handler import BaseHandler
+from pycfdi_transform.helpers.error_helper import ErrorHelper
 
 class Nomina12SAXHandler(BaseHandler):
     def __init__(self, empty_char = '', safe_numerics = False,esc_delimiters:str = "") -> Nomina12SAXHandler:
@@ -11,51 +13,60 @@ class Nomina12SAXHandler(BaseHandler):
     
     def transform_from_string(self, xml_str:str) -> dict:
         try:
-            xml_parser = etree.XMLParser(encoding='utf-8', recover=True)
+            xml_parser = ParserHelper.get_parser(encoding='utf-8', recover=True)
             tree = etree.XML(xml_str, parser=xml_parser)
-            context = etree.iterwalk(tree, events=("start", "end"))
+        except Exception as ex:
+            ErrorHelper.log_exception(self._logger, 'Caugth Exception at tranforming xml string.')
+            raise ex
+        return self.transform_from_element(tree)
+    
+    def transform_from_element(self, element:etree._Element) -> dict:
+        try:
+            context = etree.iterwalk(element, events=("start", "end"))
             self.__handle_events(context)
             return self._data
         except Exception as ex:
-            self._logger.exception(f'Caugth Exception at tranforming xml string.')
+            ErrorHelper.log_exception(self._logger, 'Caugth Exception at tranforming xml element.')
+            raise ex
+    
+    def transform_from_events(self, context:etree.iterparse, element:etree._Element) -> dict:
+        try:
+            self.__handle_stream_events(context, element)
+            return self._data
+        except Exception as ex:
+            ErrorHelper.log_exception(self._logger, 'Caugth Exception at tranforming xml events.')
             raise ex
     
     def __handle_events(self, context:etree.iterwalk) -> None:
+        start_handlers = self._START_HANDLERS
+        end_handlers = self._END_HANDLERS
         for action, elem in context:
             if action == 'start':
                 if elem.prefix != 'nomina12':
                     context.skip_subtree()
-                elif elem.tag == '{http://www.sat.gob.mx/nomina12}Nomina':
-                    self.__transform_nomina(elem)
-                elif elem.tag == '{http://www.sat.gob.mx/nomina12}Emisor':
-                    self.__transform_emisor(elem)
-                elif elem.tag == '{http://www.sat.gob.mx/nomina12}Receptor':
-                    self.__transform_receptor(elem)
-                elif elem.tag == '{http://www.sat.gob.mx/nomina12}SubContratacion':
-                    self.__transform_receptor_subcontratacion(elem)
-                elif elem.tag == '{http://www.sat.gob.mx/nomina12}EntidadSNCF':
-                    self.__transform_emisor_snfc(elem)
-                elif elem.tag == '{http://www.sat.gob.mx/nomina12}Percepciones':
-                    self.__transform_percepciones(elem)
-                elif elem.tag == '{http://www.sat.gob.mx/nomina12}JubilacionPensionRetiro':
-                    self.__transform_jubilacion(elem)
-                elif elem.tag == '{http://www.sat.gob.mx/nomina12}SeparacionIndemnizacion':
-                    self.__transform_separacion(elem)
-                elif elem.tag == '{http://www.sat.gob.mx/nomina12}Deducciones':
-                    self.__transform_deducciones(elem)
-                elif elem.tag == '{http://www.sat.gob.mx/nomina12}Deduccion':
-                    self.__transform_deduccion(elem)
-                elif elem.tag == '{http://www.sat.gob.mx/nomina12}OtrosPagos':
-                    self.__transform_otros_pagos()
-                elif elem.tag == '{http://www.sat.gob.mx/nomina12}Incapacidades':
-                    self.__transform_incapacidades()
-                elif elem.tag == '{http://www.sat.gob.mx/nomina12}Incapacidad':
-                    self.__transform_incapacidad(elem)
-            elif action == 'end':
-                if elem.tag == '{http://www.sat.gob.mx/nomina12}Percepcion':
-                    self.__transform_percepcion(elem)
-                elif elem.tag == '{http://www.sat.gob.mx/nomina12}OtroPago':
-                    self.__transform_otro_pago(elem)
+                    continue
+                handler = start_handlers.get(elem.tag)
+            else:
+                handler = end_handlers.get(elem.tag)
+            if handler is not None:
+                handler(self, elem)
+    
+    def __handle_stream_events(self, context:etree.iterparse, root:etree._Element) -> None:
+        start_handlers = self._START_HANDLERS
+        end_handlers = self._END_HANDLERS
+        free_tags = self._STREAM_FREE_TAGS
+        start_handlers[root.tag](self, root)
+        for action, elem in context:
+            if action == 'start':
+                handler = start_handlers.get(elem.tag)
+            elif elem is root:
+                break
+            else:
+                handler = end_handlers.get(elem.tag)
+            if handler is not None:
+                handler(self, elem)
+            if action == 'end' and elem.tag in free_tags:
+                ParserHelper.free_element(elem)
     
     def __transform_nomina(self, element:etree._Element) -> None:
         if not 'Version' in element.attrib or element.attrib['Version'] != '1.2':
@@ -177,7 +188,7 @@ class Nomina12SAXHandler(BaseHandler):
             }
         )
 
-    def __transform_otros_pagos(self) -> None:
+    def __transform_otros_pagos(self, element:etree._Element) -> None:
         self._data['otros_pagos'] = {
             'otro_pago': []
         }
@@ -202,7 +213,7 @@ class Nomina12SAXHandler(BaseHandler):
                 }
         self._data['otros_pagos']['otro_pago'].append(otro_pago)
     
-    def __transform_incapacidades(self) -> None:
+    def __transform_incapacidades(self, element:etree._Element) -> None:
         self._data['incapacidades'] = {
             'incapacidad': []
         }
@@ -214,4 +225,30 @@ class Nomina12SAXHandler(BaseHandler):
                 'tipo_incapacidad': element.attrib.get('TipoIncapacidad'),
                 'importe_monetario': element.attrib.get('ImporteMonetario', StringHelper.DEFAULT_SAFE_NUMBER_CERO if self._config['safe_numerics'] else self._config['empty_char'])
             }
-        )
\ No newline at end of file
+        )
+
+    _START_HANDLERS = {
+        '{http://www.sat.gob.mx/nomina12}Nomina': __transform_nomina,
+        '{http://www.sat.gob.mx/nomina12}Emisor': __transform_emisor,
+        '{http://www.sat.gob.mx/nomina12}Receptor': __transform_receptor,
+        '{http://www.sat.gob.mx/nomina12}SubContratacion': __transform_receptor_subcontratacion,
+        '{http://www.sat.gob.mx/nomina12}EntidadSNCF': __transform_emisor_snfc,
+        '{http://www.sat.gob.mx/nomina12}Percepciones': __transform_percepciones,
+        '{http://www.sat.gob.mx/nomina12}JubilacionPensionRetiro': __transform_jubilacion,
+        '{http://www.sat.gob.mx/nomina12}SeparacionIndemnizacion': __transform_separacion,
+        '{http://www.sat.gob.mx/nomina12}Deducciones': __transform_deducciones,
+        '{http://www.sat.gob.mx/nomina12}Deduccion': __transform_deduccion,
+        '{http://www.sat.gob.mx/nomina12}OtrosPagos': __transform_otros_pagos,
+        '{http://www.sat.gob.mx/nomina12}Incapacidades': __transform_incapacidades,
+        '{http://www.sat.gob.mx/nomina12}Incapacidad': __transform_incapacidad
+    }
+    _END_HANDLERS = {
+        '{http://www.sat.gob.mx/nomina12}Percepcion': __transform_percepcion,
+        '{http://www.sat.gob.mx/nomina12}OtroPago': __transform_otro_pago
+    }
+    _STREAM_FREE_TAGS = frozenset((
+        '{http://www.sat.gob.mx/nomina12}Percepcion',
+        '{http://www.sat.gob.mx/nomina12}Deduccion',
+        '{http://www.sat.gob.mx/nomina12}OtroPago',
+        '{http://www.sat.gob.mx/nomina12}Incapacidad'
+    ))
\ No newline at end of file
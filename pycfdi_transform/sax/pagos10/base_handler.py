@@ -16,4 +16,12 @@ class BaseHandler(ABC):
     
     @abstractmethod
     def transform_from_string(self, xml_str:str) -> dict:
+        raise NotImplementedError
+    
+    @abstractmethod
+    def transform_from_element(self, element) -> dict:
+        raise NotImplementedError
+    
+    @abstractmethod
+    def transform_from_events(self, context, element) -> dict:
         raise NotImplementedError
\ No newline at end of file
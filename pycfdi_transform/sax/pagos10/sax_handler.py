@@ -3,6 +3,8 @@ import logging
 from pycfdi_transform.helpers.string_helper import StringHelper
 from pycfdi_transform.sax.pagos10.base_handler import BaseHandler
 from lxml import etree
+from pycfdi_transform.helpers.parser_helper import ParserHelper
+from pycfdi_transform.helpers.error_helper import ErrorHelper
 
 class Pagos10SAXHandler(BaseHandler):
     def __init__(self, empty_char = '', safe_numerics = False,esc_delimiters:str = "") -> Pagos10SAXHandler:
@@ -11,24 +13,54 @@ class Pagos10SAXHandler(BaseHandler):
     
     def transform_from_string(self, xml_str:str) -> dict:
         try:
-            xml_parser = etree.XMLParser(encoding='utf-8', recover=True)
+            xml_parser = ParserHelper.get_parser(encoding='utf-8', recover=True)
             tree = etree.XML(xml_str, parser=xml_parser)
-            context = etree.iterwalk(tree, events=("start", "end"))
+        except Exception as ex:
+            ErrorHelper.log_exception(self._logger, 'Caugth Exception at tranforming xml string.')
+            raise ex
+        return self.transform_from_element(tree)
+    
+    def transform_from_element(self, element:etree._Element) -> dict:
+        try:
+            context = etree.iterwalk(element, events=("start", "end"))
             self.__handle_events(context)
             return self._data
         except Exception as ex:
-            self._logger.exception(f'Caugth Exception at tranforming xml string.')
+            ErrorHelper.log_exception(self._logger, 'Caugth Exception at tranforming xml element.')
+            raise ex
+    
+    def transform_from_events(self, context:etree.iterparse, element:etree._Element) -> dict:
+        try:
+            self.__handle_stream_events(context, element)
+            return self._data
+        except Exception as ex:
+            ErrorHelper.log_exception(self._logger, 'Caugth Exception at tranforming xml events.')
             raise ex
     
     def __handle_events(self, context:etree.iterwalk) -> None:
+        start_handlers = self._START_HANDLERS
+        end_handlers = self._END_HANDLERS
+        for action, elem in context:
+            handler = start_handlers.get(elem.tag) if action == 'start' else end_handlers.get(elem.tag)
+            if handler is not None:
+                handler(self, elem)
+    
+    def __handle_stream_events(self, context:etree.iterparse, root:etree._Element) -> None:
+        start_handlers = self._START_HANDLERS
+        end_handlers = self._END_HANDLERS
+        free_tags = self._STREAM_FREE_TAGS
+        start_handlers[root.tag](self, root)
         for action, elem in context:
             if action == 'start':
-                if elem.tag == '{http://www.sat.gob.mx/Pagos}Pagos':
-                    self.__transform_pagos(elem)
-            elif action == 'end':
-                if elem.tag == '{http://www.sat.gob.mx/Pagos}Pago':
-                    self.__transform_pago(elem)
-
+                handler = start_handlers.get(elem.tag)
+            elif elem is root:
+                break
+            else:
+                handler = end_handlers.get(elem.tag)
+            if handler is not None:
+                handler(self, elem)
+            if action == 'end' and elem.tag in free_tags:
+                ParserHelper.free_element(elem)
     
     def __transform_pagos(self, element:etree._Element) -> None:
         if not 'Version' in element.attrib or element.attrib['Version'] != '1.0':
@@ -36,44 +68,46 @@ class Pagos10SAXHandler(BaseHandler):
         self._data['version'] = element.attrib.get('Version')
     
     def __transform_pago(self, element:etree._Element) -> None:
-        pago = {
-            'fecha_pago': element.attrib.get('FechaPago'),
-            'forma_de_pago_p': element.attrib.get('FormaDePagoP'),
-            'moneda_p': element.attrib.get('MonedaP'),
-            'tipo_cambio_p': element.attrib.get('TipoCambioP', StringHelper.DEFAULT_SAFE_NUMBER_ONE if self._config['safe_numerics'] else self._config['empty_char']),
-            'monto': element.attrib.get('Monto'),
-            'num_operacion': StringHelper.compact_string(self._config['esc_delimiters'],element.attrib.get('NumOperacion', self._config['empty_char'])),
-            'rfc_emisor_cta_ord': element.attrib.get('RfcEmisorCtaOrd', self._config['empty_char']),
-            'nom_banco_ord_ext': StringHelper.compact_string(self._config['esc_delimiters'],element.attrib.get('NomBancoOrdExt', self._config['empty_char'])),
-            'cta_ordenante': element.attrib.get('CtaOrdenante', self._config['empty_char']),
-            'rfc_emisor_cta_ben': element.attrib.get('RfcEmisorCtaBen', self._config['empty_char']),
-            'cta_beneficiario': element.attrib.get('CtaBeneficiario', self._config['empty_char']),
-            'tipo_cad_pago': element.attrib.get('TipoCadPago', self._config['empty_char']),
-            'cert_pago': StringHelper.compact_string(self._config['esc_delimiters'],element.attrib.get('CertPago', self._config['empty_char'])),
-            'cad_pago': StringHelper.compact_string(self._config['esc_delimiters'],element.attrib.get('CadPago', self._config['empty_char'])),
-            'sello_pago': StringHelper.compact_string(self._config['esc_delimiters'],element.attrib.get('SelloPago', self._config['empty_char'])),
-            'docto_relacionado': [],
-            'impuestos': []
-        }
-        for child in element.getchildren():
-            if child.tag == '{http://www.sat.gob.mx/Pagos}DoctoRelacionado':
-                pago['docto_relacionado'].append(
-                    {
-                        'id_documento': child.attrib.get('IdDocumento'),
-                        'serie': StringHelper.compact_string(self._config['esc_delimiters'],child.attrib.get('Serie', self._config['empty_char'])),
-                        'folio': StringHelper.compact_string(self._config['esc_delimiters'],child.attrib.get('Folio', self._config['empty_char'])),
-                        'moneda_dr': child.attrib.get('MonedaDR'),
-                        'tipo_cambio_dr': child.attrib.get('TipoCambioP', StringHelper.DEFAULT_SAFE_NUMBER_ONE if self._config['safe_numerics'] else self._config['empty_char']),
-                        'metodo_de_pago_dr': child.attrib.get('MetodoDePagoDR'),
-                        'num_parcialidad': child.attrib.get('NumParcialidad', self._config['empty_char']),
-                        'imp_saldo_ant': child.attrib.get('ImpSaldoAnt', StringHelper.DEFAULT_SAFE_NUMBER_CERO if self._config['safe_numerics'] else self._config['empty_char']),
-                        'imp_pagado': child.attrib.get('ImpPagado', StringHelper.DEFAULT_SAFE_NUMBER_CERO if self._config['safe_numerics'] else self._config['empty_char']),
-                        'imp_saldo_insoluto': child.attrib.get('ImpSaldoInsoluto', StringHelper.DEFAULT_SAFE_NUMBER_CERO if self._config['safe_numerics'] else self._config['empty_char'])
-                    }
-                )
-            elif child.tag == '{http://www.sat.gob.mx/Pagos}Impuestos':
-                pago['impuestos'].append(self.__transform_impuestos(child))
-        self._data['pago'].append(pago)
+        self._data['pago'].append(
+            {
+                'fecha_pago': element.attrib.get('FechaPago'),
+                'forma_de_pago_p': element.attrib.get('FormaDePagoP'),
+                'moneda_p': element.attrib.get('MonedaP'),
+                'tipo_cambio_p': element.attrib.get('TipoCambioP', StringHelper.DEFAULT_SAFE_NUMBER_ONE if self._config['safe_numerics'] else self._config['empty_char']),
+                'monto': element.attrib.get('Monto'),
+                'num_operacion': StringHelper.compact_string(self._config['esc_delimiters'],element.attrib.get('NumOperacion', self._config['empty_char'])),
+                'rfc_emisor_cta_ord': element.attrib.get('RfcEmisorCtaOrd', self._config['empty_char']),
+                'nom_banco_ord_ext': StringHelper.compact_string(self._config['esc_delimiters'],element.attrib.get('NomBancoOrdExt', self._config['empty_char'])),
+                'cta_ordenante': element.attrib.get('CtaOrdenante', self._config['empty_char']),
+                'rfc_emisor_cta_ben': element.attrib.get('RfcEmisorCtaBen', self._config['empty_char']),
+                'cta_beneficiario': element.attrib.get('CtaBeneficiario', self._config['empty_char']),
+                'tipo_cad_pago': element.attrib.get('TipoCadPago', self._config['empty_char']),
+                'cert_pago': StringHelper.compact_string(self._config['esc_delimiters'],element.attrib.get('CertPago', self._config['empty_char'])),
+                'cad_pago': StringHelper.compact_string(self._config['esc_delimiters'],element.attrib.get('CadPago', self._config['empty_char'])),
+                'sello_pago': StringHelper.compact_string(self._config['esc_delimiters'],element.attrib.get('SelloPago', self._config['empty_char'])),
+                'docto_relacionado': [],
+                'impuestos': []
+            }
+        )
+
+    def __transform_docto_relacionado(self, element:etree._Element) -> None:
+        self._data['pago'][-1]['docto_relacionado'].append(
+            {
+                'id_documento': element.attrib.get('IdDocumento'),
+                'serie': StringHelper.compact_string(self._config['esc_delimiters'],element.attrib.get('Serie', self._config['empty_char'])),
+                'folio': StringHelper.compact_string(self._config['esc_delimiters'],element.attrib.get('Folio', self._config['empty_char'])),
+                'moneda_dr': element.attrib.get('MonedaDR'),
+                'tipo_cambio_dr': element.attrib.get('TipoCambioP', StringHelper.DEFAULT_SAFE_NUMBER_ONE if self._config['safe_numerics'] else self._config['empty_char']),
+                'metodo_de_pago_dr': element.attrib.get('MetodoDePagoDR'),
+                'num_parcialidad': element.attrib.get('NumParcialidad', self._config['empty_char']),
+                'imp_saldo_ant': element.attrib.get('ImpSaldoAnt', StringHelper.DEFAULT_SAFE_NUMBER_CERO if self._config['safe_numerics'] else self._config['empty_char']),
+                'imp_pagado': element.attrib.get('ImpPagado', StringHelper.DEFAULT_SAFE_NUMBER_CERO if self._config['safe_numerics'] else self._config['empty_char']),
+                'imp_saldo_insoluto': element.attrib.get('ImpSaldoInsoluto', StringHelper.DEFAULT_SAFE_NUMBER_CERO if self._config['safe_numerics'] else self._config['empty_char'])
+            }
+        )
+    
+    def __transform_pago_impuestos(self, element:etree._Element) -> None:
+        self._data['pago'][-1]['impuestos'].append(self.__transform_impuestos(element))
 
     def __transform_impuestos(self, element:etree._Element) -> object:
         impuestos = {
@@ -111,4 +145,17 @@ class Pagos10SAXHandler(BaseHandler):
                     'importe': element.attrib.get('Importe')
                 }
             )
-        return traslados
\ No newline at end of file
+        return traslados
+
+    _START_HANDLERS = {
+        '{http://www.sat.gob.mx/Pagos}Pagos': __transform_pagos,
+        '{http://www.sat.gob.mx/Pagos}Pago': __transform_pago
+    }
+    _END_HANDLERS = {
+        '{http://www.sat.gob.mx/Pagos}DoctoRelacionado': __transform_docto_relacionado,
+        '{http://www.sat.gob.mx/Pagos}Impuestos': __transform_pago_impuestos
+    }
+    _STREAM_FREE_TAGS = frozenset((
+        '{http://www.sat.gob.mx/Pagos}Pago',
+        '{http://www.sat.gob.mx/Pagos}DoctoRelacionado'
+    ))
\ No newline at end of file
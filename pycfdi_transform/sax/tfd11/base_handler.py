@@ -7,7 +7,8 @@ class BaseHandler(ABC):
         self._config = {
             'empty_char': empty_char,
             'safe_numerics': safe_numerics,
-            'esc_delimiters':esc_delimiters
+            'esc_delimiters':esc_delimiters,
+            'fields': None
         }
         self._data = {
             'version': empty_char,
@@ -18,6 +19,18 @@ class BaseHandler(ABC):
             'sello_cfd': empty_char
         }
     
+    def use_fields(self, fields:list[str]) -> BaseHandler:
+        self._config['fields'] = frozenset(fields) if fields is not None else None
+        return self
+    
     @abstractmethod
     def transform_from_string(self, xml_str:str) -> dict:
+        raise NotImplementedError
+    
+    @abstractmethod
+    def transform_from_element(self, element) -> dict:
+        raise NotImplementedError
+    
+    @abstractmethod
+    def transform_from_events(self, context, element) -> dict:
         raise NotImplementedError
\ No newline at end of file
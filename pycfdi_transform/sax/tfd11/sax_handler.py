@@ -1,25 +1,52 @@
 from __future__ import annotations
 import logging
 from lxml import etree
+from pycfdi_transform.helpers.parser_helper import ParserHelper
 from pycfdi_transform.sax.tfd11.base_handler import BaseHandler
-from pycfdi_transform.helpers.string_helper import StringHelper
+from pycfdi_transform.helpers.fields_helper import FieldsHelper
+from pycfdi_transform.helpers.error_helper import ErrorHelper
 
 class TFD11SAXHandler(BaseHandler):
+    _TFD_FIELDS = (
+        ('version', 'Version', FieldsHelper.REQUIRED, False),
+        ('no_certificado_sat', 'NoCertificadoSAT', FieldsHelper.REQUIRED, False),
+        ('fecha_timbrado', 'FechaTimbrado', FieldsHelper.REQUIRED, False),
+        ('rfc_prov_cert', 'RfcProvCertif', FieldsHelper.REQUIRED, False),
+        ('sello_cfd', 'SelloCFD', FieldsHelper.REQUIRED, True),
+        ('sello_sat', 'SelloSAT', FieldsHelper.REQUIRED, True)
+    )
+
     def __init__(self, empty_char = '', safe_numerics = False,esc_delimiters:str = "") -> TFD11SAXHandler:
         super().__init__(empty_char, safe_numerics,esc_delimiters)
         self._logger = logging.getLogger('TFD11SAXHandler')
     
     def transform_from_string(self, xml_str:str) -> dict:
         try:
-            xml_parser = etree.XMLParser(encoding='utf-8', recover=True)
+            xml_parser = ParserHelper.get_parser(encoding='utf-8', recover=True)
             tree = etree.XML(xml_str, parser=xml_parser)
-            context = etree.iterwalk(tree, events=("start", "end"))
+        except Exception as ex:
+            ErrorHelper.log_exception(self._logger, 'Caugth Exception at tranforming xml string.')
+            raise ex
+        return self.transform_from_element(tree)
+    
+    def transform_from_element(self, element:etree._Element) -> dict:
+        try:
+            context = etree.iterwalk(element, events=("start", "end"))
             self.__handle_events(context)
             return self._data
         except Exception as ex:
-            self._logger.exception(f'Caugth Exception at tranforming xml string.')
+            ErrorHelper.log_exception(self._logger, 'Caugth Exception at tranforming xml element.')
             raise ex
     
+    def transform_from_events(self, context:etree.iterparse, element:etree._Element) -> dict:
+        try:
+            self.__transform_tfd(element)
+            ParserHelper.skip_subtree(context, element)
+            return self._data
+        except Exception as ex:
+            ErrorHelper.log_exception(self._logger, 'Caugth Exception at tranforming xml events.')
+            raise ex
+
     def __handle_events(self, context:etree.iterwalk) -> None:
         for action, elem in context:
             if action == 'start':
@@ -31,10 +58,7 @@ class TFD11SAXHandler(BaseHandler):
     def __transform_tfd(self, element:etree._Element) -> None:
         if not 'Version' in element.attrib or element.attrib['Version'] != '1.1':
             raise ValueError('Incorrect type of TFD, this handler only support TFD version 1.1')
-        self._data['version'] = element.attrib.get('Version')
-        self._data['no_certificado_sat'] = element.attrib.get('NoCertificadoSAT')
-        self._data['uuid'] = str(element.attrib.get('UUID')).upper()
-        self._data['fecha_timbrado'] = element.attrib.get('FechaTimbrado')
-        self._data['rfc_prov_cert'] = element.attrib.get('RfcProvCertif')
-        self._data['sello_cfd'] = StringHelper.compact_string(self._config['esc_delimiters'],element.attrib.get('SelloCFD'))
-        self._data['sello_sat'] = StringHelper.compact_string(self._config['esc_delimiters'],element.attrib.get('SelloSAT'))
\ No newline at end of file
+        compiled_fields = FieldsHelper.compile_fields(self._TFD_FIELDS, 'tfd11', self._config['fields'], self._config['empty_char'], self._config['safe_numerics'])
+        FieldsHelper.extract(element.attrib, compiled_fields, self._config['esc_delimiters'], self._data)
+        if FieldsHelper.is_requested(self._config['fields'], 'tfd11.uuid'):
+            self._data['uuid'] = str(element.attrib.get('UUID')).upper()
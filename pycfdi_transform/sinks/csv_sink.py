@@ -0,0 +1,167 @@
+from __future__ import annotations
+from typing import Iterable, Iterator
+import csv
+import os
+import shutil
+from pycfdi_transform.formatters.formatter_interface import FormatterInterface
+
+class CsvSink:
+    """Writes the rows of transformed CFDI to a CSV file with the columns of a formatter.
+
+    The header is written from `get_columns_names` of the formatter and the rows from its `iter_rows`, rows are
+    written as they are generated and the file buffers them in blocks of `buffer_size` bytes. Documents that the
+    formatter can not format are skipped and returned by `get_skipped`. To write in parallel every worker writes its
+    own part file with `header=False`, the parts are joined at the end with `concat_parts`. Use it as a context
+    manager or call `close` to write the last block.
+
+    Usage example:
+    ```
+    with CsvSink(CDACFDI40Formatter, 'cfdi40.csv') as sink:
+        sink.write_many(transform_many(DirectorySource('./xml')))
+    ```
+
+    Args:
+        formatter_class : type
+                    Class of the formatter, e.g. `CDACFDI40Formatter`.
+        file : str | TextIO
+                    Path of the CSV file or text stream opened with newline=''.
+        empty_char : str, default: ''
+                    Data added if the field has not data, see the formatter.
+        safe_numerics : bool, default: False
+                    If True numeric data with not value is presented as 0.00, see the formatter.
+        header : bool, default: True
+                    If True the names of the columns are written in the first row.
+        buffer_size : int, default: 1048576
+                    Size in bytes of the buffer of the file, only used if a path is provided.
+        encoding : str, default: 'utf-8'
+                    Encoding of the file, only used if a path is provided.
+        **csv_options :
+                    Options of `csv.writer`, e.g. delimiter.
+    """
+    FILE_BUFFER_SIZE = 1024 * 1024
+
+    def __init__(self, formatter_class:type, file, empty_char:str = '', safe_numerics:bool = False, header:bool = True, buffer_size:int = FILE_BUFFER_SIZE, encoding:str = 'utf-8', **csv_options) -> CsvSink:
+        assert issubclass(formatter_class, FormatterInterface), 'El formatter debe implementar FormatterInterface.'
+        self._formatter_class = formatter_class
+        self._config = {
+            'empty_char': empty_char,
+            'safe_numerics': safe_numerics
+        }
+        if hasattr(file, 'write'):
+            self._file = file
+            self._close_file = False
+        else:
+            self._file = open(file, 'w', newline='', encoding=encoding, buffering=buffer_size)
+            self._close_file = True
+        self._writer = csv.writer(self._file, **csv_options)
+        self._skipped = []
+        self.rows_count = 0
+        if header:
+            self._writer.writerow(formatter_class.get_columns_names())
+
+    def __enter__(self) -> CsvSink:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.flush()
+        if self._close_file:
+            self._file.close()
+
+    def flush(self) -> None:
+        """Writes the buffered rows to the file."""
+        self._file.flush()
+
+    def write(self, cfdi_data:dict, name:str = None) -> int:
+        """Writes the rows of a transformed document.
+
+        Args:
+            cfdi_data (dict): Data obtained from a handler, records of errors from `transform_many` are skipped.
+            name (str, optional): Name of the document used in the skipped documents. Defaults to None.
+
+        Returns:
+            int: Number of rows written, 0 if the document is skipped.
+        """
+        if 'error' in cfdi_data:
+            self._skipped.append((name, cfdi_data['message']))
+            return 0
+        try:
+            formatter = self._formatter_class(cfdi_data, self._config['empty_char'], self._config['safe_numerics'])
+        except AssertionError as ex:
+            self._skipped.append((name, str(ex)))
+            return 0
+        if not formatter.can_format():
+            self._skipped.append((name, formatter.get_errors()))
+            return 0
+        written_rows = self.rows_count
+        self._writer.writerows(self.__count_rows(formatter.iter_rows()))
+        return self.rows_count - written_rows
+
+    def __count_rows(self, rows:Iterator[tuple]) -> Iterator[tuple]:
+        for row in rows:
+            self.rows_count += 1
+            yield row
+
+    def write_many(self, documents:Iterable) -> int:
+        """Writes the rows of many transformed documents.
+
+        Args:
+            documents (Iterable): Dicts obtained from a handler or tuples (path, dict) like the results of
+                `transform_many`.
+
+        Returns:
+            int: Number of rows written.
+        """
+        rows_count = 0
+        for document in documents:
+            if isinstance(document, tuple):
+                rows_count += self.write(document[1], document[0])
+            else:
+                rows_count += self.write(document)
+        return rows_count
+
+    def get_skipped(self) -> list[tuple]:
+        """Gets the documents that were not written.
+
+        Returns:
+            list[tuple]: Tuples (name, error) of the skipped documents, name is None if it was not provided.
+        """
+        return list(self._skipped)
+
+    @staticmethod
+    def get_part_path(path:str, part:int) -> str:
+        """Gets the path of a part file, e.g. `cfdi40.csv.part0`.
+
+        Args:
+            path (str): Path of the final CSV file.
+            part (int): Number of the part, e.g. the number of the worker.
+
+        Returns:
+            str: Path of the part file.
+        """
+        return f'{os.fspath(path)}.part{part}'
+
+    @staticmethod
+    def concat_parts(formatter_class:type, part_paths:Iterable[str], path:str, remove:bool = True, encoding:str = 'utf-8', **csv_options) -> None:
+        """Joins part files written with `header=False` in a single CSV file with header, in the order of `part_paths`.
+
+        Args:
+            formatter_class (type): Class of the formatter used to write the parts.
+            part_paths (Iterable[str]): Paths of the part files.
+            path (str): Path of the final CSV file.
+            remove (bool, optional): Remove the part files once they are copied. Defaults to True.
+            encoding (str, optional): Encoding of the files. Defaults to 'utf-8'.
+            **csv_options: Options of `csv.writer` used to write the header.
+        """
+        part_paths = list(part_paths)
+        with open(path, 'w', newline='', encoding=encoding) as file:
+            csv.writer(file, **csv_options).writerow(formatter_class.get_columns_names())
+            file.flush()
+            for part_path in part_paths:
+                with open(part_path, 'rb') as part_file:
+                    shutil.copyfileobj(part_file, file.buffer, CsvSink.FILE_BUFFER_SIZE)
+        if remove:
+            for part_path in part_paths:
+                os.remove(part_path)
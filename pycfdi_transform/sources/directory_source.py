@@ -0,0 +1,51 @@
+from __future__ import annotations
+from typing import Iterator
+import os
+from pycfdi_transform.sources.source_interface import SourceInterface
+
+class DirectorySource(SourceInterface):
+    """Iterates the paths of the XML found in a directory, walking it with `os.scandir`.
+
+    By default paths are returned from the largest file to the smallest one, when they are given to `transform_many`
+    the largest documents are sent first and the small ones fill the workers at the end, so a worker does not keep
+    transforming a giant file while the others are idle. The directory is scanned completely before the first path
+    is returned, use `largest_first=False` to return the paths while the directory is scanned.
+
+    Args:
+        path : str
+                    Path of the directory.
+        suffixes : tuple, default: ('.xml', '.xml.gz', '.xml.bz2', '.xml.xz')
+                    Only the files whose name ends with one of the suffixes are returned.
+        recursive : bool, default: True
+                    If True the subdirectories are scanned too, symbolic links to directories are not followed.
+        largest_first : bool, default: True
+                    If True paths are sorted by size from the largest.
+    """
+    DEFAULT_SUFFIXES = ('.xml', '.xml.gz', '.xml.bz2', '.xml.xz')
+
+    def __init__(self, path:str, suffixes:tuple = DEFAULT_SUFFIXES, recursive:bool = True, largest_first:bool = True) -> DirectorySource:
+        self._path = os.fspath(path)
+        self._suffixes = tuple(suffixes)
+        self._recursive = recursive
+        self._largest_first = largest_first
+
+    def __iter__(self) -> Iterator[str]:
+        if not self._largest_first:
+            return (path for path, _ in self.scan())
+        return (path for path, _ in sorted(self.scan(), key=lambda entry: entry[1], reverse=True))
+
+    def scan(self) -> Iterator[tuple]:
+        """Scans the directory in the order of `os.scandir`.
+
+        Returns:
+            Iterator[tuple]: Tuples (path, size) of the files found.
+        """
+        directories = [self._path]
+        while directories:
+            with os.scandir(directories.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if self._recursive:
+                            directories.append(entry.path)
+                    elif entry.name.endswith(self._suffixes) and entry.is_file():
+                        yield entry.path, entry.stat().st_size
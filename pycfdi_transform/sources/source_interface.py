@@ -0,0 +1,28 @@
+from __future__ import annotations
+from abc import ABC, abstractmethod
+from typing import Iterator
+from pycfdi_transform.sax.auto.sax_handler import CFDIAutoSAXHandler
+
+class SourceInterface(ABC):
+    """Iterable of the documents to transform, items are file paths or tuples (name, bytes)."""
+
+    @abstractmethod
+    def __iter__(self) -> Iterator:
+        raise NotImplementedError
+
+    def transform(self, handler = None) -> Iterator[tuple]:
+        """Transforms the items one by one in the current thread.
+
+        Args:
+            handler (optional): Configured handler with `transform_from_file` and `transform_from_bytes`. Defaults to `CFDIAutoSAXHandler()`.
+
+        Returns:
+            Iterator[tuple]: Tuples (name, dict) with the data from CFDI, name is the path for file items.
+        """
+        if handler is None:
+            handler = CFDIAutoSAXHandler()
+        for item in self:
+            if isinstance(item, tuple):
+                yield item[0], handler.transform_from_bytes(item[1])
+            else:
+                yield item, handler.transform_from_file(item)
@@ -0,0 +1,32 @@
+from __future__ import annotations
+from typing import Iterator
+import os
+import tarfile
+from pycfdi_transform.sources.source_interface import SourceInterface
+
+class TarSource(SourceInterface):
+    """Iterates the XML of a tar archive, plain or compressed with gzip, bz2 or xz (e.g. `.tar.xz`), without extracting them to disk.
+
+    The archive is read as a stream, members are decompressed in order and only once. Every item is a tuple (name, bytes)
+    with the name of the member and its content, items can be given to `transform_many` to transform the members in parallel.
+
+    Args:
+        file : str | file
+                    File path or binary file object of the tar archive.
+        suffix : str, default: '.xml'
+                    Only the members whose name ends with the suffix are read, case insensitive.
+    """
+    def __init__(self, file, suffix:str = '.xml') -> TarSource:
+        self._file = file
+        self._suffix = suffix.lower()
+
+    def __iter__(self) -> Iterator[tuple]:
+        if isinstance(self._file, (str, os.PathLike)):
+            tar_file = tarfile.open(self._file, 'r|*')
+        else:
+            tar_file = tarfile.open(fileobj=self._file, mode='r|*')
+        with tar_file:
+            for member in tar_file:
+                if not member.isfile() or not member.name.lower().endswith(self._suffix):
+                    continue
+                yield member.name, tar_file.extractfile(member).read()
@@ -0,0 +1,27 @@
+from __future__ import annotations
+from typing import Iterator
+import zipfile
+from pycfdi_transform.sources.source_interface import SourceInterface
+
+class ZipSource(SourceInterface):
+    """Iterates the XML of a ZIP package, like the ones of the SAT bulk download, without extracting them to disk.
+
+    Every item is a tuple (name, bytes) with the name of the member and its content, items can be given to
+    `transform_many` to transform the members in parallel.
+
+    Args:
+        file : str | file
+                    File path or binary file object of the ZIP.
+        suffix : str, default: '.xml'
+                    Only the members whose name ends with the suffix are read, case insensitive.
+    """
+    def __init__(self, file, suffix:str = '.xml') -> ZipSource:
+        self._file = file
+        self._suffix = suffix.lower()
+
+    def __iter__(self) -> Iterator[tuple]:
+        with zipfile.ZipFile(self._file) as zip_file:
+            for info in zip_file.infolist():
+                if info.is_dir() or not info.filename.lower().endswith(self._suffix):
+                    continue
+                yield info.filename, zip_file.read(info)
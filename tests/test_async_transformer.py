@@ -0,0 +1,158 @@
+from pycfdi_transform import AsyncTransformer, CFDIAutoSAXHandler, transform_async, transform_auto
+import asyncio
+import threading
+import time
+import unittest
+
+class TestAsyncTransformer(unittest.TestCase):
+    PATHS = [
+        './tests/Resources/cfdi33/cfdi33_01.xml',
+        './tests/Resources/cfdi40/cfdi40_01.xml',
+        './tests/Resources/nomina12/nomina12_01.xml',
+        './tests/Resources/implocal/cfdi40_01_implocal.xml'
+    ]
+    HANDLER_CONFIG = {'nomina12': True, 'implocal10': True, 'concepts': True}
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+    def tearDown(self):
+        self.loop.run_until_complete(self.loop.shutdown_asyncgens())
+        self.loop.close()
+        asyncio.set_event_loop(None)
+
+    def __run(self, coroutine):
+        return asyncio.get_event_loop().run_until_complete(coroutine)
+
+    def test_transform_async(self):
+        async def run():
+            self.assertDictEqual(await transform_async(self.PATHS[1]), transform_auto(self.PATHS[1]))
+        self.__run(run())
+
+    def test_transform(self):
+        async def run():
+            sax_handler = CFDIAutoSAXHandler.from_config(self.HANDLER_CONFIG)
+            async with AsyncTransformer(2, self.HANDLER_CONFIG) as transformer:
+                for path in self.PATHS:
+                    self.assertDictEqual(await transformer.transform(path), sax_handler.transform(path))
+                    with open(path, 'rb') as file:
+                        xml_bytes = file.read()
+                    self.assertDictEqual(await transformer.transform(xml_bytes), sax_handler.transform(path))
+                    self.assertDictEqual(await transformer.transform_from_string(xml_bytes.decode()), sax_handler.transform_from_string(xml_bytes.decode()))
+        self.__run(run())
+
+    def test_transform_many(self):
+        async def run():
+            sax_handler = CFDIAutoSAXHandler.from_config(self.HANDLER_CONFIG)
+            expected = [(path, sax_handler.transform(path)) for path in self.PATHS * 5]
+            async def iter_paths():
+                for path in self.PATHS * 5:
+                    yield path
+            async with AsyncTransformer(2, self.HANDLER_CONFIG, max_concurrency=3) as transformer:
+                self.assertListEqual([result async for result in transformer.transform_many(self.PATHS * 5)], expected)
+                self.assertListEqual([result async for result in transformer.transform_many(iter_paths())], expected)
+                self.assertCountEqual([result async for result in transformer.transform_many(self.PATHS * 5, ordered=False)], expected)
+        self.__run(run())
+
+    def test_transform_many_error(self):
+        async def run():
+            async with AsyncTransformer(2) as transformer:
+                results = transformer.transform_many([self.PATHS[0], './tests/Resources/cfdi40/not_found.txt', self.PATHS[1]])
+                self.assertEqual((await results.__anext__())[0], self.PATHS[0])
+                with self.assertRaises(ValueError):
+                    await results.__anext__()
+        self.__run(run())
+
+    def test_max_concurrency(self):
+        async def run():
+            running = [0, 0]
+            lock = threading.Lock()
+            async with AsyncTransformer(4, max_concurrency=2) as transformer:
+                transform = transformer._handler.transform
+                def tracked_transform(source):
+                    with lock:
+                        running[0] += 1
+                        running[1] = max(running)
+                    time.sleep(0.01)
+                    with lock:
+                        running[0] -= 1
+                    return transform(source)
+                transformer._handler.transform = tracked_transform
+                await asyncio.gather(*[transformer.transform(path) for path in self.PATHS * 3])
+            self.assertEqual(running[1], 2)
+        self.__run(run())
+
+    def test_cancel(self):
+        async def run():
+            async with AsyncTransformer(1, max_concurrency=1) as transformer:
+                transform = transformer._handler.transform
+                calls = []
+                def slow_transform(source):
+                    calls.append(source)
+                    time.sleep(0.05)
+                    return transform(source)
+                transformer._handler.transform = slow_transform
+                tasks = [asyncio.ensure_future(transformer.transform(path)) for path in self.PATHS]
+                await asyncio.sleep(0.01)
+                for task in tasks[1:]:
+                    task.cancel()
+                self.assertDictEqual(await tasks[0], transform(self.PATHS[0]))
+                await asyncio.gather(*tasks[1:], return_exceptions=True)
+            self.assertListEqual(calls, self.PATHS[:1])
+        self.__run(run())
+
+    def test_cancel_running(self):
+        async def run():
+            running = [0, 0]
+            lock = threading.Lock()
+            async with AsyncTransformer(2, max_concurrency=1) as transformer:
+                transform = transformer._handler.transform
+                def tracked_transform(source):
+                    with lock:
+                        running[0] += 1
+                        running[1] = max(running)
+                    time.sleep(0.05)
+                    with lock:
+                        running[0] -= 1
+                    return transform(source)
+                transformer._handler.transform = tracked_transform
+                task = asyncio.ensure_future(transformer.transform(self.PATHS[0]))
+                await asyncio.sleep(0.01)
+                task.cancel()
+                # The cancelled job keeps running in the pool, so its slot is not given to the next document
+                self.assertDictEqual(await transformer.transform(self.PATHS[1]), transform(self.PATHS[1]))
+                await asyncio.gather(task, return_exceptions=True)
+            self.assertEqual(running[1], 1)
+        self.__run(run())
+
+    def test_reuse_in_other_loop(self):
+        transformer = AsyncTransformer(2, max_concurrency=1)
+        async def run():
+            return await asyncio.gather(*(transformer.transform(path) for path in self.PATHS))
+        try:
+            for _ in range(2):
+                loop = asyncio.new_event_loop()
+                try:
+                    results = loop.run_until_complete(run())
+                finally:
+                    loop.close()
+                self.assertListEqual(results, [transform_auto(path) for path in self.PATHS])
+        finally:
+            transformer.close()
+
+    def test_event_loop_not_blocked(self):
+        async def run():
+            lags = []
+            async def ticker():
+                while True:
+                    start = time.perf_counter()
+                    await asyncio.sleep(0.001)
+                    lags.append(time.perf_counter() - start)
+            ticker_task = asyncio.ensure_future(ticker())
+            async with AsyncTransformer(2, self.HANDLER_CONFIG) as transformer:
+                async for _ in transformer.transform_many(self.PATHS * 50):
+                    pass
+            ticker_task.cancel()
+            self.assertLessEqual(max(lags), 0.1, 'The event loop was blocked by the transform')
+        self.__run(run())
@@ -0,0 +1,60 @@
+from pycfdi_transform import CFDIAutoSAXHandler, CFDI33SAXHandler, CFDI40SAXHandler, transform_auto
+from lxml import etree
+from unittest import mock
+import unittest
+
+class TestCFDIAutoSAXHandler(unittest.TestCase):
+    def test_get_cfdi_version(self):
+        self.assertTupleEqual(CFDIAutoSAXHandler.get_cfdi_version('./tests/Resources/cfdi33/cfdi33_01.xml'), ('http://www.sat.gob.mx/cfd/3', '3.3'))
+        self.assertTupleEqual(CFDIAutoSAXHandler.get_cfdi_version('./tests/Resources/cfdi40/cfdi40_01.xml'), ('http://www.sat.gob.mx/cfd/4', '4.0'))
+        self.assertTupleEqual(CFDIAutoSAXHandler.get_cfdi_version(b''), (None, None))
+
+    def test_transform_auto_file(self):
+        self.assertDictEqual(transform_auto('./tests/Resources/cfdi33/cfdi33_01.xml'), CFDI33SAXHandler().transform_from_file('./tests/Resources/cfdi33/cfdi33_01.xml'))
+        self.assertDictEqual(transform_auto('./tests/Resources/cfdi40/cfdi40_01.xml'), CFDI40SAXHandler().transform_from_file('./tests/Resources/cfdi40/cfdi40_01.xml'))
+
+    def test_transform_auto_bytes(self):
+        with open('./tests/Resources/cfdi40/cfdi40_01.xml', 'rb') as file:
+            xml_bytes = file.read()
+        self.assertDictEqual(transform_auto(xml_bytes), CFDI40SAXHandler().transform_from_bytes(xml_bytes))
+
+    def test_transform_mixed_single_parse(self):
+        sax_handler = CFDIAutoSAXHandler().use_nomina12().use_pagos10().use_implocal10()
+        paths = [
+            './tests/Resources/cfdi33/cfdi33_01.xml',
+            './tests/Resources/cfdi40/cfdi40_01.xml',
+            './tests/Resources/nomina12/nomina12_01.xml',
+            './tests/Resources/pagos10/pago10_01.xml',
+            './tests/Resources/implocal/cfdi40_01_implocal.xml'
+        ]
+        with mock.patch('lxml.etree.XML', wraps=etree.XML) as xml_parse, mock.patch('lxml.etree.parse', wraps=etree.parse) as file_parse:
+            results = [sax_handler.transform(path) for path in paths]
+        self.assertEqual(xml_parse.call_count + file_parse.call_count, len(paths))
+        self.assertListEqual([('cfdi33' in result, 'cfdi40' in result) for result in results], [(True, False), (False, True), (True, False), (True, False), (False, True)])
+        self.assertIn('nomina12', results[2])
+        self.assertIn('pagos10', results[3])
+        self.assertIn('implocal10', results[4])
+
+    def test_transform_not_cfdi(self):
+        with self.assertRaises(ValueError) as context:
+            transform_auto(b'<?xml version="1.0" encoding="utf-8"?><Comprobante Version="4.0"/>')
+        self.assertIn('Incorrect type of CFDI', str(context.exception))
+        with self.assertRaises(ValueError) as context:
+            transform_auto('./tests/Resources/cfdi40/cfdi40_01.txt')
+        self.assertIn('Incorrect type of document, only support XML files', str(context.exception))
+
+    def test_iter_concepts(self):
+        sax_handler = CFDIAutoSAXHandler()
+        concepts = list(sax_handler.iter_concepts('./tests/Resources/cfdi40/cfdi40_01.xml'))
+        self.assertEqual(len(concepts), 5)
+        with open('./tests/Resources/cfdi33/cfdi33_01_utf8chars.xml', 'rb') as file:
+            concepts = list(sax_handler.iter_concepts(file.read()))
+        self.assertEqual(concepts[0]['no_identificacion'], 'prodüctoInventarió')
+
+    def test_strict_parse(self):
+        sax_handler = CFDIAutoSAXHandler().use_nomina12().use_strict_parse()
+        sax_handler.transform('./tests/Resources/nomina12/double_breaks_nomina01.xml')
+        self.assertTrue(sax_handler.recovered)
+        sax_handler.transform('./tests/Resources/cfdi40/cfdi40_01_minimal.xml')
+        self.assertFalse(sax_handler.recovered)
+        self.assertEqual(sax_handler.recovered_count, 1)
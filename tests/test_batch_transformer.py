@@ -0,0 +1,126 @@
+from pycfdi_transform import BatchTransformer, CFDIAutoSAXHandler, ErrorHelper, SchemaHelper, TransformError, transform_auto, transform_many
+from pycfdi_transform.batch.batch_transformer import _transform_chunk
+from lxml import etree
+from unittest import mock
+import os
+import pickle
+import shutil
+import tempfile
+import time
+import unittest
+
+class TestBatchTransformer(unittest.TestCase):
+    PATHS = [
+        './tests/Resources/cfdi33/cfdi33_01.xml',
+        './tests/Resources/cfdi40/cfdi40_01.xml',
+        './tests/Resources/nomina12/nomina12_01.xml',
+        './tests/Resources/pagos10/pago10_01.xml',
+        './tests/Resources/implocal/cfdi40_01_implocal.xml'
+    ]
+    HANDLER_CONFIG = {'nomina12': True, 'pagos10': True, 'implocal10': True, 'concepts': True}
+
+    def test_from_config(self):
+        sax_handler = CFDIAutoSAXHandler.from_config(self.HANDLER_CONFIG)
+        expected = CFDIAutoSAXHandler().use_nomina12().use_pagos10().use_implocal10().use_concepts()
+        for path in self.PATHS:
+            self.assertDictEqual(sax_handler.transform(path), expected.transform(path))
+
+    def test_transform_many_ordered(self):
+        sax_handler = CFDIAutoSAXHandler.from_config(self.HANDLER_CONFIG)
+        expected = [(path, sax_handler.transform(path)) for path in self.PATHS * 4]
+        results = list(transform_many(iter(self.PATHS * 4), workers=2, handler_config=self.HANDLER_CONFIG))
+        self.assertListEqual(results, expected)
+
+    def test_transform_many_unordered(self):
+        sax_handler = CFDIAutoSAXHandler.from_config(self.HANDLER_CONFIG)
+        results = list(BatchTransformer(2, self.HANDLER_CONFIG, ordered=False).transform_many(self.PATHS * 4))
+        self.assertEqual(len(results), len(self.PATHS) * 4)
+        self.assertCountEqual([path for path, _ in results], self.PATHS * 4)
+        for path, cfdi_data in results:
+            self.assertDictEqual(cfdi_data, sax_handler.transform(path))
+
+    def test_transform_many_threads(self):
+        sax_handler = CFDIAutoSAXHandler.from_config(self.HANDLER_CONFIG)
+        expected = [(path, sax_handler.transform(path)) for path in self.PATHS * 4]
+        self.assertListEqual(list(transform_many(self.PATHS * 4, workers=4, handler_config=self.HANDLER_CONFIG, threads=True)), expected)
+        results = list(BatchTransformer(4, self.HANDLER_CONFIG, ordered=False, threads=True).transform_many(self.PATHS * 4))
+        self.assertCountEqual(results, expected)
+
+    def test_transform_many_record_errors(self):
+        paths = [self.PATHS[0], './tests/Resources/cfdi40/not_found.xml', self.PATHS[1], './tests/Resources/cfdi40/not_found.txt']
+        for threads in (False, True):
+            results = list(transform_many(paths, workers=2, threads=threads, errors='record'))
+            self.assertListEqual([path for path, _ in results], paths)
+            self.assertDictEqual(results[0][1], transform_auto(self.PATHS[0]))
+            self.assertEqual(results[1][1]['error'], 'FileNotFoundError')
+            self.assertEqual(results[1][1]['phase'], 'read')
+            self.assertDictEqual(results[3][1], {'path': paths[3], 'error': 'ValueError', 'message': 'Incorrect type of document, only support XML files', 'phase': 'transform'})
+        with self.assertRaises(ValueError):
+            BatchTransformer(errors='ignore')
+
+    def test_transform_many_error(self):
+        with self.assertRaises(ValueError) as context:
+            list(transform_many([self.PATHS[0], './tests/Resources/cfdi40/not_found.txt'], workers=1))
+        self.assertEqual(str(context.exception), 'Incorrect type of document, only support XML files')
+
+    def test_from_config_schema_validation_lazy(self):
+        with mock.patch.object(SchemaHelper, 'get_schema_validator', wraps=SchemaHelper.get_schema_validator) as get_schema_validator:
+            sax_handler = CFDIAutoSAXHandler.from_config({'schema_validation': True})
+            get_schema_validator.assert_not_called()
+            with self.assertRaises(FileNotFoundError):
+                sax_handler.transform(self.PATHS[1])
+            get_schema_validator.assert_called_once_with('cfdi40')
+
+    def test_transform_many_schema_validation(self):
+        ErrorHelper.set_traceback_logging(False)
+        try:
+            for threads in (False, True):
+                results = list(transform_many(self.PATHS[:2], workers=1, handler_config={'schema_validation': True}, threads=threads, errors='record'))
+                self.assertListEqual([path for path, _ in results], self.PATHS[:2])
+                self.assertEqual(results[1][1]['error'], 'FileNotFoundError')
+        finally:
+            ErrorHelper.set_traceback_logging(True)
+
+    def test_transform_many_worker_init_error(self):
+        with self.assertRaises(TypeError) as context:
+            list(transform_many(self.PATHS, workers=1, handler_config={'fields': 5}))
+        self.assertEqual(str(context.exception), "'int' object is not iterable")
+
+    def test_transform_chunk_unpicklable_error(self):
+        sax_handler = CFDIAutoSAXHandler()
+        transform = sax_handler.transform
+        def broken_transform(source):
+            if source == 'broken.xml':
+                etree.XML(b'<cfdi:Comprobante')
+            return transform(source)
+        with mock.patch.object(sax_handler, 'transform', broken_transform):
+            for record_errors in (False, True):
+                results, _ = _transform_chunk(list(enumerate([self.PATHS[0], 'broken.xml', self.PATHS[1]])), sax_handler, record_errors)
+                # The results of the chunk are sent back from the worker process
+                results = pickle.loads(pickle.dumps(results))
+                self.assertDictEqual(results[2][2], transform_auto(self.PATHS[1]))
+                record = results[1][2] if record_errors else results[1][3]
+                self.assertEqual(record['error'], 'XMLSyntaxError')
+                self.assertEqual(record['phase'], 'parse')
+        with self.assertRaises(TransformError) as context:
+            BatchTransformer._BatchTransformer__get_result(results[1][:2] + (None, record))
+        self.assertTrue(str(context.exception).startswith('XMLSyntaxError: '))
+
+    @unittest.skipIf((os.cpu_count() or 1) < 2, 'Throughput scaling needs more than one CPU.')
+    def test_transform_many_benchmark(self):
+        directory = tempfile.mkdtemp()
+        try:
+            paths = []
+            for index in range(400):
+                path = os.path.join(directory, f'cfdi_{index}.xml')
+                shutil.copyfile(self.PATHS[index % len(self.PATHS)], path)
+                paths.append(path)
+            start = time.perf_counter()
+            list(transform_many(paths, workers=1, handler_config=self.HANDLER_CONFIG))
+            single_time = time.perf_counter() - start
+            start = time.perf_counter()
+            list(transform_many(paths, workers=2, handler_config=self.HANDLER_CONFIG))
+            parallel_time = time.perf_counter() - start
+            self.assertLessEqual(parallel_time, single_time)
+        finally:
+            shutil.rmtree(directory)
@@ -1,5 +1,6 @@
 from pycfdi_transform import CFDI40SAXHandler
 from pycfdi_transform.formatters.cfdi40.cda_cfdi40_formatter import CDACFDI40Formatter
+import time
 import unittest
 
 class TestCDACFDI40Formatter(unittest.TestCase):
@@ -122,6 +123,14 @@ class TestCDACFDI40Formatter(unittest.TestCase):
         self.assertEqual(data_columns[0][30],'0.000000')
         self.assertEqual(data_columns[0][31],'154.800000')
     
+    def test_formatter_cfdi40_without_implocal10(self):
+        cfdi_data = CFDI40SAXHandler().transform_from_file('./tests/Resources/cfdi40/cfdi40_01.xml')
+        for safe_numerics, expected in ((False, ''), (True, '0.00')):
+            formatter = CDACFDI40Formatter(cfdi_data, safe_numerics=safe_numerics)
+            named_dict = dict(zip(formatter.get_columns_names(), formatter.dict_to_columns()[0]))
+            self.assertEqual(named_dict['TOTALTRASLADOSIMPUESTOSLOCALES'], expected)
+            self.assertEqual(named_dict['TOTALRETENCIONESIMPUESTOSLOCALES'], expected)
+    
     def test_formatter_line_breaks_cfdi40(self):
         sax_handler = CFDI40SAXHandler().use_concepts_cfdi40()
         cfdi_data = sax_handler.transform_from_file('./tests/Resources/cfdi40/cfdi40_01.xml')
@@ -154,4 +163,39 @@ class TestCDACFDI40Formatter(unittest.TestCase):
         self.assertEqual(formatter.get_errors(), '')
         self.assertFalse(formatter.has_addenda())
         self.assertTrue(formatter.get_addendas() is not None and formatter.get_addendas() == "")
-        
\ No newline at end of file
+    
+    def test_formatter_cfdi40_fields_projection(self):
+        cfdi_data = CFDI40SAXHandler(safe_numerics=True, empty_char='-').transform_from_file('./tests/Resources/cfdi40/cfdi40_01_multiple_tfd.xml')
+        expected_columns = CDACFDI40Formatter(cfdi_data, safe_numerics=True, empty_char='-').dict_to_columns()
+        sax_handler = CFDI40SAXHandler(safe_numerics=True, empty_char='-').use_fields(CDACFDI40Formatter.get_fields_names())
+        projected_data = sax_handler.transform_from_file('./tests/Resources/cfdi40/cfdi40_01_multiple_tfd.xml')
+        self.assertEqual(projected_data['cfdi40']['sello'], '-')
+        self.assertEqual(projected_data['cfdi40']['certificado'], '-')
+        self.assertNotIn('sello_sat', projected_data['tfd11'][0])
+        formatter = CDACFDI40Formatter(projected_data, safe_numerics=True, empty_char='-')
+        self.assertTrue(formatter.can_format())
+        self.assertListEqual(formatter.dict_to_columns(), expected_columns)
+    
+    def test_formatter_cfdi40_many_taxes_and_tfds(self):
+        sax_handler = CFDI40SAXHandler().use_implocal10()
+        cfdi_data = sax_handler.transform_from_file('./tests/Resources/cfdi40/cfdi40_01.xml')
+        taxes = cfdi_data['cfdi40']['impuestos']
+        taxes['traslados'] = taxes['traslados'] * 2000
+        taxes['retenciones'] = taxes['retenciones'] * 2000
+        cfdi_data['tfd11'] = cfdi_data['tfd11'] * 50
+        cfdi_data['implocal10'] = [{'total_traslados_impuestos_locales': '1.50', 'total_retenciones_impuestos_locales': '77.40'}] * 2000
+        start = time.time()
+        formatter = CDACFDI40Formatter(cfdi_data)
+        self.assertTrue(formatter.can_format())
+        row_list = formatter.dict_to_columns()
+        end_time = time.time() - start
+        self.assertEqual(len(row_list), 50)
+        named_dict = dict(zip(formatter.get_columns_names(), row_list[-1]))
+        self.assertEqual(named_dict['IVATRASLADO'], '3230900469.812000')
+        self.assertEqual(named_dict['IEPSTRASLADO'], '3230900469.812000')
+        self.assertEqual(named_dict['ISRRETENIDO'], '35083221879.248000')
+        self.assertEqual(named_dict['IVARETENIDO'], '2758600469.812000')
+        self.assertEqual(named_dict['IEPSRETENIDO'], '0.00')
+        self.assertEqual(named_dict['TOTALTRASLADOSIMPUESTOSLOCALES'], '3000.00')
+        self.assertEqual(named_dict['TOTALRETENCIONESIMPUESTOSLOCALES'], '154800.00')
+        self.assertLess(end_time, 0.5)
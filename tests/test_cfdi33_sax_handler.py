@@ -730,4 +730,28 @@ class TestCFDI33SAXHandler(unittest.TestCase):
         # sello_tfd   
         self.assertTrue('\n' not in str(cfdi_data['tfd11'][0]['sello_cfd']))
         self.assertTrue('\r' not in str(cfdi_data['tfd11'][0]['sello_cfd']))
-        self.assertTrue('\t' not in str(cfdi_data['tfd11'][0]['sello_cfd']))
\ No newline at end of file
+        self.assertTrue('\t' not in str(cfdi_data['tfd11'][0]['sello_cfd']))
+
+    def test_transform_from_bytes(self):
+        sax_handler = CFDI33SAXHandler().use_concepts_cfdi33()
+        expected_dict = sax_handler.transform_from_file('./tests/Resources/cfdi33/cfdi33_01_utf8chars.xml')
+        with open('./tests/Resources/cfdi33/cfdi33_01_utf8chars.xml', 'rb') as file:
+            xml_bytes = file.read()
+        self.assertDictEqual(sax_handler.transform_from_bytes(xml_bytes), expected_dict)
+        self.assertDictEqual(sax_handler.transform_from_bytes(memoryview(xml_bytes)), expected_dict)
+        self.assertEqual(expected_dict['cfdi33']['conceptos'][0]['no_identificacion'], 'prodüctoInventarió')
+    
+    def test_transform_from_bytes_declared_encoding(self):
+        sax_handler = CFDI33SAXHandler().use_concepts_cfdi33()
+        expected_dict = sax_handler.transform_from_file('./tests/Resources/cfdi33/cfdi33_01_utf8chars.xml')
+        with open('./tests/Resources/cfdi33/cfdi33_01_utf8chars.xml', 'r', encoding='utf-8') as file:
+            xml_str = file.read().replace('encoding="utf-8"', 'encoding="ISO-8859-1"', 1)
+        cfdi_data = sax_handler.transform_from_bytes(xml_str.encode('ISO-8859-1'))
+        self.assertDictEqual(cfdi_data, expected_dict)
+    
+    def test_iter_concepts(self):
+        sax_handler = CFDI33SAXHandler().use_concepts_cfdi33()
+        expected_concepts = sax_handler.transform_from_file('./tests/Resources/cfdi33/cfdi33_01_utf8chars.xml')['cfdi33']['conceptos']
+        self.assertListEqual(list(CFDI33SAXHandler().iter_concepts('./tests/Resources/cfdi33/cfdi33_01_utf8chars.xml')), expected_concepts)
+        with self.assertRaises(ValueError):
+            list(CFDI33SAXHandler().iter_concepts('./tests/Resources/cfdi40/cfdi40_01.xml'))
@@ -1,6 +1,13 @@
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from pycfdi_transform import CFDI40SAXHandler, SchemaHelper
+from lxml import etree
+import types
+import subprocess
+import tempfile
 import time
+import sys
+import os
 
 class TestCFDI40SAXHandler(unittest.TestCase):
     def test_build_basic_object(self):
@@ -840,4 +847,195 @@ class TestCFDI40SAXHandler(unittest.TestCase):
         sax_handler = CFDI40SAXHandler(safe_numerics=True, empty_char='-')
         with self.assertRaises(ValueError) as context:
             cfdi_data = sax_handler.transform_from_file('./tests/Resources/cfdi33/cfdi33_01.xml')
-        self.assertTrue("does't have correct namespace for CFDI V4.0" in str(context.exception))
\ No newline at end of file
+        self.assertTrue("does't have correct namespace for CFDI V4.0" in str(context.exception))
+
+    def test_transform_from_bytes(self):
+        sax_handler = CFDI40SAXHandler()
+        expected_dict = sax_handler.transform_from_file('./tests/Resources/cfdi40/cfdi40_01.xml')
+        with open('./tests/Resources/cfdi40/cfdi40_01.xml', 'rb') as file:
+            xml_bytes = file.read()
+        self.assertDictEqual(sax_handler.transform_from_bytes(xml_bytes), expected_dict)
+        self.assertDictEqual(sax_handler.transform_from_bytes(memoryview(xml_bytes)), expected_dict)
+    
+    def test_transform_from_bytes_cfdi33(self):
+        sax_handler = CFDI40SAXHandler()
+        with open('./tests/Resources/cfdi33/cfdi33_01.xml', 'rb') as file:
+            xml_bytes = file.read()
+        with self.assertRaises(ValueError) as context:
+            sax_handler.transform_from_bytes(xml_bytes)
+        self.assertIn('The CFDI does\'t have correct namespace for CFDI V4.0.', str(context.exception))
+    
+    def test_default_data_not_shared(self):
+        sax_handler = CFDI40SAXHandler(safe_numerics=True, empty_char='-')
+        first_data = sax_handler.transform_from_file('./tests/Resources/cfdi40/cfdi40_01.xml')
+        second_data = CFDI40SAXHandler(safe_numerics=True, empty_char='-')._get_default_data()
+        self.assertIsNot(first_data['cfdi40']['emisor'], second_data['cfdi40']['emisor'])
+        self.assertIsNot(first_data['cfdi40']['impuestos']['traslados'], second_data['cfdi40']['impuestos']['traslados'])
+        self.assertEqual(second_data['cfdi40']['emisor']['rfc'], '-')
+        self.assertEqual(second_data['cfdi40']['descuento'], '0.00')
+        self.assertEqual(second_data['cfdi40']['tipo_cambio'], '1.00')
+        self.assertListEqual(second_data['cfdi40']['impuestos']['traslados'], [])
+        self.assertListEqual(second_data['tfd11'], [])
+        self.assertEqual(CFDI40SAXHandler()._get_default_data()['cfdi40']['descuento'], '')
+    
+    def test_transform_shared_between_threads(self):
+        sax_handler = CFDI40SAXHandler().use_concepts_cfdi40().use_implocal10()
+        paths = ['./tests/Resources/cfdi40/cfdi40_01.xml', './tests/Resources/cfdi40/cfdi40_01_multiple_tfd.xml', './tests/Resources/implocal/cfdi40_01_implocal.xml', './tests/Resources/cfdi40/cfdi40_01_addenda.xml'] * 50
+        expected = [CFDI40SAXHandler().use_concepts_cfdi40().use_implocal10().transform_from_file(path) for path in paths]
+        with ThreadPoolExecutor(8) as executor:
+            results = list(executor.map(sax_handler.transform_from_file, paths))
+            stream_results = list(executor.map(sax_handler.transform_from_stream, paths))
+        self.assertListEqual(results, expected)
+        self.assertListEqual(stream_results, expected)
+        self.assertEqual(len({id(result) for result in results}), len(paths))
+    
+    def test_transform_from_stream(self):
+        sax_handler = CFDI40SAXHandler().use_concepts_cfdi40().use_implocal10()
+        for path in ['./tests/Resources/cfdi40/cfdi40_01.xml', './tests/Resources/cfdi40/cfdi40_01_multiple_tfd.xml', './tests/Resources/implocal/cfdi40_01_implocal.xml']:
+            expected_dict = sax_handler.transform_from_file(path)
+            self.assertDictEqual(sax_handler.transform_from_stream(path), expected_dict)
+            with open(path, 'rb') as file:
+                self.assertDictEqual(sax_handler.transform_from_stream(file), expected_dict)
+    
+    def test_transform_from_stream_cfdi33(self):
+        sax_handler = CFDI40SAXHandler()
+        with self.assertRaises(ValueError) as context:
+            sax_handler.transform_from_stream('./tests/Resources/cfdi33/cfdi33_01.xml')
+        self.assertIn('The CFDI does\'t have correct namespace for CFDI V4.0.', str(context.exception))
+    
+    def test_iter_concepts(self):
+        sax_handler = CFDI40SAXHandler().use_concepts_cfdi40()
+        expected_concepts = sax_handler.transform_from_file('./tests/Resources/cfdi40/cfdi40_01.xml')['cfdi40']['conceptos']
+        concepts = CFDI40SAXHandler().iter_concepts('./tests/Resources/cfdi40/cfdi40_01.xml')
+        self.assertIsInstance(concepts, types.GeneratorType)
+        self.assertDictEqual(next(concepts), expected_concepts[0])
+        self.assertListEqual([expected_concepts[0]] + list(concepts), expected_concepts)
+        with open('./tests/Resources/cfdi40/cfdi40_01.xml', 'rb') as file:
+            self.assertListEqual(list(sax_handler.iter_concepts(file)), expected_concepts)
+    
+    def test_iter_concepts_fields(self):
+        sax_handler = CFDI40SAXHandler().use_fields(['cfdi40.conceptos.importe'])
+        concepts = list(sax_handler.iter_concepts('./tests/Resources/cfdi40/cfdi40_01.xml'))
+        self.assertListEqual(concepts[:2], [{'importe': '3916480.234906'}, {'importe': '2922160.234906'}])
+        sax_handler = CFDI40SAXHandler().use_fields(['cfdi40.emisor'])
+        self.assertEqual(len(next(sax_handler.iter_concepts('./tests/Resources/cfdi40/cfdi40_01.xml'))), 9)
+    
+    def test_iter_concepts_cfdi33(self):
+        sax_handler = CFDI40SAXHandler()
+        with self.assertRaises(ValueError) as context:
+            list(sax_handler.iter_concepts('./tests/Resources/cfdi33/cfdi33_01.xml'))
+        self.assertIn('The CFDI does\'t have correct namespace for CFDI V4.0.', str(context.exception))
+    
+    @unittest.skipUnless(os.path.exists('/proc/self/status'), 'Peak memory is read from /proc')
+    def test_transform_from_stream_memory(self):
+        # Synthetic CFDI of ~17 MB made of copies of the concepts in cfdi40_01.xml
+        with open('./tests/Resources/cfdi40/cfdi40_01.xml', 'r', encoding='utf-8') as file:
+            xml_str = file.read()
+        head, rest = xml_str.split('<cfdi:Conceptos>')
+        concepts, tail = rest.split('</cfdi:Conceptos>')
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'cfdi40_synthetic.xml')
+            with open(path, 'w', encoding='utf-8') as file:
+                file.write(head + '<cfdi:Conceptos>')
+                for _ in range(4000):
+                    file.write(concepts)
+                file.write('</cfdi:Conceptos>' + tail)
+            stream_memory = self.__get_peak_memory('transform_from_stream', path)
+            tree_memory = self.__get_peak_memory('transform_from_file', path)
+        self.assertLess(stream_memory * 2, tree_memory, 'Too much memory to transform cfdi as stream')
+
+    def __get_peak_memory(self, method:str, path:str) -> int:
+        script = (
+            'import sys\n'
+            'from pycfdi_transform import CFDI40SAXHandler\n'
+            'cfdi_data = getattr(CFDI40SAXHandler(), sys.argv[1])(sys.argv[2])\n'
+            'print([line.split()[1] for line in open("/proc/self/status") if line.startswith("VmHWM")][0])'
+        )
+        return int(subprocess.check_output([sys.executable, '-c', script, method, path]))
+    
+    def __get_test_schema(self, required_attribute:str = None) -> etree.XMLSchema:
+        required = f'<xs:attribute name="{required_attribute}" use="required"/>' if required_attribute else ''
+        return etree.XMLSchema(etree.XML(
+            '<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema" targetNamespace="http://www.sat.gob.mx/cfd/4" elementFormDefault="qualified">'
+            '<xs:element name="Comprobante"><xs:complexType><xs:sequence><xs:any minOccurs="0" maxOccurs="unbounded" processContents="skip"/></xs:sequence>'
+            f'{required}<xs:anyAttribute processContents="skip"/></xs:complexType></xs:element></xs:schema>'
+        ))
+    
+    def test_validation_sample(self):
+        path = './tests/Resources/cfdi40/cfdi40_01_minimal.xml'
+        sax_handler = CFDI40SAXHandler(schema_validator=self.__get_test_schema('NotFound'))
+        with self.assertRaises(etree.DocumentInvalid):
+            sax_handler.transform_from_file(path)
+        sax_handler.use_validation_sample(0.0)
+        self.assertIsNotNone(sax_handler.transform_from_file(path))
+        sax_handler.use_validation_sample(0.5, seed=10)
+        invalid = 0
+        for _ in range(200):
+            try:
+                sax_handler.transform_from_file(path)
+            except etree.DocumentInvalid:
+                invalid += 1
+        self.assertGreater(invalid, 50)
+        self.assertLess(invalid, 150)
+    
+    def test_deferred_validation(self):
+        path = './tests/Resources/cfdi40/cfdi40_01_minimal.xml'
+        sax_handler = CFDI40SAXHandler(schema_validator=self.__get_test_schema()).use_deferred_validation(2)
+        expected_dict = CFDI40SAXHandler().transform_from_file(path)
+        with open(path, 'rb') as file:
+            xml_bytes = file.read()
+        results = [sax_handler.transform_from_file(path), sax_handler.transform_from_bytes(xml_bytes), sax_handler.transform_from_string(xml_bytes.decode())]
+        validated = sax_handler.wait_validations()
+        self.assertEqual(len(validated), 3)
+        for result, validated_result in zip(results, validated):
+            self.assertIs(result, validated_result)
+            self.assertDictEqual(result['validation'], {'valid': True, 'error': ''})
+            del result['validation']
+            self.assertDictEqual(result, expected_dict)
+        self.assertListEqual(sax_handler.wait_validations(), [])
+        sax_handler = CFDI40SAXHandler(schema_validator=self.__get_test_schema('NotFound')).use_deferred_validation()
+        cfdi_data = sax_handler.transform_from_file(path)
+        sax_handler.wait_validations()
+        self.assertFalse(cfdi_data['validation']['valid'])
+        self.assertIn('NotFound', cfdi_data['validation']['error'])
+        with self.assertRaises(ValueError) as context:
+            sax_handler.transform_from_stream(path)
+        self.assertIn('Deferred validation', str(context.exception))
+        sax_handler.close()
+        # Without the threads the stream is validated inline
+        with self.assertRaises(etree.XMLSyntaxError):
+            sax_handler.transform_from_stream(path)
+    
+    def test_deferred_validation_annotated_by_caller(self):
+        path = './tests/Resources/cfdi40/cfdi40_01_minimal.xml'
+        with CFDI40SAXHandler(schema_validator=self.__get_test_schema('NotFound')).use_deferred_validation(2) as sax_handler:
+            cfdi_data = sax_handler.transform_from_file(path)
+            with self.assertRaises(ValueError):
+                sax_handler.transform_from_file('./tests/Resources/cfdi33/cfdi33_01.xml')
+            self.assertEqual(len(sax_handler._pending_validations), 1)
+            sax_handler._pending_validations[0][1].result()
+            self.assertNotIn('validation', cfdi_data)
+            self.assertListEqual(sax_handler.wait_validations(), [cfdi_data])
+            self.assertFalse(cfdi_data['validation']['valid'])
+            executor = sax_handler._validation_executor
+        self.assertIsNone(sax_handler._validation_executor)
+        with self.assertRaises(RuntimeError):
+            executor.submit(print)
+    
+    def test_validation_policy_benchmark(self):
+        path = './tests/Resources/cfdi40/cfdi40_01_minimal.xml'
+        timings = {}
+        for policy in ('all', 'sample', 'deferred'):
+            sax_handler = CFDI40SAXHandler(schema_validator=self.__get_test_schema())
+            if policy == 'sample':
+                sax_handler.use_validation_sample(0.1)
+            elif policy == 'deferred':
+                sax_handler.use_deferred_validation(2)
+            start_time = time.time()
+            for _ in range(500):
+                sax_handler.transform_from_file(path)
+            timings[policy] = time.time() - start_time
+            sax_handler.wait_validations()
+        self.assertLessEqual(timings['all'], 1.0, 'Too much time to validate all documents')
+        self.assertLessEqual(timings['sample'], 1.0, 'Too much time to validate a sample of documents')
+        self.assertLessEqual(timings['deferred'], 1.0, 'Too much time to transform with deferred validation')
@@ -0,0 +1,69 @@
+from pycfdi_transform import CFDI33SAXHandler, CFDI40SAXHandler, CFDIAutoSAXHandler, CompressionHelper
+import bz2
+import gzip
+import lzma
+import os
+import shutil
+import tempfile
+import unittest
+
+class TestCompressionHelper(unittest.TestCase):
+    COMPRESSORS = {
+        '.gz': gzip.compress,
+        '.bz2': bz2.compress,
+        '.xz': lzma.compress
+    }
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def __compress(self, path:str, extension:str) -> str:
+        compressed_path = os.path.join(self.directory, os.path.basename(path) + extension)
+        with open(path, 'rb') as file, open(compressed_path, 'wb') as compressed_file:
+            compressed_file.write(self.COMPRESSORS[extension](file.read()))
+        return compressed_path
+
+    def test_open(self):
+        path = './tests/Resources/cfdi40/cfdi40_01.xml'
+        with open(path, 'rb') as file:
+            xml_bytes = file.read()
+        for extension in self.COMPRESSORS:
+            compressed_path = self.__compress(path, extension)
+            self.assertTrue(CompressionHelper.is_compressed(compressed_path))
+            with CompressionHelper.open(compressed_path) as file:
+                self.assertEqual(file.read(), xml_bytes)
+            self.assertLessEqual(os.path.getsize(compressed_path), len(xml_bytes) / 2)
+        self.assertFalse(CompressionHelper.is_compressed(path))
+        with CompressionHelper.open(path) as file:
+            self.assertEqual(file.read(), xml_bytes)
+
+    def test_transform_compressed(self):
+        cases = [
+            (CFDI33SAXHandler().use_nomina12().use_concepts_cfdi33(), './tests/Resources/nomina12/nomina12_01.xml'),
+            (CFDI40SAXHandler().use_implocal10().use_concepts_cfdi40(), './tests/Resources/implocal/cfdi40_01_implocal.xml')
+        ]
+        for sax_handler, path in cases:
+            expected_dict = sax_handler.transform_from_file(path)
+            expected_concepts = list(sax_handler.iter_concepts(path))
+            for extension in self.COMPRESSORS:
+                compressed_path = self.__compress(path, extension)
+                self.assertDictEqual(sax_handler.transform_from_file(compressed_path), expected_dict)
+                self.assertDictEqual(sax_handler.transform_from_stream(compressed_path), expected_dict)
+                self.assertListEqual(list(sax_handler.iter_concepts(compressed_path)), expected_concepts)
+
+    def test_transform_auto_compressed(self):
+        sax_handler = CFDIAutoSAXHandler().use_nomina12()
+        for path in ['./tests/Resources/cfdi33/cfdi33_01.xml', './tests/Resources/cfdi40/cfdi40_01.xml', './tests/Resources/nomina12/nomina12_01.xml']:
+            for extension in self.COMPRESSORS:
+                self.assertDictEqual(sax_handler.transform(self.__compress(path, extension)), sax_handler.transform(path))
+
+    def test_transform_strict_parse_compressed(self):
+        sax_handler = CFDI33SAXHandler().use_nomina12().use_strict_parse()
+        path = './tests/Resources/nomina12/double_breaks_nomina01.xml'
+        expected_dict = sax_handler.transform_from_file(path)
+        for extension in self.COMPRESSORS:
+            self.assertDictEqual(sax_handler.transform_from_file(self.__compress(path, extension)), expected_dict)
+            self.assertTrue(sax_handler.recovered)
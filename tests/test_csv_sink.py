@@ -0,0 +1,91 @@
+from pycfdi_transform import CDACFDI40Formatter, CFDIAutoSAXHandler, CsvSink, EfiscoPagos10Formatter, transform_many
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+import csv
+import io
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+class TestCsvSink(unittest.TestCase):
+    PATHS = [
+        './tests/Resources/cfdi40/cfdi40_01.xml',
+        './tests/Resources/cfdi33/cfdi33_01.xml',
+        './tests/Resources/implocal/cfdi40_01_implocal.xml',
+        './tests/Resources/cfdi40/not_found.xml'
+    ]
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def __read_csv(self, path:str) -> list:
+        with open(path, newline='', encoding='utf-8') as file:
+            return list(csv.reader(file))
+
+    def test_write(self):
+        cfdi_data = CFDIAutoSAXHandler().use_implocal10().transform(self.PATHS[2])
+        stream = io.StringIO(newline='')
+        sink = CsvSink(CDACFDI40Formatter, stream, safe_numerics=True)
+        self.assertEqual(sink.write(cfdi_data), 1)
+        sink.close()
+        rows = list(csv.reader(io.StringIO(stream.getvalue(), newline='')))
+        self.assertListEqual(rows, [CDACFDI40Formatter.get_columns_names()] + CDACFDI40Formatter(cfdi_data, safe_numerics=True).dict_to_columns())
+        self.assertEqual(sink.rows_count, 1)
+
+    def test_write_many_skipped(self):
+        path = os.path.join(self.directory, 'cfdi40.csv')
+        with CsvSink(CDACFDI40Formatter, path, delimiter='|') as sink:
+            rows_count = sink.write_many(transform_many(self.PATHS, workers=2, threads=True, errors='record'))
+        self.assertEqual(rows_count, 2)
+        skipped = sink.get_skipped()
+        self.assertListEqual([name for name, _ in skipped], self.PATHS[1::2])
+        self.assertEqual(skipped[0][1], 'Este formatter únicamente soporta datos de cfdi40.')
+        with open(path, newline='', encoding='utf-8') as file:
+            rows = list(csv.reader(file, delimiter='|'))
+        self.assertEqual(len(rows), 3)
+        self.assertListEqual(rows[0], CDACFDI40Formatter.get_columns_names())
+        self.assertEqual(rows[1][rows[0].index('UUID')], CFDIAutoSAXHandler().transform(self.PATHS[0])['tfd11'][0]['uuid'])
+
+    def test_write_rows_directly(self):
+        cfdi_data = CFDIAutoSAXHandler().use_pagos10().transform('./tests/Resources/pagos10/pago10_01.xml')
+        expected_rows = EfiscoPagos10Formatter(cfdi_data).dict_to_columns()
+        stream = io.StringIO(newline='')
+        sink = CsvSink(EfiscoPagos10Formatter, stream, header=False)
+        with mock.patch.object(EfiscoPagos10Formatter, 'dict_to_columns') as dict_to_columns:
+            self.assertEqual(sink.write_many([cfdi_data] * 2), len(expected_rows) * 2)
+        dict_to_columns.assert_not_called()
+        # Rows are written without waiting for close
+        self.assertListEqual(list(csv.reader(io.StringIO(stream.getvalue(), newline=''))), expected_rows * 2)
+        self.assertEqual(sink.rows_count, len(expected_rows) * 2)
+
+    def test_concat_parts(self):
+        sax_handler = CFDIAutoSAXHandler().use_implocal10()
+        documents = [sax_handler.transform(path) for path in self.PATHS[:3]] * 10
+        path = os.path.join(self.directory, 'cfdi40.csv')
+        with CsvSink(CDACFDI40Formatter, path) as sink:
+            sink.write_many(documents)
+        part_paths = [CsvSink.get_part_path(os.path.join(self.directory, 'parts.csv'), part) for part in range(3)]
+        def write_part(part:int) -> None:
+            with CsvSink(CDACFDI40Formatter, part_paths[part], header=False) as part_sink:
+                part_sink.write_many(documents[part * 10:(part + 1) * 10])
+        with ThreadPoolExecutor(3) as executor:
+            list(executor.map(write_part, range(3)))
+        CsvSink.concat_parts(CDACFDI40Formatter, part_paths, os.path.join(self.directory, 'parts.csv'))
+        self.assertListEqual(self.__read_csv(os.path.join(self.directory, 'parts.csv')), self.__read_csv(path))
+        self.assertFalse(any(os.path.exists(part_path) for part_path in part_paths))
+
+    def test_csv_sink_benchmark(self):
+        cfdi_data = CFDIAutoSAXHandler().use_pagos10().transform('./tests/Resources/pagos10/pago_complete.xml')
+        cfdi_data['tfd11'] = [{'version': '1.1', 'no_certificado_sat': '', 'uuid': '9D81C696-0401-4F85-B703-6E0D3AFD6057', 'fecha_timbrado': '2019-03-29T17:42:38', 'rfc_prov_cert': 'AAA010101AAA', 'sello_cfd': 'G3knPza1r8hfxSb', 'sello_sat': ''}]
+        path = os.path.join(self.directory, 'pagos10.csv')
+        start_time = time.time()
+        with CsvSink(EfiscoPagos10Formatter, path) as sink:
+            sink.write_many([cfdi_data] * 5000)
+        rows_per_second = sink.rows_count / (time.time() - start_time)
+        self.assertEqual(sink.rows_count, 40000)
+        self.assertGreaterEqual(rows_per_second, 10000, f'Only {rows_per_second:.0f} rows/second written')
@@ -0,0 +1,55 @@
+from pycfdi_transform.helpers.decimal_accumulator import DecimalAccumulator
+from pycfdi_transform.helpers.string_helper import StringHelper
+import time
+import unittest
+
+class TestDecimalAccumulator(unittest.TestCase):
+    CASES = [
+        [],
+        [''],
+        ['16.00'],
+        ['1E+2'],
+        ['abc'],
+        ['0.00', '16.0'],
+        ['0.00', '', '1.5', '2.25', None],
+        ['', '100', '200'],
+        ['abc', '10.10'],
+        ['-', '10.10', '-3.333333'],
+        ['0.00'] + ['0.01'] * 1000,
+        ['123456789012345678.12', '0.000001', '-99.9']
+    ]
+
+    @staticmethod
+    def __sum_strings(values:list) -> str:
+        total = None
+        for value in values:
+            total = StringHelper.sum_strings(total, value)
+        return total
+
+    def test_same_result_as_sum_strings(self):
+        for values in self.CASES:
+            accumulator = DecimalAccumulator()
+            for value in values:
+                accumulator.add(value)
+            # Without values sum_strings may return '' instead of None, both are formatted as the empty value
+            self.assertEqual(accumulator.to_string(), self.__sum_strings(values) or None, values)
+
+    def test_initial(self):
+        self.assertEqual(DecimalAccumulator('0.00').to_string(), '0.00')
+        self.assertEqual(DecimalAccumulator('0.00').add('16.0').add('').to_string(), '16.00')
+        self.assertIsNone(DecimalAccumulator().add('').to_string())
+        self.assertEqual(DecimalAccumulator('').add('').add(None).to_string(), '')
+        self.assertEqual(DecimalAccumulator('').add('10.10').to_string(), '10.10')
+
+    def test_accumulator_benchmark(self):
+        values = ['1234.56', '0.16', '', '789.0'] * 2500
+        start_time = time.time()
+        self.__sum_strings(values)
+        sum_strings_time = time.time() - start_time
+        start_time = time.time()
+        accumulator = DecimalAccumulator()
+        for value in values:
+            accumulator.add(value)
+        accumulator.to_string()
+        accumulator_time = time.time() - start_time
+        self.assertLessEqual(accumulator_time, sum_strings_time, 'Too much time to accumulate decimals')
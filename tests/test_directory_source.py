@@ -0,0 +1,69 @@
+from pycfdi_transform import CFDIAutoSAXHandler, DirectorySource, transform_many
+import gzip
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+class TestDirectorySource(unittest.TestCase):
+    PATHS = [
+        './tests/Resources/cfdi33/cfdi33_01.xml',
+        './tests/Resources/cfdi40/cfdi40_01.xml',
+        './tests/Resources/nomina12/nomina12_01.xml',
+        './tests/Resources/implocal/cfdi40_01_implocal.xml'
+    ]
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        os.makedirs(os.path.join(self.directory, '2021', '01'))
+        self.files = []
+        for index, path in enumerate(self.PATHS):
+            target = os.path.join(self.directory, '2021' if index % 2 else '2021/01', os.path.basename(path))
+            shutil.copyfile(path, target)
+            self.files.append(target)
+        with open(self.PATHS[1], 'rb') as file, gzip.open(os.path.join(self.directory, 'cfdi40_01.xml.gz'), 'wb') as compressed_file:
+            compressed_file.write(file.read())
+        self.files.append(os.path.join(self.directory, 'cfdi40_01.xml.gz'))
+        with open(os.path.join(self.directory, 'LEEME.txt'), 'w') as file:
+            file.write('not a CFDI')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_scan(self):
+        self.assertCountEqual([path for path, _ in DirectorySource(self.directory).scan()], self.files)
+        self.assertCountEqual(list(DirectorySource(self.directory, largest_first=False)), self.files)
+        self.assertListEqual(list(DirectorySource(self.directory, recursive=False)), [os.path.join(self.directory, 'cfdi40_01.xml.gz')])
+        self.assertListEqual(list(DirectorySource(self.directory, suffixes=('.txt',))), [os.path.join(self.directory, 'LEEME.txt')])
+
+    def test_largest_first(self):
+        paths = list(DirectorySource(self.directory))
+        self.assertListEqual(paths, sorted(self.files, key=os.path.getsize, reverse=True))
+
+    def test_transform(self):
+        sax_handler = CFDIAutoSAXHandler().use_nomina12().use_implocal10()
+        expected = [(path, sax_handler.transform(path)) for path in DirectorySource(self.directory)]
+        self.assertListEqual(list(DirectorySource(self.directory).transform(sax_handler)), expected)
+        self.assertListEqual(list(transform_many(DirectorySource(self.directory), workers=2, handler_config={'nomina12': True, 'implocal10': True})), expected)
+
+    @unittest.skipIf((os.cpu_count() or 1) < 2, 'Scheduling benchmark needs more than one CPU.')
+    def test_largest_first_benchmark(self):
+        with open(self.PATHS[1], 'r', encoding='utf-8') as file:
+            xml_str = file.read()
+        head, rest = xml_str.split('<cfdi:Conceptos>')
+        concepts, tail = rest.split('</cfdi:Conceptos>')
+        # The giant file is the last one scanned
+        with open(os.path.join(self.directory, 'zz_giant.xml'), 'w', encoding='utf-8') as file:
+            file.write(head + '<cfdi:Conceptos>' + concepts * 2000 + '</cfdi:Conceptos>' + tail)
+        for index in range(400):
+            shutil.copyfile(self.PATHS[index % len(self.PATHS)], os.path.join(self.directory, f'{index:04d}.xml'))
+        handler_config = {'concepts': True}
+        scan_paths = sorted(DirectorySource(self.directory, recursive=False, largest_first=False))
+        start_time = time.time()
+        list(transform_many(scan_paths, workers=2, handler_config=handler_config))
+        scan_time = time.time() - start_time
+        start_time = time.time()
+        list(transform_many(DirectorySource(self.directory, recursive=False), workers=2, handler_config=handler_config))
+        largest_first_time = time.time() - start_time
+        self.assertLessEqual(largest_first_time, scan_time)
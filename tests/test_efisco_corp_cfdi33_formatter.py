@@ -1,5 +1,6 @@
 from pycfdi_transform import CFDI33SAXHandler
 from pycfdi_transform.formatters.cfdi33.efisco_corp_cfdi33_formatter import EfiscoCorpCFDI33Formatter
+import time
 import unittest
 
 class TestEfiscoCorpCFDI33Formatter(unittest.TestCase):
@@ -112,6 +113,14 @@ class TestEfiscoCorpCFDI33Formatter(unittest.TestCase):
         self.assertEqual(data_columns[0][32],'20.000000')
         self.assertEqual(data_columns[0][33],'40.000000')
     
+    def test_formatter_cfdi33_without_implocal10(self):
+        cfdi_data = CFDI33SAXHandler().transform_from_file('./tests/Resources/cfdi33/cfdi33_01.xml')
+        for safe_numerics, expected in ((False, ''), (True, '0.00')):
+            formatter = EfiscoCorpCFDI33Formatter(cfdi_data, safe_numerics=safe_numerics)
+            named_dict = dict(zip(formatter.get_columns_names(), formatter.dict_to_columns()[0]))
+            self.assertEqual(named_dict['TOTALTRASLADOSIMPUESTOSLOCALES'], expected)
+            self.assertEqual(named_dict['TOTALRETENCIONESIMPUESTOSLOCALES'], expected)
+    
     def test_formatter_line_breaks_cfdi33(self):
         sax_handler = CFDI33SAXHandler().use_concepts_cfdi33()
         cfdi_data = sax_handler.transform_from_file('./tests/Resources/cfdi33/cfdi33_01.xml')
@@ -127,3 +136,48 @@ class TestEfiscoCorpCFDI33Formatter(unittest.TestCase):
         self.assertEqual(named_column['RECEPTORNOMBRE'], 'PUBLICO EN GENERAL')
         self.assertEqual(named_column['C_DESCRIPCION'], 'Detalle factura')
         self.assertEqual(named_column['COMPLEMENTOS'], 'TimbreFiscalDigital')
+    
+    def test_formatter_cfdi33_fields_projection(self):
+        cfdi_data = CFDI33SAXHandler().use_concepts_cfdi33().transform_from_file('./tests/Resources/cfdi33/cfdi33_01_utf8chars.xml')
+        expected_columns = EfiscoCorpCFDI33Formatter(cfdi_data).dict_to_columns()
+        sax_handler = CFDI33SAXHandler().use_concepts_cfdi33().use_fields(EfiscoCorpCFDI33Formatter.get_fields_names())
+        projected_data = sax_handler.transform_from_file('./tests/Resources/cfdi33/cfdi33_01_utf8chars.xml')
+        self.assertEqual(projected_data['cfdi33']['sello'], '')
+        self.assertEqual(projected_data['cfdi33']['certificado'], '')
+        self.assertListEqual(EfiscoCorpCFDI33Formatter(projected_data).dict_to_columns(), expected_columns)
+    
+    def test_fields_projection_subset(self):
+        sax_handler = CFDI33SAXHandler().use_fields(['cfdi33.total', 'cfdi33.emisor', 'tfd11.uuid'])
+        cfdi_data = sax_handler.transform_from_file('./tests/Resources/cfdi33/cfdi33_01.xml')
+        self.assertEqual(cfdi_data['cfdi33']['total'], '11.60')
+        self.assertEqual(cfdi_data['cfdi33']['folio'], '')
+        self.assertEqual(cfdi_data['cfdi33']['complementos'], '')
+        self.assertListEqual(cfdi_data['cfdi33']['impuestos']['traslados'], [])
+        self.assertDictEqual(cfdi_data['cfdi33']['emisor'], {'rfc': 'EKU9003173C9', 'nombre': 'ESCUELA KEMPER URGATE SA DE CV', 'regimen_fiscal': '601'})
+        self.assertDictEqual(cfdi_data['tfd11'][0], {'version': '', 'no_certificado_sat': '', 'uuid': '9D81C696-0401-4F85-B703-6E0D3AFD6056', 'fecha_timbrado': '', 'rfc_prov_cert': '', 'sello_cfd': ''})
+        sax_handler.use_fields(None)
+        self.assertEqual(sax_handler.transform_from_file('./tests/Resources/cfdi33/cfdi33_01.xml')['cfdi33']['folio'], '001002004')
+    
+    def test_formatter_cfdi33_many_taxes_and_tfds(self):
+        sax_handler = CFDI33SAXHandler().use_implocal10()
+        cfdi_data = sax_handler.transform_from_file('./tests/Resources/implocal/cfdi33_implocal02.xml')
+        taxes = cfdi_data['cfdi33']['impuestos']
+        taxes['traslados'] = taxes['traslados'] * 2000
+        taxes['retenciones'] = taxes['retenciones'] * 2000
+        cfdi_data['tfd11'] = cfdi_data['tfd11'] * 50
+        cfdi_data['implocal10'] = [{'total_traslados_impuestos_locales': '1.50', 'total_retenciones_impuestos_locales': '77.40'}] * 2000
+        start = time.time()
+        formatter = EfiscoCorpCFDI33Formatter(cfdi_data)
+        self.assertTrue(formatter.can_format())
+        row_list = formatter.dict_to_columns()
+        end_time = time.time() - start
+        self.assertEqual(len(row_list), 50)
+        named_dict = dict(zip(formatter.get_columns_names(), row_list[-1]))
+        self.assertEqual(named_dict['IVATRASLADO'], '412800.000000')
+        self.assertEqual(named_dict['IEPSTRASLADO'], '0.00')
+        self.assertEqual(named_dict['ISRRETENIDO'], '0.00')
+        self.assertEqual(named_dict['IVARETENIDO'], '0.00')
+        self.assertEqual(named_dict['IEPSRETENIDO'], '0.00')
+        self.assertEqual(named_dict['TOTALTRASLADOSIMPUESTOSLOCALES'], '3000.00')
+        self.assertEqual(named_dict['TOTALRETENCIONESIMPUESTOSLOCALES'], '154800.00')
+        self.assertLess(end_time, 0.5)
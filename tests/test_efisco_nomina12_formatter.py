@@ -267,4 +267,20 @@ class TestEfiscoNomina12Formatter(unittest.TestCase):
         self.assertEqual(nom_2['TOTALPERCEPCIONES'], '780109.05')
         self.assertEqual(nom_2['TOTALSEPARACIONINDEMNIZACION'], '550146.14')
         end_time = time.time() - start
-        self.assertLess(end_time, 0.01)
\ No newline at end of file
+        self.assertLess(end_time, 0.01)
+
+    def test_rows_nomina12_many_complements(self):
+        sax_handler = CFDI33SAXHandler().use_nomina12()
+        cfdi_data = sax_handler.transform_from_file('./tests/Resources/nomina12/double_nomina01.xml')
+        cfdi_data['nomina12'] = cfdi_data['nomina12'] * 500
+        self.assertEqual(len(cfdi_data['nomina12']), 1000)
+        start = time.time()
+        formatter = EfiscoNomina12Formatter(cfdi_data)
+        self.assertTrue(formatter.can_format())
+        row_list = formatter.dict_to_columns()
+        end_time = time.time() - start
+        self.assertEqual(len(row_list), 4000)
+        columns = formatter.get_columns_names()
+        self.assertEqual(row_list[0][columns.index('TOTALPERCEPCIONES')], '36971395.00')
+        self.assertEqual(row_list[-1][columns.index('TOTALPERCEPCIONES')], '36971395.00')
+        self.assertLess(end_time, 0.5)
@@ -187,4 +187,25 @@ class TestEfiscoPagos10Formatter(unittest.TestCase):
             ['3.3', '"', '/>KA', '2018-01-10T07:22:51', '47217725691977968749', '5858580.234906', '9061950.234906', '7679420.234906', 'SGD', '8016540.234907', 'N', 'PPD', '01', '}_', '45734', 'J&O750807563', 'Q~', '611', 'ÑÑD68010919A', '^*p_', 'D01', '9D81C696-0401-4F85-B703-6E0D3AFD6057', '2019-03-29T17:42:38', 'AAA010101AAA', 'G3knPza1r8hfxSb+46JBRAYoQIUTVU2Uqlw/qiMLbzKkqrUs2zs5GVRjf0DJEm5mIGZIC3/+q/FdU1A4zr9RCXWM66QmtK7AAlkT4HSrX9NlCoJylwRzRW6bxuchfy8ryFmWIetAOU2U1brWLSSYqCtc86m4iIBId6kDOSIr+/Tpz2Q3rDHhmtlJyJ2ovy1rjLO0mZpbwhwOKg6Mo1+NeEuGk4UfQu8gfRgv9mOnbiNkfiJHzvuRJnUXYrL/9D1gDQ6gjW8t75W/yYN+Gf2TmpyTnOkYZbFqrJ8udt7rZjXsODLapD7cV4bjsLIYxOWHgXEIgrTjB57m2POrfb72wQ==', 'CP1_P2_DR5', '2015-04-15T09:02:29', '29', 'BHD', '2027230.234907', '2211890.234906', '~\\', '&ÑR880531UH8', '~', 'JS_O33J_3_L3', 'ÑÑX930431318', 'FV485__M__', '2251880.234906', '6446220.469812', '9610150.469812', '15303350.704718', '7452070.469812', '0.00', '0.00', 'ebCA4FBe-3b90-daFC-DDCD-a2b6A296DDcD', '', '', 'AWG', '', 'PPD', '99', '', '', '6085410.234906'],
             ['3.3', '"', '/>KA', '2018-01-10T07:22:51', '47217725691977968749', '5858580.234906', '9061950.234906', '7679420.234906', 'SGD', '8016540.234907', 'N', 'PPD', '01', '}_', '45734', 'J&O750807563', 'Q~', '611', 'ÑÑD68010919A', '^*p_', 'D01', '9D81C696-0401-4F85-B703-6E0D3AFD6057', '2019-03-29T17:42:38', 'AAA010101AAA', 'G3knPza1r8hfxSb+46JBRAYoQIUTVU2Uqlw/qiMLbzKkqrUs2zs5GVRjf0DJEm5mIGZIC3/+q/FdU1A4zr9RCXWM66QmtK7AAlkT4HSrX9NlCoJylwRzRW6bxuchfy8ryFmWIetAOU2U1brWLSSYqCtc86m4iIBId6kDOSIr+/Tpz2Q3rDHhmtlJyJ2ovy1rjLO0mZpbwhwOKg6Mo1+NeEuGk4UfQu8gfRgv9mOnbiNkfiJHzvuRJnUXYrL/9D1gDQ6gjW8t75W/yYN+Gf2TmpyTnOkYZbFqrJ8udt7rZjXsODLapD7cV4bjsLIYxOWHgXEIgrTjB57m2POrfb72wQ==', 'CP1_P3_DR1', '2015-08-06T06:10:27', '26', 'MXN', '', '8426440.234906', '5459', 'AVV941216Z6A', '', '', '', '', '', '', '', '', '', '', '', '', '', '', '', '', '', '', '', '', ''],
         ]
-        self.assertListEqual(expected_rows, row_list)
\ No newline at end of file
+        self.assertListEqual(expected_rows, row_list)
+
+    def test_iter_rows_pagos10_many_doctos(self):
+        sax_handler = CFDI33SAXHandler().use_pagos10()
+        cfdi_data = sax_handler.transform_from_file('./tests/Resources/pagos10/pago10_01.xml')
+        pago = cfdi_data['pagos10'][0]['pago'][0]
+        pago['docto_relacionado'] = pago['docto_relacionado'] * 20000
+        cfdi_data['tfd11'] = cfdi_data['tfd11'] * 2
+        formatter = EfiscoPagos10Formatter(cfdi_data)
+        self.assertTrue(formatter.can_format())
+        start = time.time()
+        rows = formatter.iter_rows()
+        first_row = next(rows)
+        self.assertIsInstance(first_row, tuple)
+        self.assertEqual(len(first_row), len(formatter.get_columns_names()))
+        count = sum(1 for _ in rows) + 1
+        end_time = time.time() - start
+        row_list = formatter.dict_to_columns()
+        self.assertEqual(count, len(row_list))
+        self.assertListEqual(list(first_row), row_list[0])
+        self.assertEqual(row_list[-1][25], 'CP1_P1_DR20000')
+        self.assertLess(end_time, 1)
@@ -0,0 +1,90 @@
+from pycfdi_transform import CFDI33SAXHandler, CFDIAutoSAXHandler, ErrorHelper, TransformError
+from lxml import etree
+from unittest import mock
+import gzip
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+class TestErrorHelper(unittest.TestCase):
+    BROKEN_PATH = './tests/Resources/cfdi40/cfdi40_01.xml'
+
+    def tearDown(self):
+        ErrorHelper.set_traceback_logging(True)
+
+    def __transform_broken(self, times:int) -> None:
+        sax_handler = CFDI33SAXHandler()
+        for _ in range(times):
+            with self.assertRaises(ValueError):
+                sax_handler.transform_from_file(self.BROKEN_PATH)
+
+    def test_log_exception(self):
+        with self.assertLogs('CFDI33SAXHandler', level='ERROR') as logs:
+            self.__transform_broken(3)
+        self.assertEqual(len(logs.records), 3)
+        self.assertIsNotNone(logs.records[0].exc_info)
+
+    def test_disable_traceback_logging(self):
+        ErrorHelper.set_traceback_logging(False)
+        self.assertTupleEqual(ErrorHelper.get_traceback_logging(), (False, None))
+        with mock.patch('logging.Logger.exception') as log_exception:
+            self.__transform_broken(3)
+        log_exception.assert_not_called()
+
+    def test_rate_limit(self):
+        ErrorHelper.set_traceback_logging(True, 2)
+        with self.assertLogs('CFDI33SAXHandler', level='ERROR') as logs:
+            self.__transform_broken(5)
+        self.assertEqual(len(logs.records), 2)
+
+    def test_get_error_record(self):
+        self.assertDictEqual(ErrorHelper.get_error_record('a.xml', FileNotFoundError('not found')), {'path': 'a.xml', 'error': 'FileNotFoundError', 'message': 'not found', 'phase': 'read'})
+        try:
+            etree.XML(b'<cfdi:Comprobante')
+        except etree.XMLSyntaxError as ex:
+            self.assertEqual(ErrorHelper.get_error_record('a.xml', ex)['phase'], 'parse')
+        self.assertEqual(ErrorHelper.get_error_record('a.xml', ValueError('bad version'))['phase'], 'transform')
+
+    def test_get_error_record_truncated_gzip(self):
+        with open('./tests/Resources/cfdi40/cfdi40_01.xml', 'rb') as file:
+            compressed = gzip.compress(file.read())
+        directory = tempfile.mkdtemp()
+        try:
+            truncated_path = os.path.join(directory, 'truncated.xml.gz')
+            with open(truncated_path, 'wb') as file:
+                file.write(compressed[:len(compressed) // 2])
+            corrupt_path = os.path.join(directory, 'corrupt.xml.gz')
+            with open(corrupt_path, 'wb') as file:
+                file.write(compressed[:20] + b'\xff' * 30 + compressed[50:])
+            sax_handler = CFDIAutoSAXHandler()
+            for path, error in ((truncated_path, 'EOFError'), (corrupt_path, 'error')):
+                with self.assertRaises(Exception) as context:
+                    sax_handler.transform(path)
+                record = ErrorHelper.get_error_record(path, context.exception)
+                self.assertEqual(record['error'], error)
+                self.assertEqual(record['phase'], 'read')
+        finally:
+            shutil.rmtree(directory)
+
+    def test_get_exception(self):
+        ex = ErrorHelper.get_exception(ErrorHelper.get_error_record('a.xml', FileNotFoundError('not found')))
+        self.assertIsInstance(ex, FileNotFoundError)
+        self.assertEqual(str(ex), 'not found')
+        ex = ErrorHelper.get_exception({'path': 'a.xml', 'error': 'DocumentInvalid', 'message': 'Element missing', 'phase': 'validation'})
+        self.assertIsInstance(ex, TransformError)
+        self.assertEqual(str(ex), 'DocumentInvalid: Element missing')
+        self.assertEqual(ex.record['phase'], 'validation')
+
+    def test_traceback_logging_benchmark(self):
+        # Logged tracebacks go to the last resort handler of logging, that prints them to stderr
+        with mock.patch('sys.stderr'):
+            start_time = time.time()
+            self.__transform_broken(300)
+            logging_time = time.time() - start_time
+        ErrorHelper.set_traceback_logging(False)
+        start_time = time.time()
+        self.__transform_broken(300)
+        quiet_time = time.time() - start_time
+        self.assertLessEqual(quiet_time, logging_time, 'Too much time to transform broken documents without logging')
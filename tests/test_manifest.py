@@ -0,0 +1,96 @@
+from pycfdi_transform import DirectorySource, Manifest, transform_many
+from unittest import mock
+import gzip
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+class TestManifest(unittest.TestCase):
+    PATHS = [
+        './tests/Resources/cfdi33/cfdi33_01.xml',
+        './tests/Resources/cfdi40/cfdi40_01.xml',
+        './tests/Resources/nomina12/nomina12_01.xml',
+        './tests/Resources/implocal/cfdi40_01_implocal.xml'
+    ]
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.corpus = os.path.join(self.directory, 'corpus')
+        os.makedirs(self.corpus)
+        self.files = []
+        for index in range(40):
+            path = os.path.join(self.corpus, f'{index:04d}.xml')
+            shutil.copyfile(self.PATHS[index % len(self.PATHS)], path)
+            self.files.append(path)
+        self.manifest_path = os.path.join(self.directory, 'manifest.sqlite')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def __run(self, checkpoint_size:int = Manifest.CHECKPOINT_SIZE) -> list:
+        with Manifest(self.manifest_path, checkpoint_size) as manifest:
+            processed = []
+            for path, cfdi_data, digest in transform_many(manifest.filter_changed(sorted(DirectorySource(self.corpus))), workers=2, errors='record', hashes=True):
+                if manifest.record(path, cfdi_data, digest):
+                    processed.append(path)
+        return processed
+
+    def test_skip_unchanged(self):
+        self.assertListEqual(self.__run(), self.files)
+        self.assertListEqual(self.__run(), [])
+        with Manifest(self.manifest_path) as manifest:
+            record = manifest.get(self.files[1])
+            self.assertEqual(record['uuid'], '9D81C696-0401-4F85-B703-6E0D3AFD6056')
+            self.assertEqual(record['size'], os.path.getsize(self.files[1]))
+            self.assertEqual(record['hash'], Manifest.get_hash(self.files[1]))
+            self.assertIsNone(manifest.get(os.path.join(self.corpus, 'not_found.xml')))
+
+    def test_modified_files(self):
+        self.__run()
+        # Same size and content with a new modification time is not transformed again
+        stat = os.stat(self.files[0])
+        os.utime(self.files[0], ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        shutil.copyfile(self.PATHS[1], self.files[2])
+        shutil.copyfile(self.PATHS[0], os.path.join(self.corpus, 'new.xml'))
+        self.assertListEqual(self.__run(), [self.files[2], os.path.join(self.corpus, 'new.xml')])
+        with Manifest(self.manifest_path) as manifest:
+            self.assertEqual(manifest.get(self.files[0])['mtime_ns'], stat.st_mtime_ns + 10 ** 9)
+            self.assertEqual(manifest.get(self.files[2])['uuid'], '9D81C696-0401-4F85-B703-6E0D3AFD6056')
+
+    def test_errors_not_recorded(self):
+        with open(os.path.join(self.corpus, 'broken.xml'), 'w') as file:
+            file.write('not a CFDI')
+        self.assertEqual(len(self.__run()), 41)
+        self.assertListEqual(self.__run(), [os.path.join(self.corpus, 'broken.xml')])
+
+    def test_hash_in_workers(self):
+        gzip_path = os.path.join(self.corpus, 'compressed.xml.gz')
+        with open(self.PATHS[0], 'rb') as file, gzip.open(gzip_path, 'wb') as gzip_file:
+            gzip_file.write(file.read())
+        with Manifest(self.manifest_path) as manifest, mock.patch.object(Manifest, 'get_hash', wraps=Manifest.get_hash) as get_hash:
+            paths = list(manifest.filter_changed(sorted(DirectorySource(self.corpus))))
+            # Files are only hashed by the workers
+            self.assertEqual(get_hash.call_count, 0)
+            results = list(transform_many(paths, threads=True, hashes=True))
+        self.assertListEqual([result[0] for result in results], paths)
+        for path, _, digest in results:
+            self.assertEqual(digest, Manifest.get_hash(path))
+
+    def test_resume_after_crash(self):
+        manifest = Manifest(self.manifest_path, 10)
+        for path, cfdi_data in transform_many(manifest.filter_changed(self.files[:25]), workers=1):
+            manifest.record(path, cfdi_data)
+        # Crash before closing, only the records of the last checkpoint are kept
+        manifest._connection.close()
+        self.assertListEqual(self.__run(), self.files[20:])
+
+    def test_manifest_benchmark(self):
+        start_time = time.time()
+        self.__run()
+        full_time = time.time() - start_time
+        start_time = time.time()
+        self.__run()
+        incremental_time = time.time() - start_time
+        self.assertLessEqual(incremental_time, full_time, 'Too much time to skip unchanged documents')
@@ -1,6 +1,10 @@
 from pycfdi_transform import CFDI33SAXHandler, SchemaHelper
 from lxml import etree
+from unittest import mock
 import unittest
+import copy
+import time
+import io
 
 class TestNomina12SAXHandler(unittest.TestCase):
     def test_transform_file_complete_nom(self):
@@ -2364,4 +2368,60 @@ class TestNomina12SAXHandler(unittest.TestCase):
         with self.assertRaises(etree.DocumentInvalid) as context:
             sax_handler.transform_from_file("./tests/Resources/nomina12/broken_nomina12_01.xml")
         exception = context.exception
-        self.assertIn("Element '{http://www.sat.gob.mx/nomina12}Receptor': This element is not expected. Expected is ( {http://www.sat.gob.mx/nomina12}EntidadSNCF )., line 1", str(exception), 'Not expected error message')
\ No newline at end of file
+        self.assertIn("Element '{http://www.sat.gob.mx/nomina12}Receptor': This element is not expected. Expected is ( {http://www.sat.gob.mx/nomina12}EntidadSNCF )., line 1", str(exception), 'Not expected error message')
+    
+    def test_transform_file_single_parse(self):
+        sax_handler = CFDI33SAXHandler().use_nomina12()
+        with mock.patch('lxml.etree.XML', wraps=etree.XML) as xml_parse, mock.patch('lxml.etree.parse', wraps=etree.parse) as file_parse:
+            cfdi_data = sax_handler.transform_from_file("./tests/Resources/nomina12/double_nomina01.xml")
+        self.assertEqual(xml_parse.call_count + file_parse.call_count, 1, 'Complements must not be parsed again')
+        self.assertEqual(len(cfdi_data['nomina12']), 2)
+        self.assertEqual(len(cfdi_data['tfd11']), 1)
+    
+    def test_transform_from_element_nomina_benchmark(self):
+        sax_handler = CFDI33SAXHandler().use_nomina12()
+        start_time = time.time()
+        for _ in range(200):
+            sax_handler.transform_from_file("./tests/Resources/nomina12/nom_complete.xml")
+        total_seconds = time.time() - start_time
+        self.assertLessEqual(total_seconds, 1.0, 'Too much time to transform nomina complements')
+
+    
+    def test_transform_scaled_nom_benchmark(self):
+        tree = etree.parse("./tests/Resources/nomina12/nom_complete.xml")
+        namespaces = {'nomina12': 'http://www.sat.gob.mx/nomina12'}
+        percepciones = tree.find('.//nomina12:Percepciones', namespaces)
+        deducciones = tree.find('.//nomina12:Deducciones', namespaces)
+        percepcion = percepciones.find('nomina12:Percepcion', namespaces)
+        deduccion = deducciones.find('nomina12:Deduccion', namespaces)
+        for _ in range(5000):
+            percepciones.append(copy.deepcopy(percepcion))
+            deducciones.append(copy.deepcopy(deduccion))
+        xml_bytes = etree.tostring(tree, encoding='utf-8', xml_declaration=True)
+        sax_handler = CFDI33SAXHandler().use_nomina12()
+        start_time = time.time()
+        cfdi_data = sax_handler.transform_from_bytes(xml_bytes)
+        total_seconds = time.time() - start_time
+        self.assertLessEqual(total_seconds, 0.5, 'Too much time to transform scaled nomina')
+        self.assertGreater(len(cfdi_data['nomina12'][0]['percepciones']['percepcion']), 5000)
+        self.assertGreater(len(cfdi_data['nomina12'][0]['deducciones']['deduccion']), 5000)
+    
+    def test_transform_from_stream(self):
+        sax_handler = CFDI33SAXHandler().use_nomina12()
+        for path in ["./tests/Resources/nomina12/nom_complete.xml", "./tests/Resources/nomina12/double_nomina01.xml", "./tests/Resources/nomina12/double_breaks_nomina01.xml"]:
+            expected_dict = sax_handler.transform_from_file(path)
+            self.assertDictEqual(sax_handler.transform_from_stream(path), expected_dict)
+    
+    def test_transform_from_stream_scaled_nom(self):
+        tree = etree.parse("./tests/Resources/nomina12/nom_complete.xml")
+        namespaces = {'nomina12': 'http://www.sat.gob.mx/nomina12'}
+        percepciones = tree.find('.//nomina12:Percepciones', namespaces)
+        percepcion = percepciones.find('nomina12:Percepcion', namespaces)
+        for _ in range(5000):
+            percepciones.append(copy.deepcopy(percepcion))
+        xml_bytes = etree.tostring(tree, encoding='utf-8', xml_declaration=True)
+        sax_handler = CFDI33SAXHandler().use_nomina12()
+        expected_dict = sax_handler.transform_from_bytes(xml_bytes)
+        cfdi_data = sax_handler.transform_from_stream(io.BytesIO(xml_bytes))
+        self.assertDictEqual(cfdi_data, expected_dict)
+        self.assertGreater(len(cfdi_data['nomina12'][0]['percepciones']['percepcion']), 5000)
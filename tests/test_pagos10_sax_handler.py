@@ -786,4 +786,10 @@ class TestPagos10SAXHandler(unittest.TestCase):
                 }
             ]
         }
-        self.assertDictEqual(cfdi_data, expected_dict)
\ No newline at end of file
+        self.assertDictEqual(cfdi_data, expected_dict)
+    
+    def test_transform_from_stream(self):
+        sax_handler = CFDI33SAXHandler().use_pagos10()
+        for path in ["./tests/Resources/pagos10/pago_complete.xml", "./tests/Resources/pagos10/pago10_01.xml", "./tests/Resources/pagos10/pago10NonDr.xml", "./tests/Resources/pagos10/pago10_multiple_tfd.xml"]:
+            expected_dict = sax_handler.transform_from_file(path)
+            self.assertDictEqual(sax_handler.transform_from_stream(path), expected_dict)
@@ -0,0 +1,96 @@
+from pycfdi_transform import CFDI33SAXHandler, ParserHelper
+from concurrent.futures import ThreadPoolExecutor
+from lxml import etree
+from unittest import mock
+import unittest
+import time
+
+class TestParserHelper(unittest.TestCase):
+    def tearDown(self):
+        ParserHelper.set_cache_enabled(True)
+
+    def test_same_parser_same_options(self):
+        parser = ParserHelper.get_parser(encoding='utf-8', recover=True)
+        self.assertIs(parser, ParserHelper.get_parser(recover=True, encoding='utf-8'))
+        self.assertIsNot(parser, ParserHelper.get_parser(recover=True))
+
+    def test_parser_per_thread(self):
+        parser = ParserHelper.get_parser(recover=True)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            thread_parser = executor.submit(ParserHelper.get_parser, recover=True).result()
+        self.assertIsNot(parser, thread_parser)
+
+    def test_cache_disabled(self):
+        ParserHelper.set_cache_enabled(False)
+        self.assertFalse(ParserHelper.is_cache_enabled())
+        self.assertIsNot(ParserHelper.get_parser(recover=True), ParserHelper.get_parser(recover=True))
+
+    def test_transform_cache_disabled(self):
+        sax_handler = CFDI33SAXHandler()
+        expected_dict = sax_handler.transform_from_file('./tests/Resources/cfdi33/cfdi33_01.xml')
+        ParserHelper.set_cache_enabled(False)
+        self.assertDictEqual(sax_handler.transform_from_file('./tests/Resources/cfdi33/cfdi33_01.xml'), expected_dict)
+
+    def test_parser_cache_per_document_overhead(self):
+        with open('./tests/Resources/cfdi33/cfdi33_01.xml', 'rb') as file:
+            xml_bytes = file.read()
+        sax_handler = CFDI33SAXHandler()
+        timings = {}
+        parsers_built = {}
+        for enabled in (False, True):
+            ParserHelper.set_cache_enabled(enabled)
+            with mock.patch.object(etree, 'XMLParser', wraps=etree.XMLParser) as xml_parser:
+                start_time = time.time()
+                for _ in range(2000):
+                    sax_handler.transform_from_bytes(xml_bytes)
+                timings[enabled] = (time.time() - start_time) / 2000
+            parsers_built[enabled] = xml_parser.call_count
+        self.assertGreaterEqual(parsers_built[False], 2000)
+        self.assertLessEqual(parsers_built[True], 1, 'The cached parser is not reused between documents')
+        self.assertLessEqual(timings[True], 0.001, 'Too much time per document with parser cache')
+        self.assertLessEqual(timings[False], 0.001, 'Too much time per document without parser cache')
+
+    def test_parse_strict(self):
+        with open('./tests/Resources/cfdi33/cfdi33_01.xml', 'rb') as file:
+            xml_bytes = file.read()
+        tree, recovered = ParserHelper.parse_xml(xml_bytes, True)
+        self.assertFalse(recovered)
+        self.assertEqual(tree.get('Version'), '3.3')
+        tree, recovered = ParserHelper.parse_file('./tests/Resources/nomina12/double_breaks_nomina01.xml', True)
+        self.assertTrue(recovered)
+        self.assertEqual(tree.get('Version'), '3.3')
+        tree, recovered = ParserHelper.parse_file('./tests/Resources/nomina12/double_breaks_nomina01.xml')
+        self.assertFalse(recovered)
+
+    def test_transform_strict_parse(self):
+        sax_handler = CFDI33SAXHandler().use_nomina12()
+        expected_dict = sax_handler.transform_from_file('./tests/Resources/nomina12/double_breaks_nomina01.xml')
+        self.assertFalse(sax_handler.recovered)
+        sax_handler = CFDI33SAXHandler().use_nomina12().use_strict_parse()
+        self.assertDictEqual(sax_handler.transform_from_file('./tests/Resources/nomina12/double_breaks_nomina01.xml'), expected_dict)
+        self.assertTrue(sax_handler.recovered)
+        sax_handler.transform_from_file('./tests/Resources/nomina12/nom_complete.xml')
+        self.assertFalse(sax_handler.recovered)
+        with open('./tests/Resources/cfdi33/cfdi33_bad_structure_01.xml', 'r', encoding='utf-8') as file:
+            sax_handler.transform_from_string(file.read())
+        self.assertTrue(sax_handler.recovered)
+        self.assertEqual(sax_handler.recovered_count, 2)
+
+    def test_transform_stream_strict_parse(self):
+        path = './tests/Resources/nomina12/double_breaks_nomina01.xml'
+        expected_dict = CFDI33SAXHandler().use_nomina12().transform_from_file(path)
+        sax_handler = CFDI33SAXHandler().use_nomina12()
+        self.assertDictEqual(sax_handler.transform_from_stream(path), expected_dict)
+        self.assertFalse(sax_handler.recovered)
+        sax_handler.use_strict_parse()
+        self.assertDictEqual(sax_handler.transform_from_stream(path), expected_dict)
+        self.assertTrue(sax_handler.recovered)
+        with open(path, 'rb') as file:
+            self.assertDictEqual(sax_handler.transform_from_stream(file), expected_dict)
+        self.assertTrue(sax_handler.recovered)
+        self.assertEqual(sax_handler.recovered_count, 2)
+        with open(path, 'rb') as file:
+            # A stream that can not be read again is not recovered
+            stream = mock.Mock(spec=['read'], read=file.read)
+            with self.assertRaises(etree.XMLSyntaxError):
+                sax_handler.transform_from_stream(stream)
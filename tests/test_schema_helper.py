@@ -0,0 +1,57 @@
+from pycfdi_transform import SchemaHelper
+from concurrent.futures import ThreadPoolExecutor
+from lxml import etree
+from unittest import mock
+import unittest
+import tempfile
+import time
+import os
+
+class TestSchemaHelper(unittest.TestCase):
+    def setUp(self):
+        SchemaHelper.clear_cache()
+
+    def tearDown(self):
+        SchemaHelper.clear_cache()
+
+    def test_schema_path_not_cwd_relative(self):
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as directory:
+            os.chdir(directory)
+            try:
+                path = SchemaHelper.get_schema_path('implocal10')
+                schema = SchemaHelper.get_schema_validator('implocal10')
+            finally:
+                os.chdir(cwd)
+        self.assertTrue(os.path.isfile(path))
+        self.assertIsInstance(schema, etree.XMLSchema)
+        self.assertTrue(SchemaHelper.get_schema_path('cfdi33').endswith(os.path.join('xsd', 'cfdi33', 'cfdv33.xsd')))
+
+    def test_registered_schemas_in_package(self):
+        for name in SchemaHelper.SCHEMAS:
+            self.assertTrue(os.path.isfile(SchemaHelper.get_schema_path(name)), name)
+        self.assertNotIn('cfdi40', SchemaHelper.SCHEMAS)
+
+    def test_schema_not_found(self):
+        with self.assertRaises(FileNotFoundError):
+            SchemaHelper.get_schema_validator('complementos/not_found.xsd')
+
+    def test_schema_compiled_once(self):
+        with mock.patch('lxml.etree.XMLSchema', wraps=etree.XMLSchema) as xml_schema:
+            schema = SchemaHelper.get_schema_validator('complementos/detallista.xsd')
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                schemas = list(executor.map(SchemaHelper.get_schema_validator, ['complementos/detallista.xsd'] * 8))
+        self.assertEqual(xml_schema.call_count, 1)
+        for thread_schema in schemas:
+            self.assertIs(thread_schema, schema)
+
+    def test_schema_startup_cost(self):
+        start_time = time.time()
+        schema = SchemaHelper.get_schema_validator('complementos/Nomina12/catNomina.xsd')
+        compile_seconds = time.time() - start_time
+        start_time = time.time()
+        for _ in range(1000):
+            self.assertIs(SchemaHelper.get_schema_validator('complementos/Nomina12/catNomina.xsd'), schema)
+        cached_seconds = (time.time() - start_time) / 1000
+        self.assertLessEqual(compile_seconds, 0.5, 'Too much time to compile xsd')
+        self.assertLessEqual(cached_seconds, 0.0001, 'Too much time to get compiled xsd')
@@ -0,0 +1,47 @@
+from pycfdi_transform import CFDIAutoSAXHandler, TarSource, transform_many
+import os
+import shutil
+import tarfile
+import tempfile
+import unittest
+
+class TestTarSource(unittest.TestCase):
+    PATHS = [
+        './tests/Resources/cfdi33/cfdi33_01.xml',
+        './tests/Resources/cfdi40/cfdi40_01.xml',
+        './tests/Resources/nomina12/nomina12_01.xml',
+        './tests/Resources/implocal/cfdi40_01_implocal.xml'
+    ]
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def __create_tar(self, mode:str, extension:str) -> str:
+        tar_path = os.path.join(self.directory, 'cfdis' + extension)
+        with tarfile.open(tar_path, mode) as tar_file:
+            for index in range(40):
+                path = self.PATHS[index % len(self.PATHS)]
+                tar_file.add(path, f'{index:04d}/{os.path.basename(path)}')
+            tar_file.add('./tests/Resources/cfdi33', 'cfdi33', recursive=False)
+        return tar_path
+
+    def __get_expected(self, sax_handler:CFDIAutoSAXHandler) -> list:
+        return [(f'{index:04d}/{os.path.basename(path)}', sax_handler.transform(path)) for index, path in ((index, self.PATHS[index % len(self.PATHS)]) for index in range(40))]
+
+    def test_transform(self):
+        sax_handler = CFDIAutoSAXHandler().use_nomina12().use_implocal10()
+        expected = self.__get_expected(sax_handler)
+        for mode, extension in (('w', '.tar'), ('w:gz', '.tar.gz'), ('w:bz2', '.tar.bz2'), ('w:xz', '.tar.xz')):
+            tar_path = self.__create_tar(mode, extension)
+            self.assertListEqual(list(TarSource(tar_path).transform(sax_handler)), expected)
+            with open(tar_path, 'rb') as file:
+                self.assertEqual(len(list(TarSource(file))), 40)
+
+    def test_transform_many(self):
+        handler_config = {'nomina12': True, 'implocal10': True}
+        expected = self.__get_expected(CFDIAutoSAXHandler.from_config(handler_config))
+        tar_path = self.__create_tar('w:xz', '.tar.xz')
+        self.assertListEqual(list(transform_many(TarSource(tar_path), workers=2, handler_config=handler_config)), expected)
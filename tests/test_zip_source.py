@@ -0,0 +1,65 @@
+from pycfdi_transform import CFDIAutoSAXHandler, ZipSource, transform_many
+import io
+import os
+import shutil
+import tempfile
+import time
+import unittest
+import zipfile
+
+class TestZipSource(unittest.TestCase):
+    PATHS = [
+        './tests/Resources/cfdi33/cfdi33_01.xml',
+        './tests/Resources/cfdi40/cfdi40_01.xml',
+        './tests/Resources/nomina12/nomina12_01.xml',
+        './tests/Resources/implocal/cfdi40_01_implocal.xml'
+    ]
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.zip_path = os.path.join(self.directory, 'descarga.zip')
+        with zipfile.ZipFile(self.zip_path, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+            for index in range(200):
+                path = self.PATHS[index % len(self.PATHS)]
+                zip_file.write(path, f'{index:04d}_{os.path.basename(path)}')
+            zip_file.writestr('LEEME.txt', 'not a CFDI')
+            zip_file.writestr('folder/', '')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def __get_expected(self, sax_handler:CFDIAutoSAXHandler) -> list:
+        return [(f'{index:04d}_{os.path.basename(path)}', sax_handler.transform(path)) for index, path in ((index, self.PATHS[index % len(self.PATHS)]) for index in range(200))]
+
+    def test_iter_members(self):
+        members = list(ZipSource(self.zip_path))
+        self.assertEqual(len(members), 200)
+        with open(self.PATHS[0], 'rb') as file:
+            self.assertEqual(members[0], ('0000_cfdi33_01.xml', file.read()))
+        with open(self.zip_path, 'rb') as file:
+            self.assertEqual(len(list(ZipSource(io.BytesIO(file.read())))), 200)
+        self.assertListEqual([name for name, _ in ZipSource(self.zip_path, '.TXT')], ['LEEME.txt'])
+
+    def test_transform(self):
+        sax_handler = CFDIAutoSAXHandler().use_nomina12().use_implocal10()
+        self.assertListEqual(list(ZipSource(self.zip_path).transform(sax_handler)), self.__get_expected(sax_handler))
+
+    def test_transform_many(self):
+        handler_config = {'nomina12': True, 'implocal10': True}
+        expected = self.__get_expected(CFDIAutoSAXHandler.from_config(handler_config))
+        self.assertListEqual(list(transform_many(ZipSource(self.zip_path), workers=2, handler_config=handler_config)), expected)
+        self.assertListEqual(list(transform_many(ZipSource(self.zip_path), workers=2, handler_config=handler_config, threads=True)), expected)
+
+    def test_zip_source_benchmark(self):
+        sax_handler = CFDIAutoSAXHandler().use_nomina12().use_implocal10()
+        start_time = time.time()
+        zip_results = list(ZipSource(self.zip_path).transform(sax_handler))
+        zip_time = time.time() - start_time
+        start_time = time.time()
+        extract_directory = os.path.join(self.directory, 'extract')
+        with zipfile.ZipFile(self.zip_path) as zip_file:
+            zip_file.extractall(extract_directory)
+        extract_results = [(name, sax_handler.transform_from_file(os.path.join(extract_directory, name))) for name in sorted(os.listdir(extract_directory)) if name.endswith('.xml')]
+        extract_time = time.time() - start_time
+        self.assertListEqual(zip_results, extract_results)
+        self.assertLessEqual(zip_time, extract_time, 'Reading the ZIP members is slower than extracting them')